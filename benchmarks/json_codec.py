@@ -0,0 +1,93 @@
+"""Compare JSON codecs on insert_many payloads and cursor batch decoding.
+
+The benchmark runs offline: it times the work pyC8 does client-side when
+building an ``insert_many`` request and when decoding a cursor batch, without
+sending anything over the network.
+
+Usage::
+
+    python benchmarks/json_codec.py [--documents 10000] [--repeat 20]
+"""
+from __future__ import absolute_import, unicode_literals
+
+import argparse
+import json
+import sys
+import timeit
+
+from c8.codec import get_codec, set_default_codec
+from c8.request import Request
+from c8.response import Response
+
+
+def make_documents(count):
+    return [
+        {
+            "_key": str(i),
+            "name": "user-{}".format(i),
+            "email": "user-{}@example.com".format(i),
+            "age": i % 90,
+            "score": i * 0.5,
+            "active": i % 2 == 0,
+            "tags": ["a", "b", "c"],
+            "address": {"city": "San Francisco", "zip": "94105"},
+        }
+        for i in range(count)
+    ]
+
+
+def bench_insert_many(documents):
+    Request(method="post", endpoint="/document/users", data=documents)
+
+
+def bench_cursor_batch(raw_body):
+    resp = Response(
+        method="put",
+        url="/cursor/1",
+        headers={},
+        status_code=200,
+        status_text="OK",
+        raw_body=raw_body,
+    )
+    return resp.body["result"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    raw_body = json.dumps(
+        {"id": "1", "hasMore": False, "result": documents}
+    ).encode("utf-8")
+
+    codecs = ["json"]
+    try:
+        get_codec("orjson")
+        codecs.append("orjson")
+    except ImportError:
+        sys.stdout.write(
+            "orjson is not installed, only the standard library is timed.\n"
+        )
+
+    sys.stdout.write(
+        "{:<8} {:>22} {:>22}\n".format("codec", "insert_many (ms)", "cursor batch (ms)")
+    )
+    for name in codecs:
+        set_default_codec(name)
+        encode = timeit.timeit(
+            lambda: bench_insert_many(documents), number=args.repeat
+        )
+        decode = timeit.timeit(lambda: bench_cursor_batch(raw_body), number=args.repeat)
+        sys.stdout.write(
+            "{:<8} {:>22.2f} {:>22.2f}\n".format(
+                name, encode * 1000 / args.repeat, decode * 1000 / args.repeat
+            )
+        )
+    set_default_codec("json")
+
+
+if __name__ == "__main__":
+    main()
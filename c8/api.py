@@ -79,6 +79,24 @@ class APIWrapper(object):
         """
         return self._executor.context
 
+    def _check_sync_context(self, operation):
+        """Check that response handlers receive the response as it is sent.
+
+        In the other execution contexts (e.g. batch or asyncio), the response
+        is deferred, so handlers cannot send follow-up requests such as reading
+        the next batches of a cursor.
+
+        :param operation: Operation name, for the error message.
+        :type operation: str | unicode
+        :raise ValueError: If the execution context defers responses.
+        """
+        if self.context not in ("default", "concurrent", "write_behind"):
+            raise ValueError(
+                "{} requires the default execution context, got {}".format(
+                    operation, self.context
+                )
+            )
+
     def _execute(self, request, response_handler, custom_prefix=None):
         """Execute an API per execution context.
 
@@ -0,0 +1,260 @@
+from __future__ import absolute_import, unicode_literals
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+from six import string_types
+
+from c8.codec import RAW_JSON_TYPES, dumps
+
+__all__ = ["BulkWriter"]
+
+
+class BulkWriter(object):
+    """Bulk writer which splits large writes into concurrent requests.
+
+    Documents are split into chunks of at most **batch_size** documents and
+    **max_bytes** serialized bytes, which are sent concurrently over the
+    connection pool. Results are merged back in input order, so the return
+    values are the same as those of the corresponding collection methods.
+
+    Input iterators (e.g. generators) are consumed lazily: at most twice
+    **max_workers** chunks are held in memory at any time.
+
+    If a chunk fails as a whole (e.g. server unavailable), the exception is
+    raised and chunks which have not been sent yet are dropped. Chunks which
+    were already sent are not rolled back.
+
+    :param collection: Standard collection using the default execution
+        context.
+    :type collection: c8.collection.StandardCollection
+    :param batch_size: Max number of documents per request.
+    :type batch_size: int
+    :param max_bytes: Max serialized size of a request body in bytes. A
+        single document larger than this is sent on its own.
+    :type max_bytes: int
+    :param max_workers: Max number of requests in flight. Should not exceed
+        the connection pool size of the HTTP client.
+    :type max_workers: int
+    """
+
+    def __init__(
+        self, collection, batch_size=1000, max_bytes=4 * 1024 * 1024, max_workers=4
+    ):
+        if collection.context != "default":
+            raise ValueError(
+                "bulk writes require the default execution context, "
+                "got {}".format(collection.context)
+            )
+        self._collection = collection
+        self._batch_size = batch_size
+        self._max_bytes = max_bytes
+        self._max_workers = max_workers
+
+    def __repr__(self):
+        return "<BulkWriter {}>".format(self._collection.name)
+
+    def _split(self, documents, encode):
+        """Split documents into chunks.
+
+        :param documents: Documents.
+        :type documents: iterable
+        :param encode: Function returning the item to send and its serialized
+            size for a document.
+        :type encode: callable
+        :returns: Chunks of items.
+        :rtype: generator
+        """
+        chunk = []
+        size = 0
+        for doc in documents:
+            item, item_size = encode(doc)
+            if chunk and (
+                len(chunk) >= self._batch_size or size + item_size > self._max_bytes
+            ):
+                yield chunk
+                chunk = []
+                size = 0
+            chunk.append(item)
+            size += item_size + 1
+        if chunk:
+            yield chunk
+
+    def _dispatch(self, method, chunks, **kwargs):
+        """Send the chunks concurrently and return the results in order.
+
+        :param method: Collection method called with each chunk.
+        :type method: callable
+        :param chunks: Chunks of documents.
+        :type chunks: iterable
+        :returns: Result of each chunk, in order.
+        :rtype: list
+        """
+        chunks = iter(chunks)
+        for first in chunks:
+            chunks = chain([first], chunks)
+            break
+        else:
+            # Nothing to split, let the server answer as for an empty write.
+            return [method([], **kwargs)]
+
+        results = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            try:
+                for chunk in chunks:
+                    if len(pending) >= self._max_workers * 2:
+                        results.append(pending.popleft().result())
+                    pending.append(pool.submit(method, chunk, **kwargs))
+                while pending:
+                    results.append(pending.popleft().result())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return results
+
+    @staticmethod
+    def _merge_lists(results):
+        """Merge per-chunk document results.
+
+        :param results: Result of each chunk.
+        :type results: [[dict | C8Error] | bool]
+        :returns: Merged results, or True if writes were silent.
+        :rtype: [dict | C8Error] | bool
+        """
+        if all(result is True for result in results):
+            return True
+        return [item for result in results for item in result]
+
+    def _encoder(self, normalize, keys=False):
+        """Return an encoder serializing documents once, ahead of sending.
+
+        The encoded documents are spliced into the request body as they are,
+        so their size is known without encoding them again.
+
+        :param normalize: Function applied to each (non pre-encoded) document.
+        :type normalize: callable
+        :param keys: If set to True, strings are document IDs or keys rather
+            than JSON documents.
+        :type keys: bool
+        :returns: Encoder.
+        :rtype: callable
+        """
+
+        def encode(doc):
+            if isinstance(doc, string_types) and not keys:
+                doc = doc.encode("utf-8")
+            elif not isinstance(doc, RAW_JSON_TYPES):
+                doc = dumps(normalize(doc)).encode("utf-8")
+            return doc, len(doc)
+
+        return encode
+
+    def insert_many(self, documents, **kwargs):
+        """Insert multiple documents.
+
+        Accepts the same arguments as
+        :func:`c8.collection.StandardCollection.insert_many`.
+
+        :param documents: New documents, or JSON documents given as bytes-like
+            objects or strings.
+        :type documents: iterable
+        :returns: List of document metadata (e.g. document keys, revisions) and
+            any exception, or True if parameter **silent** was set to True.
+        :rtype: [dict | C8Error] | bool
+        :raise c8.exceptions.DocumentInsertError: If a request fails.
+        """
+        col = self._collection
+        if isinstance(documents, RAW_JSON_TYPES):
+            return col.insert_many(documents, **kwargs)
+        chunks = self._split(documents, self._encoder(col._ensure_key_from_id))
+        return self._merge_lists(self._dispatch(col.insert_many, chunks, **kwargs))
+
+    def update_many(self, documents, **kwargs):
+        """Update multiple documents.
+
+        Accepts the same arguments as
+        :func:`c8.collection.StandardCollection.update_many`.
+
+        :param documents: Partial or full documents with the updated values.
+        :type documents: iterable
+        :returns: List of document metadata (e.g. document keys, revisions) and
+            any exceptions, or True if parameter **silent** was set to True.
+        :rtype: [dict | C8Error] | bool
+        :raise c8.exceptions.DocumentUpdateError: If a request fails.
+        """
+        col = self._collection
+        chunks = self._split(documents, self._encoder(col._ensure_key_in_body))
+        return self._merge_lists(self._dispatch(col.update_many, chunks, **kwargs))
+
+    def replace_many(self, documents, **kwargs):
+        """Replace multiple documents.
+
+        Accepts the same arguments as
+        :func:`c8.collection.StandardCollection.replace_many`.
+
+        :param documents: New documents, or JSON documents given as bytes-like
+            objects or strings.
+        :type documents: iterable
+        :returns: List of document metadata (e.g. document keys, revisions) and
+            any exceptions, or True if parameter **silent** was set to True.
+        :rtype: [dict | C8Error] | bool
+        :raise c8.exceptions.DocumentReplaceError: If a request fails.
+        """
+        col = self._collection
+        if isinstance(documents, RAW_JSON_TYPES):
+            return col.replace_many(documents, **kwargs)
+        chunks = self._split(documents, self._encoder(col._ensure_key_in_body))
+        return self._merge_lists(self._dispatch(col.replace_many, chunks, **kwargs))
+
+    def delete_many(self, documents, **kwargs):
+        """Delete multiple documents.
+
+        Accepts the same arguments as
+        :func:`c8.collection.StandardCollection.delete_many`.
+
+        :param documents: Document IDs, keys or bodies.
+        :type documents: iterable
+        :returns: List of document metadata (e.g. document keys, revisions) and
+            any exceptions, or True if parameter **silent** was set to True.
+        :rtype: [dict | C8Error] | bool
+        :raise c8.exceptions.DocumentDeleteError: If a request fails.
+        """
+        col = self._collection
+
+        def normalize(doc):
+            return col._ensure_key_in_body(doc) if isinstance(doc, dict) else doc
+
+        chunks = self._split(documents, self._encoder(normalize, keys=True))
+        return self._merge_lists(self._dispatch(col.delete_many, chunks, **kwargs))
+
+    def import_bulk(self, documents, **kwargs):
+        """Import multiple documents.
+
+        Accepts the same arguments as
+        :func:`c8.collection.StandardCollection.import_bulk`.
+
+        :param documents: New documents, or JSON documents given as bytes-like
+            objects or strings.
+        :type documents: iterable
+        :returns: Result of the bulk import, with the counters summed and the
+            details concatenated over all requests.
+        :rtype: dict
+        :raise c8.exceptions.DocumentInsertError: If a request fails.
+        """
+        col = self._collection
+        if isinstance(documents, RAW_JSON_TYPES):
+            return col.import_bulk(documents, **kwargs)
+        chunks = self._split(documents, self._encoder(col._ensure_key_from_id))
+        merged = {}
+        for result in self._dispatch(col.import_bulk, chunks, **kwargs):
+            for field, value in result.items():
+                if isinstance(value, bool):
+                    merged[field] = merged.get(field, False) or value
+                elif isinstance(value, (int, list)) and field in merged:
+                    merged[field] = merged[field] + value
+                else:
+                    merged[field] = value
+        return merged
@@ -1,8 +1,9 @@
 from __future__ import absolute_import, unicode_literals
 
-from json import dumps
+import re
 
 from c8.api import APIWrapper
+from c8.codec import dumps
 from c8.cursor import Cursor
 from c8.exceptions import (
     C8QLGetAllBatchesError,
@@ -16,7 +17,33 @@ from c8.exceptions import (
 from c8.request import Request
 from c8.utils import clean_doc
 
-__all__ = ["C8QL"]
+__all__ = ["C8QL", "C8QLQueryCache"]
+
+_WRITE_OPS = ["INSERT", "UPDATE", "REPLACE", "REMOVE", "UPSERT"]
+
+# String literals are kept as they are, whitespace elsewhere is collapsed.
+_QUERY_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|`[^`]*`)|\s+')
+
+
+def _is_write_query(query):
+    """Return True if the query may write.
+
+    :param query: C8QL query.
+    :type query: str | unicode
+    :rtype: bool
+    """
+    query = query.upper()
+    return any(op in query for op in _WRITE_OPS)
+
+
+def _normalize_query(query):
+    """Return the query with the whitespace outside of strings collapsed.
+
+    :param query: C8QL query.
+    :type query: str | unicode
+    :rtype: str | unicode
+    """
+    return _QUERY_TOKENS.sub(lambda m: m.group(1) or " ", query).strip()
 
 
 class C8QL(APIWrapper):
@@ -57,9 +84,7 @@ class C8QL(APIWrapper):
         :return: Query cache API wrapper.
         :rtype: c8.c8ql.C8QLQueryCache
         """
-        # TODO: Implement C8QLQueryCache
-        # return C8QLQueryCache(self._conn, self._executor)
-        pass
+        return C8QLQueryCache(self._conn, self._executor)
 
     def explain(self, query, all_plans=False, max_plans=None, opt_rules=None):
         """Inspect the query and return its metadata without executing it.
@@ -141,6 +166,7 @@ class C8QL(APIWrapper):
         skip_inaccessible_collections=None,
         stream=None,
         sql=False,
+        prefetch=0,
     ):
         """Execute the query and return the result cursor.
 
@@ -197,6 +223,10 @@ class C8QL(APIWrapper):
         :type stream: bool
         :param sql: Specify *true* and write sql query.
         :type sql: bool
+        :param prefetch: Max number of batches the cursor fetches ahead in a
+            background thread while the current batch is consumed. Set to 0
+            to fetch batches on demand. See :class:`c8.cursor.Cursor`.
+        :type prefetch: int
         :return: Result cursor.
         :rtype: c8.cursor.Cursor
         :raise c8.exceptions.C8QLQueryExecuteError: If execute fails.
@@ -254,7 +284,7 @@ class C8QL(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise C8QLQueryExecuteError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, prefetch=prefetch)
 
         return self._execute(request, response_handler)
 
@@ -355,6 +385,7 @@ class C8QL(APIWrapper):
 
          Note: Please make sure there is more than enough memory available on your system (RAM + Swap(if swap is enabled))
          to be able fetch total size of the documents to be returned. This will help avoid any Out-Of-Memory problems.
+         Use :func:`c8.c8ql.C8QL.iter_documents` to process the documents as they arrive instead.
 
         :param query: Query to execute
         :type query: str
@@ -367,17 +398,234 @@ class C8QL(APIWrapper):
         :rtype: dict | None
         :raise c8.exceptions.C8QLQueryExecuteError: If retrieval fails.
         """
-        write_ops = ["INSERT", "UPDATE", "REPLACE", "REMOVE", "UPSERT"]
-        if any(ele in query.upper() for ele in write_ops):
+        return list(
+            self.iter_documents(query, bind_vars=bind_vars, batch_size=batch_size)
+        )
+
+    def iter_batches(self, query, bind_vars=None, batch_size=1000, prefetch=0):
+        """Iterate over the results of a read-only query batch by batch.
+
+        System fields (other than "_key", "_from" and "_to") are stripped from
+        the documents. Only the batch being yielded is held in memory (plus any
+        prefetched batches). If the generator is closed before the result set
+        is depleted (e.g. on break), the server cursor is closed as well.
+
+        The query is checked when this method is called, and executed on the
+        first iteration.
+
+        :param query: Query to execute. Cannot contain the following keywords:
+            INSERT, UPDATE, REPLACE, REMOVE and UPSERT.
+        :type query: str | unicode
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
+        :param batch_size: Number of documents fetched in one round trip.
+        :type batch_size: int
+        :param prefetch: Max number of batches fetched ahead in the background.
+        :type prefetch: int
+        :returns: Generator of document batches.
+        :rtype: generator
+        :raise c8.exceptions.C8QLGetAllBatchesError: If the query writes.
+        :raise c8.exceptions.C8QLQueryExecuteError: If execute fails.
+        :raise c8.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        if _is_write_query(query):
             raise C8QLGetAllBatchesError(
                 "Write operations provided in the query. Only read operations can be provided"
             )
+        return self._iter_batches(query, bind_vars, batch_size, prefetch)
+
+    def _iter_batches(self, query, bind_vars, batch_size, prefetch):
+        """Yield the results of a read-only query batch by batch.
 
+        :returns: Generator of document batches.
+        :rtype: generator
+        """
         cursor = self.execute(
-            query=query, bind_vars=bind_vars, batch_size=batch_size, stream=True
+            query=query,
+            bind_vars=bind_vars,
+            batch_size=batch_size,
+            stream=True,
+            prefetch=prefetch,
         )
-        while cursor.has_more():
-            cursor.fetch()
+        try:
+            while True:
+                batch = cursor.batch()
+                if batch:
+                    docs = clean_doc(batch)
+                    batch.clear()
+                    yield docs
+                if not cursor.has_more():
+                    break
+                cursor.fetch()
+        finally:
+            if cursor.has_more():
+                cursor.close(ignore_missing=True)
+
+    def iter_documents(self, query, bind_vars=None, batch_size=1000, prefetch=0):
+        """Iterate over the results of a read-only query document by document.
+
+        See :func:`c8.c8ql.C8QL.iter_batches` for details.
+
+        :param query: Query to execute. Cannot contain the following keywords:
+            INSERT, UPDATE, REPLACE, REMOVE and UPSERT.
+        :type query: str | unicode
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
+        :param batch_size: Number of documents fetched in one round trip.
+        :type batch_size: int
+        :param prefetch: Max number of batches fetched ahead in the background.
+        :type prefetch: int
+        :returns: Generator of documents.
+        :rtype: generator
+        :raise c8.exceptions.C8QLGetAllBatchesError: If the query writes.
+        :raise c8.exceptions.C8QLQueryExecuteError: If execute fails.
+        :raise c8.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        batches = self.iter_batches(query, bind_vars, batch_size, prefetch)
+        return self._iter_documents(batches)
+
+    @staticmethod
+    def _iter_documents(batches):
+        """Yield the documents of batches, closing them when done.
+
+        :param batches: Generator of document batches.
+        :type batches: generator
+        :returns: Generator of documents.
+        :rtype: generator
+        """
+        try:
+            for batch in batches:
+                for doc in batch:
+                    yield doc
+        finally:
+            batches.close()
+
+
+class C8QLQueryCache(APIWrapper):
+    """Client-side query result cache API wrapper.
 
-        result = clean_doc(cursor.batch())
+    Results are kept in the :class:`c8.cache.QueryCache` of the connection,
+    shared by all the wrappers of a client. They are keyed by the query text
+    (with whitespace outside of strings collapsed), the bind variables and
+    the fabric.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param executor: API executor.
+    :type executor: c8.executor.Executor
+    """
+
+    def __init__(self, connection, executor):
+        super(C8QLQueryCache, self).__init__(connection, executor)
+
+    def __repr__(self):
+        return "<C8QLQueryCache in {}>".format(self._conn.fabric_name)
+
+    def execute(self, query, bind_vars=None, batch_size=1000):
+        """Return the result of a query, from the cache if possible.
+
+        Queries containing the following keywords are never cached: INSERT,
+        UPDATE, REPLACE, REMOVE and UPSERT. They are executed every time.
+
+        :param query: Query to execute.
+        :type query: str | unicode
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
+        :param batch_size: Number of documents fetched in one round trip on a
+            cache miss.
+        :type batch_size: int
+        :return: Query result.
+        :rtype: list
+        :raise ValueError: If not in the default execution context.
+        :raise c8.exceptions.C8QLQueryExecuteError: If execute fails.
+        :raise c8.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        if self.context != "default":
+            raise ValueError(
+                "query result caching requires the default execution context, "
+                "got {}".format(self.context)
+            )
+        c8ql = C8QL(self._conn, self._executor)
+        if _is_write_query(query):
+            return list(c8ql.execute(query, bind_vars=bind_vars, batch_size=batch_size))
+
+        cache = self._conn.query_cache
+        normalized = _normalize_query(query)
+        key = (
+            self._conn.tenant_name,
+            self._conn.fabric_name,
+            normalized,
+            dumps(sorted((bind_vars or {}).items())),
+        )
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+        result = list(c8ql.execute(query, bind_vars=bind_vars, batch_size=batch_size))
+        # Any name in the query may be a collection it reads.
+        collections = set(re.findall(r"\w[\w-]*", normalized))
+        collections.update(
+            value
+            for name, value in (bind_vars or {}).items()
+            if name.startswith("@") and isinstance(value, str)
+        )
+        cache.put(key, result, collections)
         return result
+
+    def properties(self):
+        """Return the cache limits and usage.
+
+        :return: Cache properties.
+        :rtype: dict
+        """
+        cache = self._conn.query_cache
+        return {
+            "max_entries": cache.max_entries,
+            "max_bytes": cache.max_bytes,
+            "ttl": cache.ttl,
+            "entries": len(cache),
+            "size": cache.size,
+            "hits": cache.hits,
+            "misses": cache.misses,
+        }
+
+    def configure(self, max_entries=None, max_bytes=None, ttl=None):
+        """Change the cache limits.
+
+        :param max_entries: Max number of cached results.
+        :type max_entries: int
+        :param max_bytes: Max total size of the cached results in bytes.
+        :type max_bytes: int
+        :param ttl: Seconds a result is reused.
+        :type ttl: int | float
+        :return: Updated cache properties.
+        :rtype: dict
+        """
+        self._conn.query_cache.configure(max_entries, max_bytes, ttl)
+        return self.properties()
+
+    def on_change(self, collection, doc_id, document):
+        """Apply a change received from a collection stream, so that the
+        cache can be kept up to date by :class:`c8.cache.CacheInvalidator`.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :param document: New version of the document.
+        :type document: dict | None
+        """
+        self._conn.query_cache.on_change(collection, doc_id, document)
+
+    def invalidate_collection(self, name):
+        """Remove the cached results of the queries which may read a
+        collection.
+
+        :param name: Collection name.
+        :type name: str | unicode
+        """
+        self._conn.query_cache.invalidate_collection(name)
+
+    def clear(self):
+        """Remove all cached results."""
+        self._conn.query_cache.clear()
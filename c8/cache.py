@@ -0,0 +1,766 @@
+from __future__ import absolute_import, unicode_literals
+
+import base64
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import websocket
+
+from c8.codec import dumps, loads
+
+__all__ = [
+    "DocumentCache",
+    "EvictionPolicy",
+    "LRUPolicy",
+    "FIFOPolicy",
+    "CacheInvalidator",
+    "MetadataCache",
+    "QueryCache",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class EvictionPolicy(object):
+    """Base class for cache eviction policies.
+
+    A policy tracks the keys of the cache entries and picks the entry to
+    evict when the cache is full. Calls are serialized by the cache.
+    """
+
+    def add(self, key):  # pragma: no cover
+        """Track a new entry.
+
+        :param key: Entry key.
+        :type key: str | unicode
+        """
+        raise NotImplementedError
+
+    def touch(self, key):  # pragma: no cover
+        """Record a cache hit on an entry.
+
+        :param key: Entry key.
+        :type key: str | unicode
+        """
+        raise NotImplementedError
+
+    def remove(self, key):  # pragma: no cover
+        """Stop tracking an entry.
+
+        :param key: Entry key.
+        :type key: str | unicode
+        """
+        raise NotImplementedError
+
+    def evict(self):  # pragma: no cover
+        """Return the key of the entry to evict.
+
+        :returns: Entry key.
+        :rtype: str | unicode
+        """
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used entry."""
+
+    def __init__(self):
+        self._keys = OrderedDict()
+
+    def add(self, key):
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+    def touch(self, key):
+        self._keys.move_to_end(key)
+
+    def remove(self, key):
+        self._keys.pop(key, None)
+
+    def evict(self):
+        return next(iter(self._keys))
+
+
+class FIFOPolicy(LRUPolicy):
+    """Evict the oldest entry, regardless of hits."""
+
+    def touch(self, key):
+        pass
+
+
+class _Entry(object):
+    __slots__ = ["rev", "data", "expires"]
+
+    def __init__(self, rev, data, expires):
+        self.rev = rev
+        self.data = data
+        self.expires = expires
+
+
+class DocumentCache(object):
+    """Client-side document cache keyed by document ID.
+
+    Documents are stored serialized, so the size of the cache is measured in
+    bytes and callers always get their own copy of a cached document.
+
+    A cache is attached to collections with
+    :func:`c8.fabric.StandardFabric.collection` (parameter **cache**), and
+    can be shared between collections. Local writes (insert, update, replace,
+    delete, truncate) through these collections invalidate the entries they
+    touch. Writes by other clients are only picked up once entries expire:
+
+    * Without **revalidate**, an expired entry is fetched again in full.
+    * With **revalidate**, an expired entry is checked against the server
+      with its revision (If-None-Match header). An unchanged document costs
+      an empty 304 response instead of the full document.
+
+    Set **ttl** to None only if the cache is kept up to date by a
+    :class:`c8.cache.CacheInvalidator`: entries then never expire.
+
+    A read which started before a document was invalidated does not cache the
+    version it got (see :func:`generation`), as it may predate the write.
+
+    :param max_entries: Max number of cached documents.
+    :type max_entries: int
+    :param max_bytes: Max total size of the cached documents in serialized
+        bytes, or None for no limit.
+    :type max_bytes: int | None
+    :param ttl: Seconds an entry is served without contacting the server, or
+        None if entries only leave the cache on eviction or invalidation.
+        Defaults to 60 seconds.
+    :type ttl: int | float | None
+    :param revalidate: Revalidate expired entries with their revision instead
+        of fetching them again.
+    :type revalidate: bool
+    :param policy: Eviction policy. Defaults to :class:`c8.cache.LRUPolicy`.
+    :type policy: c8.cache.EvictionPolicy
+    """
+
+    def __init__(
+        self, max_entries=1024, max_bytes=None, ttl=60, revalidate=False, policy=None
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._revalidate = revalidate
+        self._policy = policy or LRUPolicy()
+        self._entries = {}
+        self._size = 0
+        # Invalidation counters of the recently invalidated documents, and a
+        # counter bumped when invalidations of all documents are dropped.
+        self._generations = OrderedDict()
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<DocumentCache {} entries>".format(len(self))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._entries
+
+    @property
+    def size(self):
+        """Return the total size of the cached documents.
+
+        :returns: Size in serialized bytes.
+        :rtype: int
+        """
+        return self._size
+
+    @property
+    def revalidate(self):
+        """Return True if expired entries are revalidated.
+
+        :rtype: bool
+        """
+        return self._revalidate
+
+    def lookup(self, doc_id):
+        """Look up a document.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :returns: Copy of the document, its revision, and whether the entry
+            is still fresh; or None on a miss.
+        :rtype: (dict, str | unicode, bool) | None
+        """
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            fresh = entry.expires is None or entry.expires > time.monotonic()
+            if fresh:
+                self.hits += 1
+                self._policy.touch(doc_id)
+            else:
+                self.misses += 1
+            data, rev = entry.data, entry.rev
+        return loads(data), rev, fresh
+
+    def get(self, doc_id):
+        """Return a cached document if it is still fresh.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :returns: Copy of the document, or None.
+        :rtype: dict | None
+        """
+        result = self.lookup(doc_id)
+        if result is None or not result[2]:
+            return None
+        return result[0]
+
+    def generation(self, doc_id):
+        """Return the invalidation generation of a document.
+
+        Take it before reading a document from the server, and pass it to
+        :func:`put`: the document is then not cached if it was invalidated
+        in the meantime.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :returns: Generation.
+        :rtype: (int, int)
+        """
+        with self._lock:
+            return self._epoch, self._generations.get(doc_id, 0)
+
+    def put(self, doc_id, document, generation=None):
+        """Add or replace a document.
+
+        Documents larger than **max_bytes** are not cached.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :param document: Document with a "_rev" field.
+        :type document: dict
+        :param generation: Generation of the document when it was read (see
+            :func:`generation`). The document is not cached if it was
+            invalidated since.
+        :type generation: (int, int)
+        """
+        data = dumps(document).encode("utf-8")
+        expires = None if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            if generation is not None and generation != (
+                self._epoch,
+                self._generations.get(doc_id, 0),
+            ):
+                return
+            self._remove(doc_id)
+            if self._max_bytes is not None and len(data) > self._max_bytes:
+                return
+            self._entries[doc_id] = _Entry(document.get("_rev"), data, expires)
+            self._size += len(data)
+            self._policy.add(doc_id)
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._size > self._max_bytes
+            ):
+                self._remove(self._policy.evict())
+
+    def refresh(self, doc_id):
+        """Restart the time-to-live of an entry (e.g. after revalidation).
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        """
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry is not None and self._ttl is not None:
+                entry.expires = time.monotonic() + self._ttl
+
+    def invalidate(self, doc_id):
+        """Remove a document.
+
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        """
+        with self._lock:
+            self._remove(doc_id)
+            generation = self._generations.pop(doc_id, 0) + 1
+            self._generations[doc_id] = generation
+            if len(self._generations) > self._max_entries:
+                # Reads of any document started before are not cached.
+                self._generations.popitem(last=False)
+                self._epoch += 1
+
+    def on_change(self, collection, doc_id, document):
+        """Apply a change received from a collection stream.
+
+        Cached documents are replaced by their new version, so that they stay
+        cached. Documents which are not cached are left out.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :param document: New version of the document, or None if it was
+            deleted or should only be evicted.
+        :type document: dict | None
+        """
+        if document is None or document.get("_rev") is None:
+            self.invalidate(doc_id)
+        elif doc_id in self._entries:
+            self.put(doc_id, document)
+
+    def invalidate_collection(self, name):
+        """Remove all documents of a collection.
+
+        :param name: Collection name.
+        :type name: str | unicode
+        """
+        prefix = name + "/"
+        with self._lock:
+            for doc_id in [key for key in self._entries if key.startswith(prefix)]:
+                self._remove(doc_id)
+            self._generations.clear()
+            self._epoch += 1
+
+    def clear(self):
+        """Remove all documents."""
+        with self._lock:
+            for doc_id in list(self._entries):
+                self._remove(doc_id)
+            self._generations.clear()
+            self._epoch += 1
+
+    def _remove(self, doc_id):
+        entry = self._entries.pop(doc_id, None)
+        if entry is not None:
+            self._size -= len(entry.data)
+            self._policy.remove(doc_id)
+
+
+class QueryCache(object):
+    """Client-side cache of query results, keyed by query, bind variables
+    and fabric.
+
+    Results are stored serialized, so the size of the cache is measured in
+    bytes and callers always get their own copy of a cached result. Queries
+    are only reused as long as their entry is fresh: writes by this or other
+    clients are not seen until then, unless the collections queried are
+    invalidated (e.g. by a :class:`c8.cache.CacheInvalidator`).
+
+    Use it through :attr:`c8.c8ql.C8QL.cache`.
+
+    :param max_entries: Max number of cached results.
+    :type max_entries: int
+    :param max_bytes: Max total size of the cached results in serialized
+        bytes.
+    :type max_bytes: int
+    :param ttl: Seconds a result is reused, or None if results only leave the
+        cache on eviction or invalidation.
+    :type ttl: int | float | None
+    :param policy: Eviction policy. Defaults to :class:`c8.cache.LRUPolicy`.
+    :type policy: c8.cache.EvictionPolicy
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=16 << 20, ttl=60, policy=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._policy = policy or LRUPolicy()
+        self._entries = {}
+        self._collections = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<QueryCache {} entries>".format(len(self))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Return the total size of the cached results.
+
+        :returns: Size in serialized bytes.
+        :rtype: int
+        """
+        return self._size
+
+    def get(self, key):
+        """Return a cached result if it is still fresh.
+
+        :param key: Result key.
+        :type key: tuple
+        :returns: Copy of the result, or None.
+        :rtype: list | None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.expires is None or entry.expires > time.monotonic()
+            ):
+                self.hits += 1
+                self._policy.touch(key)
+                data = entry.data
+            else:
+                self.misses += 1
+                if entry is not None:
+                    self._remove(key)
+                return None
+        return loads(data)
+
+    def put(self, key, result, collections=()):
+        """Add or replace a result.
+
+        Results larger than **max_bytes** are not cached.
+
+        :param key: Result key.
+        :type key: tuple
+        :param result: Query result.
+        :type result: list
+        :param collections: Names of the collections the query may read, used
+            by :func:`invalidate_collection`.
+        :type collections: [str | unicode]
+        """
+        data = dumps(result).encode("utf-8")
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._remove(key)
+            if len(data) > self.max_bytes or self.max_entries < 1:
+                return
+            self._entries[key] = _Entry(None, data, expires)
+            self._collections[key] = frozenset(collections)
+            self._size += len(data)
+            self._policy.add(key)
+            self._shrink()
+
+    def configure(self, max_entries=None, max_bytes=None, ttl=None):
+        """Change the limits of the cache. Entries are evicted right away if
+        the cache is over the new limits.
+
+        :param max_entries: Max number of cached results.
+        :type max_entries: int
+        :param max_bytes: Max total size of the cached results in bytes.
+        :type max_bytes: int
+        :param ttl: Seconds a result is reused. Applies to new entries.
+        :type ttl: int | float
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if ttl is not None:
+                self.ttl = ttl
+            self._shrink()
+
+    def on_change(self, collection, doc_id, document):
+        """Apply a change received from a collection stream.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param doc_id: Document ID.
+        :type doc_id: str | unicode
+        :param document: New version of the document.
+        :type document: dict | None
+        """
+        self.invalidate_collection(collection)
+
+    def invalidate_collection(self, name):
+        """Remove the results of the queries which may read a collection.
+
+        :param name: Collection name.
+        :type name: str | unicode
+        """
+        with self._lock:
+            keys = [key for key, names in self._collections.items() if name in names]
+            for key in keys:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all results."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _shrink(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._size > self.max_bytes
+        ):
+            self._remove(self._policy.evict())
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            del self._collections[key]
+            self._size -= len(entry.data)
+            self._policy.remove(key)
+
+
+class CacheInvalidator(object):
+    """Background consumer of collection streams keeping caches up to date.
+
+    Each collection stream is consumed by a daemon thread. When a document
+    changes, the ``on_change(collection, doc_id, document)`` method of every
+    cache is called, with the new document version if **update** is set or
+    None to evict it. Caches are invalidated for the whole collection
+    whenever a stream (re)connects, as changes may have been missed.
+
+    Use :func:`c8.fabric.StandardFabric.cache_invalidator` to create one.
+
+    :param topics: Stream consumer URL for each collection name.
+    :type topics: dict
+    :param caches: Caches to keep up to date (e.g.
+        :class:`c8.cache.DocumentCache`).
+    :type caches: list
+    :param header: Headers sent when connecting (e.g. authorization).
+    :type header: dict
+    :param update: Replace cached documents with their new version instead
+        of evicting them.
+    :type update: bool
+    :param connect: Function opening a websocket, called with the URL,
+        **header** and timeout. Defaults to
+        :func:`websocket.create_connection`.
+    :type connect: callable
+    :param timeout: Seconds between checks for stop requests while waiting
+        for changes.
+    :type timeout: int | float
+    :param reconnect_delay: Seconds to wait before reconnecting a stream.
+    :type reconnect_delay: int | float
+    :param unsubscribe: Function called with each collection name once its
+        stream is no longer consumed, e.g. to delete the stream subscription.
+    :type unsubscribe: callable
+    """
+
+    def __init__(
+        self,
+        topics,
+        caches,
+        header=None,
+        update=False,
+        connect=None,
+        timeout=1,
+        reconnect_delay=1,
+        unsubscribe=None,
+    ):
+        self._topics = topics
+        self._caches = list(caches)
+        self._header = header
+        self._update = update
+        self._connect = connect or websocket.create_connection
+        self._timeout = timeout
+        self._reconnect_delay = reconnect_delay
+        self._unsubscribe = unsubscribe
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def __repr__(self):
+        return "<CacheInvalidator {}>".format(", ".join(sorted(self._topics)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def start(self):
+        """Start consuming the collection streams.
+
+        :returns: The invalidator itself.
+        :rtype: c8.cache.CacheInvalidator
+        """
+        for collection, url in self._topics.items():
+            thread = threading.Thread(
+                target=self._run,
+                args=(collection, url),
+                name="c8-cache-invalidator-{}".format(collection),
+            )
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        """Stop consuming the collection streams.
+
+        :param timeout: Max seconds to wait for each consumer thread.
+        :type timeout: int | float | None
+        """
+        self._stopped.set()
+        threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+        if not threads or self._unsubscribe is None:
+            return
+        for collection in self._topics:
+            try:
+                self._unsubscribe(collection)
+            except Exception as err:
+                logger.warning("cannot unsubscribe from %s stream: %s", collection, err)
+
+    def _run(self, collection, url):
+        """Consume a collection stream until stopped, reconnecting on errors.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param url: Stream consumer URL.
+        :type url: str | unicode
+        """
+        while not self._stopped.is_set():
+            try:
+                ws = self._connect(url, header=self._header, timeout=self._timeout)
+            except Exception as err:
+                logger.warning("cannot consume %s stream: %s", collection, err)
+                self._stopped.wait(self._reconnect_delay)
+                continue
+            # Changes may have been missed while disconnected.
+            for cache in self._caches:
+                cache.invalidate_collection(collection)
+            try:
+                self._consume(collection, ws)
+            except Exception as err:
+                logger.warning("lost %s stream: %s", collection, err)
+                self._stopped.wait(self._reconnect_delay)
+            finally:
+                ws.close()
+
+    def _consume(self, collection, ws):
+        """Apply the changes received on a websocket until stopped.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param ws: Websocket.
+        :type ws: websocket.WebSocket
+        """
+        while not self._stopped.is_set():
+            try:
+                msg = loads(ws.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            self._apply(collection, base64.b64decode(msg["payload"]))
+            ws.send(dumps({"messageId": msg["messageId"]}))
+
+    def _apply(self, collection, payload):
+        """Pass a change to the caches.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param payload: Changed document as JSON.
+        :type payload: bytes
+        """
+        try:
+            document = loads(payload)
+            doc_id = document.get("_id") or "{}/{}".format(
+                collection, document["_key"]
+            )
+        except (ValueError, TypeError, KeyError, AttributeError):
+            # Without the document ID, drop everything cached for safety.
+            for cache in self._caches:
+                cache.invalidate_collection(collection)
+            return
+        if not self._update or document.get("_delete"):
+            document = None
+        for cache in self._caches:
+            cache.on_change(collection, doc_id, document)
+
+
+class MetadataCache(object):
+    """Cache of the names of existing collections, streams and key-value
+    collections, used for existence checks.
+
+    Listing the collections or streams of a fabric returns all of them, so
+    the name lists are reused until they expire. Creating or deleting a
+    resource through the client updates the cached lists, while changes made
+    by other clients are only seen once the lists expire.
+
+    A cache is shared by the wrappers using the same connection.
+
+    :param ttl: Seconds a name list is reused, or None to keep it until it is
+        invalidated. Set to 0 to disable caching.
+    :type ttl: int | float | None
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._names = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<MetadataCache {} lists>".format(len(self._names))
+
+    def names(self, key, load):
+        """Return a cached name list, loading it if missing or expired.
+
+        :param key: List key, starting with the tenant and fabric names.
+        :type key: tuple
+        :param load: Function returning the names.
+        :type load: callable
+        :returns: Names.
+        :rtype: frozenset
+        """
+        names = self.get(key)
+        if names is not None:
+            return names
+        names = frozenset(load())
+        if self.ttl != 0:
+            expires = None if self.ttl is None else time.monotonic() + self.ttl
+            with self._lock:
+                self._names[key] = _Entry(None, names, expires)
+        return names
+
+    def get(self, key):
+        """Return a cached name list without loading it.
+
+        :param key: List key.
+        :type key: tuple
+        :returns: Names, or None if the list is missing or expired.
+        :rtype: frozenset | None
+        """
+        with self._lock:
+            entry = self._names.get(key)
+            if entry is not None and (
+                entry.expires is None or entry.expires > time.monotonic()
+            ):
+                return entry.data
+        return None
+
+    def add(self, key, name):
+        """Add a name to a cached list (e.g. after a creation).
+
+        :param key: List key.
+        :type key: tuple
+        :param name: Name.
+        :type name: str | unicode
+        """
+        with self._lock:
+            entry = self._names.get(key)
+            if entry is not None:
+                entry.data = entry.data | {name}
+
+    def discard(self, key, name):
+        """Remove a name from a cached list (e.g. after a deletion).
+
+        :param key: List key.
+        :type key: tuple
+        :param name: Name.
+        :type name: str | unicode
+        """
+        with self._lock:
+            entry = self._names.get(key)
+            if entry is not None:
+                entry.data = entry.data - {name}
+
+    def invalidate(self, prefix=()):
+        """Drop the cached lists whose key starts with the given prefix.
+
+        :param prefix: Key prefix, e.g. (tenant, fabric) for all the lists of
+            a fabric. Drops all lists by default.
+        :type prefix: tuple
+        """
+        with self._lock:
+            for key in [key for key in self._names if key[: len(prefix)] == prefix]:
+                del self._names[key]
@@ -2,10 +2,14 @@ from __future__ import absolute_import, unicode_literals
 
 from enum import Enum
 
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+
 from c8 import constants
+from c8.cache import MetadataCache
 from c8.billing.billing_interface import BillingInterface
 from c8.connection import TenantConnection
 from c8.function.function_interface import FunctionInterface
+from c8.http import DefaultHTTPClient
 from c8.redis.redis_commands import RedisCommands
 from c8.tenant import Tenant
 from c8.version import __version__
@@ -44,6 +48,29 @@ class C8Client(object):
     :type port: int
     :param http_client: User-defined HTTP client.
     :type http_client: c8.http.HTTPClient
+    :param pool_connections: Number of per-host connection pools cached by
+        the default HTTP client. Ignored if **http_client** is given.
+    :type pool_connections: int
+    :param pool_maxsize: Max number of connections kept per host by the
+        default HTTP client. Set it to at least the number of threads sharing
+        the client. Ignored if **http_client** is given.
+    :type pool_maxsize: int
+    :param pool_block: If set to True, requests wait for a free connection
+        when a host pool is exhausted. Ignored if **http_client** is given.
+    :type pool_block: bool
+    :param pool_idle_timeout: Close pooled connections of a host which has
+        not been used for this many seconds. Ignored if **http_client** is
+        given.
+    :type pool_idle_timeout: int | float
+    :param retry_policy: Retry policy (backoff, retry budget, timeouts) of
+        the default HTTP client. Ignored if **http_client** is given.
+    :type retry_policy: c8.http.RetryPolicy
+    :param metadata_ttl: Seconds the names of the collections and streams are
+        cached for existence checks (e.g. in :func:`get_collection`), or None
+        to cache them until the client creates or deletes one. Defaults to 0:
+        names are listed on every check, so that collections created or
+        deleted by other clients are seen right away.
+    :type metadata_ttl: int | float | None
     """
 
     def __init__(
@@ -59,6 +86,12 @@ class C8Client(object):
         token=None,
         apikey=None,
         skip_tenant=False,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=DEFAULT_POOLBLOCK,
+        pool_idle_timeout=None,
+        retry_policy=None,
+        metadata_ttl=0,
     ):
 
         self._protocol = protocol.strip("/")
@@ -72,7 +105,14 @@ class C8Client(object):
         self._stream_port = int(stream_port)
         self.set_port()
         self.set_url()
-        self._http_client = http_client
+        self._http_client = http_client or DefaultHTTPClient(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            pool_idle_timeout=pool_idle_timeout,
+            retry_policy=retry_policy,
+        )
+        self._metadata_cache = MetadataCache(metadata_ttl)
         self.get_tenant(skip_tenant)
         # Domains
         self._redis = None
@@ -193,6 +233,27 @@ class C8Client(object):
         """
         return self._url
 
+    @property
+    def http_client(self):
+        """Return the HTTP client shared by all connections of this client.
+
+        :returns: HTTP client.
+        :rtype: c8.http.HTTPClient
+        """
+        return self._http_client
+
+    def get_http_pool_stats(self):
+        """Return the utilization of the HTTP connection pools.
+
+        See :func:`c8.http.DefaultHTTPClient.pool_stats`.
+
+        :returns: Per-host pool utilization, or None if the HTTP client does
+            not report it.
+        :rtype: [dict] | None
+        """
+        pool_stats = getattr(self._http_client, "pool_stats", None)
+        return pool_stats() if pool_stats is not None else None
+
     def tenant(self, email="", password="", token=None, apikey=None, skip_tenant=False):
         """Connect to a fabric and return the fabric API wrapper.
 
@@ -218,6 +279,7 @@ class C8Client(object):
             apikey=apikey,
             http_client=self._http_client,
             skip_tenant=skip_tenant,
+            metadata_cache=self._metadata_cache,
         )
         tenant = Tenant(connection)
 
@@ -612,7 +674,9 @@ class C8Client(object):
 
     # client.export
 
-    def export(self, collection_name, offset=None, limit=None, order=None):
+    def export(
+        self, collection_name, offset=None, limit=None, order=None, start_after=None
+    ):
         """Export all documents in the collection.
 
         :param collection_name: Collection name to add index on.
@@ -625,12 +689,17 @@ class C8Client(object):
         :param order: Sorts the result in specified order. Allowed values are "asc" or
         "desc".
         :type order: str | unicode
+        :param start_after: Return the documents following this key in key order
+        (keyset pagination). Cannot be combined with **offset**.
+        :type start_after: str | unicode
         :returns: Documents in the collection.
         :rtype: dict
         :raise c8.exceptions.DocumentGetError: If export fails.
         """
         _collection = self.get_collection(collection_name)
-        return _collection.export(offset=offset, limit=limit, order=order)
+        return _collection.export(
+            offset=offset, limit=limit, order=order, start_after=start_after
+        )
 
     # client.has_collection
 
@@ -659,15 +728,19 @@ class C8Client(object):
 
     # client.get_collection
 
-    def get_collection(self, name):
+    def get_collection(self, name, lazy=False):
         """Return the standard collection API wrapper.
 
         :param name: Collection name.
         :type name: str | unicode
+        :param lazy: Do not check that the collection exists.
+        :type lazy: bool
         :returns: Standard collection API wrapper.
         :rtype: c8.collection.StandardCollection
+        :raise c8.exceptions.CollectionFindError: If the collection does not
+            exist.
         """
-        resp = self._fabric.collection(name)
+        resp = self._fabric.collection(name, lazy=lazy)
         return resp
 
     # client.on_change
@@ -700,6 +773,32 @@ class C8Client(object):
         resp = _collection.get(document=document, rev=rev, check_rev=check_rev)
         return resp
 
+    # client.get_document_many
+
+    def get_document_many(self, collection, documents, projection=None, check_rev=True):
+        """Return multiple documents in as few requests as possible.
+
+        :param collection: Collection Name
+        :type collection: str
+        :param documents: Document IDs, keys or bodies. Document bodies must
+            contain the "_id" or "_key" field.
+        :type documents: [str | unicode | dict]
+        :param projection: Document fields to return. The "_id", "_key" and
+            "_rev" fields are always returned.
+        :type projection: [str | unicode]
+        :param check_rev: If set to True, the "_rev" field of document bodies
+            (if given) is compared against the revision of target documents.
+        :type check_rev: bool
+        :returns: Documents in input order, with None for missing documents
+            and c8.exceptions.DocumentRevisionError for revision mismatches.
+        :rtype: [dict | None | c8.exceptions.DocumentRevisionError]
+        :raise c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        _collection = self.get_collection(collection)
+        return _collection.get_many(
+            documents, projection=projection, check_rev=check_rev
+        )
+
     # client.get_all_documents
 
     def get_all_documents(self, collection_name, batch_size=1000):
@@ -749,6 +848,56 @@ class C8Client(object):
             batch_size=batch_size,
         )
 
+    # client.iter_documents
+
+    def iter_documents(self, collection_name, batch_size=1000, prefetch=0):
+        """Yield the documents inside the given collection as they arrive.
+
+        Unlike :func:`c8.client.C8Client.get_all_documents`, memory usage does
+        not grow with the size of the collection. The server cursor is closed
+        if the generator is closed early (e.g. on break).
+
+        :param collection_name: Collection Name
+        :type collection_name: str
+        :param batch_size: Number of documents fetched in one round trip.
+        :type batch_size: int
+        :param prefetch: Max number of batches fetched ahead in the background.
+        :type prefetch: int
+        :returns: Generator of documents.
+        :rtype: generator
+        :raise c8.exceptions.C8QLQueryExecuteError: If retrieval fails.
+        """
+        return self._fabric.c8ql.iter_documents(
+            query="FOR doc IN {} RETURN doc".format(collection_name),
+            batch_size=batch_size,
+            prefetch=prefetch,
+        )
+
+    # client.iter_batches
+
+    def iter_batches(self, query, bind_vars=None, batch_size=1000, prefetch=0):
+        """Yield the results of a read-only query batch by batch. Query cannot
+        contain the following keywords: INSERT, UPDATE, REPLACE, REMOVE and UPSERT.
+
+        :param query: Query to Execute
+        :type query: str
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
+        :param batch_size: Number of documents fetched in one round trip.
+        :type batch_size: int
+        :param prefetch: Max number of batches fetched ahead in the background.
+        :type prefetch: int
+        :returns: Generator of document batches.
+        :rtype: generator
+        :raise c8.exceptions.C8QLQueryExecuteError: If retrieval fails.
+        """
+        return self._fabric.c8ql.iter_batches(
+            query=query,
+            bind_vars=bind_vars,
+            batch_size=batch_size,
+            prefetch=prefetch,
+        )
+
     # client.insert_document
 
     def insert_document(
@@ -2775,7 +2924,7 @@ class C8Client(object):
 
     # client.get_keys
 
-    def get_keys(self, name, offset=None, limit=None, order=None):
+    def get_keys(self, name, offset=None, limit=None, order=None, start_after=None):
         """gets keys of a collection.
 
         :param name: Collection name.
@@ -2786,12 +2935,36 @@ class C8Client(object):
         :type limit: int
         :param order: Order the results ascending (asc) or descending (desc).
         :type order: str | unicode
+        :param start_after: Return the keys following this key (keyset
+            pagination). Cannot be combined with **offset**.
+        :type start_after: str | unicode
         :returns: List of Keys.
         :rtype: list
         :raise c8.exceptions.GetKeysError: If request fails.
         """
         return self._fabric.key_value.get_keys(
-            name, offset=offset, limit=limit, order=order
+            name, offset=offset, limit=limit, order=order, start_after=start_after
+        )
+
+    # client.iter_keys
+
+    def iter_keys(self, name, page_size=1000, start_after=None, order=None):
+        """Yield all keys of a collection, page by page (keyset pagination).
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :param page_size: Number of keys fetched in one round trip.
+        :type page_size: int
+        :param start_after: Start after this key instead of the first key.
+        :type start_after: str | unicode
+        :param order: Order the results ascending (asc) or descending (desc).
+        :type order: str | unicode
+        :returns: Generator of keys.
+        :rtype: generator
+        :raise c8.exceptions.GetKeysError: If request fails.
+        """
+        return self._fabric.key_value.iter_keys(
+            name, page_size=page_size, start_after=start_after, order=order
         )
 
     # client.get_kv_count
@@ -2809,7 +2982,7 @@ class C8Client(object):
 
     # client.get_key_value_pairs
 
-    def get_key_value_pairs(self, name, offset=None, limit=None):
+    def get_key_value_pairs(self, name, offset=None, limit=None, start_after=None):
         """Fetch key-value pairs from collection. Optional list of keys
         Note: Max limit is 100 keys per request.
 
@@ -2819,12 +2992,35 @@ class C8Client(object):
         :type offset: int
         :param limit: Limit to simulate paging.
         :type limit: int
+        :param start_after: Return the pairs following this key (keyset
+            pagination). Cannot be combined with **offset**.
+        :type start_after: str | unicode
         :return: The key value pairs from the collection.
         :rtype: object
         :raise c8.exceptions.GetKVError: If request fails.
         """
         return self._fabric.key_value.get_key_value_pairs(
-            name=name, offset=offset, limit=limit
+            name=name, offset=offset, limit=limit, start_after=start_after
+        )
+
+    # client.iter_key_value_pairs
+
+    def iter_key_value_pairs(self, name, page_size=100, start_after=None):
+        """Yield all key-value pairs of a collection in key order, page by page
+        (keyset pagination).
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :param page_size: Number of pairs fetched in one round trip.
+        :type page_size: int
+        :param start_after: Start after this key instead of the first key.
+        :type start_after: str | unicode
+        :return: Generator of pairs with their "_key", "value" and "expireAt".
+        :rtype: generator
+        :raise c8.exceptions.GetKVError: If request fails.
+        """
+        return self._fabric.key_value.iter_key_value_pairs(
+            name, page_size=page_size, start_after=start_after
         )
 
     # client.remove_key_value_pairs
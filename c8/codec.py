@@ -0,0 +1,152 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+__all__ = [
+    "JSONCodec",
+    "OrjsonCodec",
+    "get_codec",
+    "get_default_codec",
+    "set_default_codec",
+    "dumps",
+    "loads",
+]
+
+# Types accepted as pre-encoded JSON payloads.
+RAW_JSON_TYPES = (bytes, bytearray, memoryview)
+
+
+class JSONCodec(object):
+    """JSON codec backed by the standard library :mod:`json` module."""
+
+    name = "json"
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.name)
+
+    def dumps(self, obj):
+        """Serialize an object to a JSON string.
+
+        :param obj: Object to serialize.
+        :type obj: str | unicode | bool | int | float | list | dict | None
+        :returns: JSON string.
+        :rtype: str | unicode
+        """
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """Deserialize a JSON document.
+
+        :param data: JSON document.
+        :type data: bytes | bytearray | str | unicode
+        :returns: Deserialized object.
+        :rtype: str | unicode | bool | int | float | list | dict | None
+        :raise ValueError: If the document is not valid JSON.
+        :raise TypeError: If the document is not a string or bytes.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson_.
+
+    Objects orjson cannot serialize (e.g. integers above 64 bits) fall back
+    to the standard library.
+
+    .. _orjson: https://github.com/ijl/orjson
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        try:
+            return self._orjson.dumps(obj, option=self._option).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview, str)):
+            return self._orjson.loads(data)
+        # Let the standard library raise the usual TypeError.
+        return json.loads(data)
+
+
+def get_codec(codec="auto"):
+    """Return a JSON codec.
+
+    :param codec: Codec instance or name: "json" (standard library), "orjson",
+        or "auto" (orjson if installed, standard library otherwise).
+    :type codec: str | unicode | c8.codec.JSONCodec
+    :returns: JSON codec.
+    :rtype: c8.codec.JSONCodec
+    :raise ValueError: If the codec name is unknown.
+    :raise ImportError: If "orjson" is requested but not installed.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "json":
+        return JSONCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "auto":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JSONCodec()
+    raise ValueError("unknown JSON codec: {}".format(codec))
+
+
+_default_codec = JSONCodec()
+
+
+def get_default_codec():
+    """Return the JSON codec used to encode requests and decode responses.
+
+    :returns: JSON codec.
+    :rtype: c8.codec.JSONCodec
+    """
+    return _default_codec
+
+
+def set_default_codec(codec="auto"):
+    """Set the JSON codec used to encode requests and decode responses.
+
+    The codec is process-wide: it applies to every client, and should be set
+    once at startup, before requests are sent.
+
+    :param codec: Codec instance or name (see :func:`c8.codec.get_codec`).
+    :type codec: str | unicode | c8.codec.JSONCodec
+    :returns: The new default codec.
+    :rtype: c8.codec.JSONCodec
+    """
+    global _default_codec
+    _default_codec = get_codec(codec)
+    return _default_codec
+
+
+def dumps(obj):
+    """Serialize an object with the default JSON codec.
+
+    :param obj: Object to serialize.
+    :type obj: str | unicode | bool | int | float | list | dict | None
+    :returns: JSON string.
+    :rtype: str | unicode
+    """
+    return _default_codec.dumps(obj)
+
+
+def loads(data):
+    """Deserialize a JSON document with the default JSON codec.
+
+    :param data: JSON document.
+    :type data: bytes | bytearray | str | unicode
+    :returns: Deserialized object.
+    :rtype: str | unicode | bool | int | float | list | dict | None
+    """
+    return _default_codec.loads(data)
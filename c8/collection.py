@@ -1,9 +1,14 @@
 from __future__ import absolute_import, unicode_literals
 
-from json import dumps
+from inspect import iscoroutinefunction
+from itertools import chain
 from numbers import Number
 
+from six import string_types
+
 from c8.api import APIWrapper
+from c8.bulk import BulkWriter
+from c8.codec import RAW_JSON_TYPES, dumps
 from c8.cursor import Cursor
 from c8.exceptions import (
     CollectionImportFromFileError,
@@ -24,6 +29,7 @@ from c8.exceptions import (
     IndexDeleteError,
     IndexListError,
 )
+from c8.export import ParallelExporter
 from c8.request import Request
 from c8.response import Response
 from c8.utils import (
@@ -34,10 +40,14 @@ from c8.utils import (
     is_none_or_int,
     is_none_or_str,
     json_reader,
+    keyset_query,
 )
 
 __all__ = ["StandardCollection", "VertexCollection", "EdgeCollection"]
 
+# Approximate size in bytes of the chunks of streamed request bodies.
+STREAM_CHUNK_SIZE = 256 * 1024
+
 
 class Collection(APIWrapper):
     """Base class for collection API wrappers.
@@ -65,9 +75,17 @@ class Collection(APIWrapper):
         super(Collection, self).__init__(connection, executor)
         self._name = name
         self._id_prefix = name + "/"
+        self._cache = None
 
     def __iter__(self):
-        return self.all()
+        cursor = self.all()
+        try:
+            for doc in cursor:
+                yield doc
+        finally:
+            # Free the server cursor if the iteration stopped early.
+            if cursor.has_more():
+                cursor.close(ignore_missing=True)
 
     def __len__(self):
         return self.count()
@@ -229,6 +247,63 @@ class Collection(APIWrapper):
             else:
                 return doc_id, doc_id, {"If-Match": rev}
 
+    def _uncache_after(self, response_handler, documents, keys=True):
+        """Wrap a response handler to invalidate the written documents again
+        once the write went through.
+
+        Documents read (and cached) after the write was built but before it
+        reached the server (e.g. in batches, transactions or write-behind
+        buffers) would otherwise be stale.
+
+        :param response_handler: HTTP response handler of the write.
+        :type response_handler: callable
+        :param documents: Document IDs, keys or bodies, or None to invalidate
+            all documents of the collection.
+        :type documents: list | None
+        :param keys: If set to False, strings are JSON documents rather than
+            document IDs or keys.
+        :type keys: bool
+        :returns: HTTP response handler.
+        :rtype: callable
+        """
+        if self._cache is None:
+            return response_handler
+
+        def handler(resp):
+            if resp.is_success:
+                self._uncache(documents, keys)
+            return response_handler(resp)
+
+        return handler
+
+    def _uncache(self, documents, keys=True):
+        """Invalidate the cached documents about to be written.
+
+        :param documents: Document IDs, keys or bodies, or None to invalidate
+            all documents of the collection.
+        :type documents: list | None
+        :param keys: If set to False, strings are JSON documents rather than
+            document IDs or keys.
+        :type keys: bool
+        """
+        if self._cache is None:
+            return
+        if not isinstance(documents, (list, tuple)):
+            # Pre-encoded or streamed documents cannot be inspected.
+            self._cache.invalidate_collection(self.name)
+            return
+        for document in documents:
+            if not isinstance(document, dict) and not (
+                keys and isinstance(document, string_types)
+            ):
+                self._cache.invalidate_collection(self.name)
+                return
+            try:
+                handle = self._prep_from_doc(document, None, False)[0]
+            except (DocumentParseError, KeyError):
+                continue
+            self._cache.invalidate(handle)
+
     def _ensure_key_in_body(self, body):
         """Return the document body with "_key" field populated.
 
@@ -247,6 +322,107 @@ class Collection(APIWrapper):
             return body
         raise DocumentParseError('field "_key" or "_id" required')
 
+    def _serialize_documents(self, documents, normalize):
+        """Serialize documents into a JSON array.
+
+        Pre-encoded payloads are passed through untouched: either a JSON array
+        given as bytes, bytearray or memoryview, or an iterable of JSON
+        documents given as bytes-like objects or strings. Other documents are
+        normalized and serialized with the default JSON codec.
+
+        :param documents: Documents or pre-encoded payload.
+        :type documents: bytes | bytearray | memoryview | iterable
+        :param normalize: Function applied to each (non pre-encoded) document.
+        :type normalize: callable
+        :returns: JSON array.
+        :rtype: bytes | bytearray | memoryview | str | unicode
+        """
+        if isinstance(documents, RAW_JSON_TYPES):
+            return documents
+
+        documents = iter(documents)
+        for first in documents:
+            documents = chain([first], documents)
+            break
+        else:
+            return "[]"
+
+        if isinstance(first, RAW_JSON_TYPES + string_types):
+            encoded = (
+                doc.encode("utf-8") if isinstance(doc, string_types) else doc
+                for doc in documents
+            )
+            return b"[" + b",".join(encoded) + b"]"
+        return dumps([normalize(doc) for doc in documents])
+
+    def _can_stream(self, documents):
+        """Return True if documents should be streamed in chunks.
+
+        Iterators (e.g. generators) are streamed so that they never need to
+        be held in memory at once. Streaming is not possible for transaction
+        commands, which embed the whole payload.
+
+        :param documents: Documents or pre-encoded payload.
+        :type documents: bytes | bytearray | memoryview | iterable
+        :rtype: bool
+        """
+        return (
+            not self._is_transaction
+            and not isinstance(documents, RAW_JSON_TYPES)
+            and iter(documents) is documents
+        )
+
+    @staticmethod
+    def _stream_documents(documents, normalize, prefix=b"[", suffix=b"]"):
+        """Serialize documents into a JSON array, chunk by chunk.
+
+        The chunks are meant to be sent with chunked transfer encoding, so
+        that memory usage does not depend on the number of documents.
+
+        :param documents: Documents, or JSON documents given as bytes-like
+            objects or strings.
+        :type documents: iterable
+        :param normalize: Function applied to each (non pre-encoded) document.
+        :type normalize: callable
+        :param prefix: Bytes sent before the array items.
+        :type prefix: bytes
+        :param suffix: Bytes sent after the array items.
+        :type suffix: bytes
+        :returns: Chunks of the serialized payload.
+        :rtype: generator
+        """
+        chunk = [prefix]
+        size = len(prefix)
+        separator = b""
+        for doc in documents:
+            if isinstance(doc, string_types):
+                doc = doc.encode("utf-8")
+            elif not isinstance(doc, RAW_JSON_TYPES):
+                doc = dumps(normalize(doc)).encode("utf-8")
+            chunk.append(separator)
+            chunk.append(doc)
+            separator = b","
+            size += len(doc) + 1
+            if size >= STREAM_CHUNK_SIZE:
+                yield b"".join(chunk)
+                chunk = []
+                size = 0
+        chunk.append(suffix)
+        yield b"".join(chunk)
+
+    @staticmethod
+    def _payload_text(payload):
+        """Return a serialized payload as text (e.g. for transaction commands).
+
+        :param payload: Serialized payload.
+        :type payload: bytes | bytearray | memoryview | str | unicode
+        :returns: Serialized payload.
+        :rtype: str | unicode
+        """
+        if isinstance(payload, RAW_JSON_TYPES):
+            return bytes(payload).decode("utf-8")
+        return payload
+
     def _ensure_key_from_id(self, body):
         """Return the body with "_key" field if it has "_id" field.
 
@@ -317,6 +493,8 @@ class Collection(APIWrapper):
         :rtype: dict
         :raise c8.exceptions.CollectionTruncateError: If operation fails.
         """
+        self._uncache(None)
+
         request = Request(
             method="put",
             endpoint="/collection/{}/truncate".format(self.name),
@@ -329,7 +507,7 @@ class Collection(APIWrapper):
                 raise CollectionTruncateError(resp, request)
             return True
 
-        return self._execute(request, response_handler)
+        return self._execute(request, self._uncache_after(response_handler, None))
 
     def count(self):
         """Return the total document count.
@@ -398,7 +576,121 @@ class Collection(APIWrapper):
 
         return self._execute(request, response_handler)
 
-    def export(self, offset=None, limit=None, order=None):
+    def get_many(self, documents, projection=None, check_rev=True, batch_size=1000):
+        """Return multiple documents, reading up to **batch_size** documents
+        per request.
+
+        :param documents: Document IDs, keys or bodies. Document bodies must
+            contain the "_id" or "_key" field.
+        :type documents: [str | unicode | dict]
+        :param projection: Document fields to return. The "_id", "_key" and
+            "_rev" fields are always returned. All fields are returned if not
+            set.
+        :type projection: [str | unicode]
+        :param check_rev: If set to True, the "_rev" field of document bodies
+            (if given) is compared against the revision of target documents.
+        :type check_rev: bool
+        :param batch_size: Max number of documents read per request.
+        :type batch_size: int
+        :returns: Documents in input order, with None for missing documents
+            and c8.exceptions.DocumentRevisionError for revision mismatches.
+        :rtype: [dict | None | c8.exceptions.DocumentRevisionError]
+        :raise ValueError: If the execution context defers responses (e.g.
+            batch), as the results are read through a cursor.
+        :raise c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        # Transactions return the whole result instead of a cursor.
+        if not self._is_transaction:
+            self._check_sync_context("get_many")
+        handles = []
+        revs = []
+        for document in documents:
+            handle, _, headers = self._prep_from_doc(document, None, check_rev)
+            handles.append(handle)
+            revs.append(headers.get("If-Match"))
+
+        # Results of other execution contexts (e.g. jobs) cannot be merged.
+        if self.context != "default" or len(handles) <= batch_size:
+            return self._get_many(handles, revs, projection)
+
+        results = []
+        for index in range(0, len(handles), batch_size):
+            chunk = slice(index, index + batch_size)
+            results.extend(self._get_many(handles[chunk], revs[chunk], projection))
+        return results
+
+    def _get_many(self, handles, revs, projection):
+        """Read documents in one request.
+
+        :param handles: Document IDs.
+        :type handles: [str | unicode]
+        :param revs: Expected revision of each document, or None.
+        :type revs: [str | unicode | None]
+        :param projection: Document fields to return.
+        :type projection: [str | unicode] | None
+        :returns: Documents in input order.
+        :rtype: [dict | None | c8.exceptions.DocumentRevisionError]
+        :raise c8.exceptions.DocumentGetError: If retrieval fails or the
+            result does not have one entry per document.
+        """
+        bind_vars = {"handles": handles}
+        if projection is None:
+            query = "FOR handle IN @handles RETURN DOCUMENT(handle)"
+        else:
+            query = (
+                "FOR handle IN @handles LET doc = DOCUMENT(handle) "
+                "RETURN doc == null ? null : KEEP(doc, @fields)"
+            )
+            bind_vars["fields"] = ["_id", "_key", "_rev"] + list(projection)
+
+        command = (
+            "db._query({}, {}).toArray()".format(dumps(query), dumps(bind_vars))
+            if self._is_transaction
+            else None
+        )
+
+        request = Request(
+            method="post",
+            endpoint="/cursor",
+            data={"query": query, "bindVars": bind_vars, "batchSize": len(handles)},
+            command=command,
+            read=self.name,
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            if self._is_transaction:
+                docs = resp.body
+            else:
+                docs = list(Cursor(self._conn, resp.body))
+            if len(docs) != len(handles):
+                msg = "expected {} documents, got {}".format(len(handles), len(docs))
+                raise DocumentGetError(resp, request, msg)
+
+            results = []
+            for doc, rev in zip(docs, revs):
+                if doc is not None and rev is not None and doc["_rev"] != rev:
+                    sub_resp = Response(
+                        method=resp.method,
+                        url=resp.url,
+                        headers=resp.headers,
+                        status_code=412,
+                        status_text="Precondition Failed",
+                        raw_body={
+                            "error": True,
+                            "errorNum": 1200,
+                            "errorMessage": "conflict, _rev values do not match",
+                        },
+                    )
+                    results.append(DocumentRevisionError(sub_resp, request))
+                else:
+                    results.append(doc)
+            return results
+
+        return self._execute(request, response_handler)
+
+    def export(self, offset=None, limit=None, order=None, start_after=None):
         """Export all documents in the collection.
 
         :param offset: This option can be used to simulate paging.
@@ -407,10 +699,27 @@ class Collection(APIWrapper):
         :type limit: int
         :param order: Sorts the result in specified order. Allowed values are "asc" or "desc".
         :type order: str | unicode
+        :param start_after: Return the documents following this key in key
+            order (keyset pagination). Pass the key of the last document of
+            the previous page to get the next one. Unlike with **offset**, the
+            cost of a page does not depend on its position. Cannot be combined
+            with **offset**. Requires the default execution context.
+        :type start_after: str | unicode
         :returns: Documents in the collection.
         :rtype: dict
+        :raise ValueError: If **start_after** is combined with **offset** or
+            used in an execution context deferring responses (e.g. batch).
         :raise c8.exceptions.DocumentGetError: If export fails.
         """
+        if start_after is not None:
+            if offset is not None:
+                raise ValueError("offset cannot be combined with start_after")
+            return self._keyset_page(
+                after=start_after,
+                limit=1000 if limit is None else limit,
+                descending=order == "desc",
+            )
+
         data = {}
         if offset is not None:
             data["offset"] = offset
@@ -430,6 +739,135 @@ class Collection(APIWrapper):
 
         return self._execute(request, response_handler)
 
+    def iter_export(self, page_size=1000, start_after=None, order=None, fields=None):
+        """Yield all documents in the collection in key order, page by page.
+
+        Pages are read with keyset pagination, so walking the whole collection
+        is a single linear pass and only one page is held in memory.
+
+        :param page_size: Number of documents fetched in one round trip.
+        :type page_size: int
+        :param start_after: Start after this key instead of the first key.
+        :type start_after: str | unicode
+        :param order: Key order: "asc" (default) or "desc".
+        :type order: str | unicode
+        :param fields: Document fields to return (projection). The "_key" field
+            is always returned.
+        :type fields: [str | unicode]
+        :returns: Generator of documents.
+        :rtype: generator
+        :raise c8.exceptions.DocumentGetError: If export fails.
+        """
+        after = start_after
+        while True:
+            docs = self._keyset_page(
+                after=after,
+                limit=page_size,
+                fields=fields,
+                descending=order == "desc",
+            )
+            for doc in docs:
+                yield doc
+            if len(docs) < page_size:
+                return
+            after = docs[-1]["_key"]
+
+    def all(self, batch_size=1000, fields=None, prefetch=0):
+        """Return all documents in the collection using a streaming cursor.
+
+        Documents are fetched from the server in batches as the cursor is
+        iterated, so memory usage does not grow with the collection size.
+        Use the cursor as a context manager to free the server resources if
+        the iteration stops early. Iterating over the collection object itself
+        does so automatically.
+
+        :param batch_size: Number of documents fetched in one round trip.
+        :type batch_size: int
+        :param fields: Document fields to return (projection). All fields are
+            returned if not set.
+        :type fields: [str | unicode]
+        :param prefetch: Max number of batches the cursor fetches ahead in a
+            background thread. See :class:`c8.cursor.Cursor`.
+        :type prefetch: int
+        :returns: Document cursor.
+        :rtype: c8.cursor.Cursor
+        :raises c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        assert is_none_or_int(batch_size), "batch_size must be a non-negative int"
+
+        bind_vars = {"@collection": self._name}
+        if fields is None:
+            query = "FOR doc IN @@collection RETURN doc"
+        else:
+            query = "FOR doc IN @@collection RETURN KEEP(doc, @fields)"
+            bind_vars["fields"] = list(fields)
+
+        command = (
+            "db._query({}, {}).toArray()".format(dumps(query), dumps(bind_vars))
+            if self._is_transaction
+            else None
+        )
+
+        data = {"query": query, "bindVars": bind_vars, "options": {"stream": True}}
+        if batch_size is not None:
+            data["batchSize"] = batch_size
+
+        request = Request(
+            method="post",
+            endpoint="/cursor",
+            data=data,
+            command=command,
+            read=self.name,
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            return Cursor(self._conn, resp.body, prefetch=prefetch)
+
+        return self._execute(request, response_handler)
+
+    def _keyset_page(
+        self, after=None, upper=None, limit=1000, fields=None, descending=False
+    ):
+        """Return a page of documents in key order, using keyset pagination.
+
+        Unlike offset paging, the cost of a page does not depend on how many
+        documents precede it, as the primary index is used to seek to **after**.
+
+        :param after: Return documents with keys after this key, in key order.
+        :type after: str | unicode
+        :param upper: Return documents with keys lower than or equal to this
+            key.
+        :type upper: str | unicode
+        :param limit: Max number of documents returned.
+        :type limit: int
+        :param fields: Document fields to return (projection). The "_key" field
+            is always returned.
+        :type fields: [str | unicode]
+        :param descending: Walk the keys in descending order.
+        :type descending: bool
+        :returns: Documents sorted by key.
+        :rtype: [dict]
+        :raise ValueError: If the execution context defers responses.
+        :raise c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        self._check_sync_context("keyset pagination")
+        request = Request(
+            method="post",
+            endpoint="/cursor",
+            data=keyset_query(self.name, after, upper, limit, fields, descending),
+            read=self.name,
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            # Read the rest of the page if it did not fit in the first batch.
+            return list(Cursor(self._conn, resp.body))
+
+        return self._execute(request, response_handler)
+
     def find_near(self, latitude, longitude, limit=None):
         """Return documents near a given coordinate.
 
@@ -949,10 +1387,14 @@ class StandardCollection(Collection):
     :type executor: c8.executor.Executor
     :param name: Collection name.
     :type name: str | unicode
+    :param cache: Client-side document cache used by
+        :func:`c8.collection.StandardCollection.get`.
+    :type cache: c8.cache.DocumentCache
     """
 
-    def __init__(self, connection, executor, name):
+    def __init__(self, connection, executor, name, cache=None):
         super(StandardCollection, self).__init__(connection, executor, name)
+        self._cache = cache
 
     def __repr__(self):
         return "<StandardCollection {}>".format(self.name)
@@ -960,6 +1402,66 @@ class StandardCollection(Collection):
     def __getitem__(self, key):
         return self.get(key)
 
+    @property
+    def cache(self):
+        """Return the client-side document cache.
+
+        :returns: Document cache, or None if documents are not cached.
+        :rtype: c8.cache.DocumentCache | None
+        """
+        return self._cache
+
+    def bulk_writer(self, batch_size=1000, max_bytes=4 * 1024 * 1024, max_workers=4):
+        """Return a bulk writer splitting large writes into concurrent requests.
+
+        :param batch_size: Max number of documents per request.
+        :type batch_size: int
+        :param max_bytes: Max serialized size of a request body in bytes.
+        :type max_bytes: int
+        :param max_workers: Max number of requests in flight.
+        :type max_workers: int
+        :returns: Bulk writer.
+        :rtype: c8.bulk.BulkWriter
+        """
+        return BulkWriter(self, batch_size, max_bytes, max_workers)
+
+    def export_parallel(
+        self,
+        max_workers=8,
+        partitions=None,
+        boundaries=None,
+        page_size=1000,
+        ordered=False,
+        fields=None,
+    ):
+        """Export all documents, fetching key ranges of the collection
+        concurrently.
+
+        See :class:`c8.export.ParallelExporter` for details.
+
+        :param max_workers: Max number of requests in flight.
+        :type max_workers: int
+        :param partitions: Number of key ranges the collection is split into.
+            Defaults to **max_workers**.
+        :type partitions: int
+        :param boundaries: Keys splitting the collection into key ranges (e.g.
+            known shard boundaries). Computed from the collection if not set.
+        :type boundaries: [str | unicode]
+        :param page_size: Number of documents fetched in one round trip.
+        :type page_size: int
+        :param ordered: If set to True, documents are yielded in key order.
+            Otherwise they are yielded as the pages arrive.
+        :type ordered: bool
+        :param fields: Document fields to return (projection). The "_key" field
+            is always returned.
+        :type fields: [str | unicode]
+        :returns: Generator of documents.
+        :rtype: generator
+        :raise c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        exporter = ParallelExporter(self, max_workers, page_size, fields)
+        return exporter.export(partitions, boundaries, ordered)
+
     def get(self, document, rev=None, check_rev=True):
         """Return a document.
 
@@ -979,6 +1481,9 @@ class StandardCollection(Collection):
         """
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
+        if not headers and self._is_cacheable():
+            return self._get_cached(handle)
+
         command = (
             "db.{}.exists({}) || undefined".format(self.name, dumps(body))
             if self._is_transaction
@@ -1004,6 +1509,60 @@ class StandardCollection(Collection):
 
         return self._execute(request, response_handler)
 
+    def _is_cacheable(self):
+        """Return True if reads can be served from the document cache.
+
+        Cached results are returned directly, so the cache is only used in the
+        default execution context with a synchronous HTTP client.
+
+        :rtype: bool
+        """
+        return (
+            self._cache is not None
+            and self.context == "default"
+            and not iscoroutinefunction(self._conn.http_client.send_request)
+        )
+
+    def _get_cached(self, handle):
+        """Return a document through the document cache.
+
+        :param handle: Document ID.
+        :type handle: str | unicode
+        :returns: Document, or None if not found.
+        :rtype: dict | None
+        :raise c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        cache = self._cache
+        cached = cache.lookup(handle)
+        if cached is not None and cached[2]:
+            return cached[0]
+
+        generation = cache.generation(handle)
+        headers = {}
+        if cached is not None and cache.revalidate and cached[1] is not None:
+            headers["If-None-Match"] = cached[1]
+
+        request = Request(
+            method="get",
+            endpoint="/document/{}".format(handle),
+            headers=headers,
+            read=self.name,
+        )
+
+        def response_handler(resp):
+            if resp.status_code == 304:
+                cache.refresh(handle)
+                return cached[0]
+            if resp.error_code == 1202:
+                cache.invalidate(handle)
+                return None
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            cache.put(handle, resp.body, generation)
+            return resp.body
+
+        return self._execute(request, response_handler)
+
     def insert_from_file(self, filepath, return_new=False, sync=None, silent=False):
         """Insert a documents from csv file.
         :param filepath: CSV or JSON file path which contains documents
@@ -1065,8 +1624,9 @@ class StandardCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(document)
         command = (
-            "db.{}.insert({},{})".format(self.name, dumps(document), dumps(params))
+            "db.{}.insert({},{})".format(self.name, data, dumps(params))
             if self._is_transaction
             else None
         )
@@ -1074,7 +1634,7 @@ class StandardCollection(Collection):
         request = Request(
             method="post",
             endpoint="/document/{}".format(self.name),
-            data=document,
+            data=data,
             params=params,
             command=command,
             write=self.name,
@@ -1096,7 +1656,12 @@ class StandardCollection(Collection):
         :param documents: List of new documents to insert. If they contain the
             "_key" or "_id" fields, the values are used as the keys of the new
             documents (auto-generated otherwise). Any "_rev" field is ignored.
-        :type documents: [dict]
+            Documents already encoded as JSON (a JSON array as bytes or
+            memoryview, or an iterable of JSON documents as bytes or strings)
+            are sent as is, without being parsed or validated. Iterators (e.g.
+            generators) are streamed with chunked transfer encoding, so that
+            they are never held in memory at once.
+        :type documents: [dict] | bytes | memoryview | [bytes | str | unicode]
         :param return_new: Include bodies of the new documents in the returned
             metadata. Ignored if parameter **silent** is set to True
         :type return_new: bool
@@ -1110,14 +1675,18 @@ class StandardCollection(Collection):
         :rtype: [dict | C8Error] | bool
         :raise c8.exceptions.DocumentInsertError: If insert fails.
         """
-        documents = [self._ensure_key_from_id(doc) for doc in documents]
-
         params = {"returnNew": return_new, "silent": silent}
         if sync is not None:
             params["waitForSync"] = sync
 
+        if self._can_stream(documents):
+            data = self._stream_documents(documents, self._ensure_key_from_id)
+        else:
+            data = self._serialize_documents(documents, self._ensure_key_from_id)
         command = (
-            "db.{}.insert({},{})".format(self.name, dumps(documents), dumps(params))
+            "db.{}.insert({},{})".format(
+                self.name, self._payload_text(data), dumps(params)
+            )
             if self._is_transaction
             else None
         )
@@ -1125,7 +1694,7 @@ class StandardCollection(Collection):
         request = Request(
             method="post",
             endpoint="/document/{}".format(self.name),
-            data=documents,
+            data=data,
             params=params,
             command=command,
             write=self.name,
@@ -1208,18 +1777,21 @@ class StandardCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(document)
         command = (
             "db.{col}.update({doc},{doc},{opts})".format(
-                col=self.name, doc=dumps(document), opts=dumps(params)
+                col=self.name, doc=data, opts=dumps(params)
             )
             if self._is_transaction
             else None
         )
 
+        self._uncache([document])
+
         request = Request(
             method="patch",
             endpoint="/document/{}".format(self._extract_id(document)),
-            data=document,
+            data=data,
             params=params,
             command=command,
             write=self.name,
@@ -1235,7 +1807,7 @@ class StandardCollection(Collection):
             resp.body["_old_rev"] = resp.body.pop("_oldRev")
             return resp.body
 
-        return self._execute(request, response_handler)
+        return self._execute(request, self._uncache_after(response_handler, [document]))
 
     def update_many(
         self,
@@ -1254,8 +1826,11 @@ class StandardCollection(Collection):
         result list instead of document metadata.
 
         :param documents: Partial or full documents with the updated values.
-            They must contain the "_id" or "_key" fields.
-        :type documents: [dict]
+            They must contain the "_id" or "_key" fields. Documents already
+            encoded as JSON (a JSON array as bytes or memoryview, or an
+            iterable of JSON documents as bytes or strings) are sent as is and
+            must contain "_key".
+        :type documents: [dict] | bytes | memoryview | [bytes | str | unicode]
         :param check_rev: If set to True, revisions of **documents** (if given)
             are compared against the revisions of target documents.
         :type check_rev: bool
@@ -1291,19 +1866,21 @@ class StandardCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [self._ensure_key_in_body(doc) for doc in documents]
+        data = self._serialize_documents(documents, self._ensure_key_in_body)
         command = (
             "db.{col}.update({docs},{docs},{opts})".format(
-                col=self.name, docs=dumps(documents), opts=dumps(params)
+                col=self.name, docs=self._payload_text(data), opts=dumps(params)
             )
             if self._is_transaction
             else None
         )
 
+        self._uncache(documents, keys=False)
+
         request = Request(
             method="patch",
             endpoint="/document/{}".format(self.name),
-            data=documents,
+            data=data,
             params=params,
             command=command,
             write=self.name,
@@ -1336,7 +1913,7 @@ class StandardCollection(Collection):
 
             return results
 
-        return self._execute(request, response_handler)
+        return self._execute(request, self._uncache_after(response_handler, documents))
 
     def replace(
         self,
@@ -1381,19 +1958,22 @@ class StandardCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(document)
         command = (
             "db.{col}.replace({doc},{doc},{opts})".format(
-                col=self.name, doc=dumps(document), opts=dumps(params)
+                col=self.name, doc=data, opts=dumps(params)
             )
             if self._is_transaction
             else None
         )
 
+        self._uncache([document])
+
         request = Request(
             method="put",
             endpoint="/document/{}".format(self._extract_id(document)),
             params=params,
-            data=document,
+            data=data,
             command=command,
             write=self.name,
         )
@@ -1408,7 +1988,7 @@ class StandardCollection(Collection):
             resp.body["_old_rev"] = resp.body.pop("_oldRev")
             return resp.body
 
-        return self._execute(request, response_handler)
+        return self._execute(request, self._uncache_after(response_handler, [document]))
 
     def replace_many(
         self,
@@ -1426,8 +2006,10 @@ class StandardCollection(Collection):
 
         :param documents: New documents to replace the old ones with. They must
             contain the "_id" or "_key" fields. Edge documents must also have
-            "_from" and "_to" fields.
-        :type documents: [dict]
+            "_from" and "_to" fields. Documents already encoded as JSON (a JSON
+            array as bytes or memoryview, or an iterable of JSON documents as
+            bytes or strings) are sent as is and must contain "_key".
+        :type documents: [dict] | bytes | memoryview | [bytes | str | unicode]
         :param check_rev: If set to True, revisions of **documents** (if given)
             are compared against the revisions of target documents.
         :type check_rev: bool
@@ -1455,20 +2037,22 @@ class StandardCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [self._ensure_key_in_body(doc) for doc in documents]
+        data = self._serialize_documents(documents, self._ensure_key_in_body)
         command = (
             "db.{col}.replace({docs},{docs},{opts})".format(
-                col=self.name, docs=dumps(documents), opts=dumps(params)
+                col=self.name, docs=self._payload_text(data), opts=dumps(params)
             )
             if self._is_transaction
             else None
         )
 
+        self._uncache(documents, keys=False)
+
         request = Request(
             method="put",
             endpoint="/document/{}".format(self.name),
             params=params,
-            data=documents,
+            data=data,
             command=command,
             write=self.name,
         )
@@ -1500,7 +2084,9 @@ class StandardCollection(Collection):
 
             return results
 
-        return self._execute(request, response_handler)
+        return self._execute(
+            request, self._uncache_after(response_handler, documents, keys=False)
+        )
 
     def delete(
         self,
@@ -1559,6 +2145,8 @@ class StandardCollection(Collection):
             else None
         )
 
+        self._uncache([document])
+
         request = Request(
             method="delete",
             endpoint="/document/{}".format(handle),
@@ -1577,7 +2165,7 @@ class StandardCollection(Collection):
                 raise DocumentDeleteError(resp, request)
             return True if silent else resp.body
 
-        return self._execute(request, response_handler)
+        return self._execute(request, self._uncache_after(response_handler, [document]))
 
     def delete_many(
         self, documents, return_old=False, check_rev=True, sync=None, silent=False
@@ -1588,8 +2176,10 @@ class StandardCollection(Collection):
         result list instead of document metadata.
 
         :param documents: Document IDs, keys or bodies. Document bodies must
-            contain the "_id" or "_key" fields.
-        :type documents: [str | unicode | dict]
+            contain the "_id" or "_key" fields. IDs, keys or bodies already
+            encoded as JSON must be given as bytes-like objects, and are sent
+            as is.
+        :type documents: [str | unicode | dict | bytes]
         :param return_old: Include bodies of the old documents in the result.
         :type return_old: bool
         :param check_rev: If set to True, revisions of **documents** (if given)
@@ -1618,17 +2208,25 @@ class StandardCollection(Collection):
             self._ensure_key_in_body(doc) if isinstance(doc, dict) else doc
             for doc in documents
         ]
+        if documents and isinstance(documents[0], RAW_JSON_TYPES):
+            data = b"[" + b",".join(documents) + b"]"
+        else:
+            data = dumps(documents)
         command = (
-            "db.{}.remove({},{})".format(self.name, dumps(documents), dumps(params))
+            "db.{}.remove({},{})".format(
+                self.name, self._payload_text(data), dumps(params)
+            )
             if self._is_transaction
             else None
         )
 
+        self._uncache(documents)
+
         request = Request(
             method="delete",
             endpoint="/document/{}".format(self.name),
             params=params,
-            data=documents,
+            data=data,
             command=command,
             write=self.name,
         )
@@ -1658,7 +2256,7 @@ class StandardCollection(Collection):
 
             return results
 
-        return self._execute(request, response_handler)
+        return self._execute(request, self._uncache_after(response_handler, documents))
 
     def import_bulk(self, documents, details=True, primaryKey=None, replace=False):
         """Insert multiple documents into the collection.
@@ -1669,7 +2267,12 @@ class StandardCollection(Collection):
         :param documents: List of new documents to insert. If they contain the
             "_key" or "_id" fields, the values are used as the keys of the new
             documents (auto-generated otherwise). Any "_rev" field is ignored.
-        :type documents: [dict]
+            Documents already encoded as JSON (a JSON array as bytes or
+            memoryview, or an iterable of JSON documents as bytes or strings)
+            are sent as is, without being parsed or validated. Iterators (e.g.
+            generators) are streamed with chunked transfer encoding, so that
+            they are never held in memory at once.
+        :type documents: [dict] | bytes | memoryview | [bytes | str | unicode]
         :param details: If set to True, the returned result will include an
             additional list of detailed error messages.
         :type details: bool
@@ -1685,16 +2288,35 @@ class StandardCollection(Collection):
         :rtype: dict
         :raise c8.exceptions.DocumentInsertError: If import fails.
         """
-        data = {}
-        documents = [self._ensure_key_from_id(doc) for doc in documents]
-        data["data"] = documents
-
+        options = {}
         if details is not None:
-            data["details"] = details
+            options["details"] = details
         if primaryKey is not None:
-            data["primaryKey"] = primaryKey
+            options["primaryKey"] = primaryKey
         if replace is not None:
-            data["replace"] = replace
+            options["replace"] = replace
+
+        # Splice the serialized documents into the body rather than
+        # re-serializing them as part of a dict.
+        options = dumps(options).encode("utf-8")
+        suffix = b"," + options[1:] if len(options) > 2 else b"}"
+        if self._can_stream(documents):
+            data = self._stream_documents(
+                documents,
+                self._ensure_key_from_id,
+                prefix=b'{"data":[',
+                suffix=b"]" + suffix,
+            )
+        else:
+            documents = self._serialize_documents(
+                documents, self._ensure_key_from_id
+            )
+            if isinstance(documents, string_types):
+                documents = documents.encode("utf-8")
+            data = b"".join([b'{"data":', documents, suffix])
+
+        if replace:
+            self._uncache(None)
 
         request = Request(
             method="post", endpoint="/import/{}".format(self.name), data=data
@@ -1705,6 +2327,8 @@ class StandardCollection(Collection):
                 raise DocumentInsertError(resp, request)
             return resp.body
 
+        if replace:
+            response_handler = self._uncache_after(response_handler, None)
         return self._execute(request, response_handler)
 
 
@@ -1809,9 +2433,10 @@ class VertexCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(vertex)
         command = (
             'gm._graph("{}").{}.save({},{})'.format(
-                self.graph, self.name, dumps(vertex), dumps(params)
+                self.graph, self.name, data, dumps(params)
             )
             if self._is_transaction
             else None
@@ -1820,7 +2445,7 @@ class VertexCollection(Collection):
         request = Request(
             method="post",
             endpoint="/graph/{}/vertex/{}".format(self._graph, self.name),
-            data=vertex,
+            data=data,
             params=params,
             command=command,
             write=self.name,
@@ -1866,9 +2491,10 @@ class VertexCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(vertex)
         command = (
             'gm._graph("{}").{}.update("{}",{},{})'.format(
-                self.graph, self.name, vertex_id, dumps(vertex), dumps(params)
+                self.graph, self.name, vertex_id, data, dumps(params)
             )
             if self._is_transaction
             else None
@@ -1879,7 +2505,7 @@ class VertexCollection(Collection):
             endpoint="/graph/{}/vertex/{}".format(self._graph, vertex_id),
             headers=headers,
             params=params,
-            data=vertex,
+            data=data,
             command=command,
             write=self.name,
         )
@@ -1926,9 +2552,10 @@ class VertexCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(vertex)
         command = (
             'gm._graph("{}").{}.replace("{}",{},{})'.format(
-                self.graph, self.name, vertex_id, dumps(vertex), dumps(params)
+                self.graph, self.name, vertex_id, data, dumps(params)
             )
             if self._is_transaction
             else None
@@ -1939,7 +2566,7 @@ class VertexCollection(Collection):
             endpoint="/graph/{}/vertex/{}".format(self._graph, vertex_id),
             headers=headers,
             params=params,
-            data=vertex,
+            data=data,
             command=command,
             write=self.name,
         )
@@ -2119,13 +2746,14 @@ class EdgeCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(edge)
         command = (
             'gm._graph("{}").{}.save("{}","{}",{},{})'.format(
                 self.graph,
                 self.name,
                 edge["_from"],
                 edge["_to"],
-                dumps(edge),
+                data,
                 dumps(params),
             )
             if self._is_transaction
@@ -2135,7 +2763,7 @@ class EdgeCollection(Collection):
         request = Request(
             method="post",
             endpoint="/graph/{}/edge/{}".format(self._graph, self.name),
-            data=edge,
+            data=data,
             params=params,
             command=command,
             write=self.name,
@@ -2181,9 +2809,10 @@ class EdgeCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(edge)
         command = (
             'gm._graph("{}").{}.update("{}",{},{})'.format(
-                self.graph, self.name, edge_id, dumps(edge), dumps(params)
+                self.graph, self.name, edge_id, data, dumps(params)
             )
             if self._is_transaction
             else None
@@ -2194,7 +2823,7 @@ class EdgeCollection(Collection):
             endpoint="/graph/{}/edge/{}".format(self._graph, edge_id),
             headers=headers,
             params=params,
-            data=edge,
+            data=data,
             command=command,
             write=self.name,
         )
@@ -2242,9 +2871,10 @@ class EdgeCollection(Collection):
         if sync is not None:
             params["waitForSync"] = sync
 
+        data = dumps(edge)
         command = (
             'gm._graph("{}").{}.replace("{}",{},{})'.format(
-                self.graph, self.name, edge_id, dumps(edge), dumps(params)
+                self.graph, self.name, edge_id, data, dumps(params)
             )
             if self._is_transaction
             else None
@@ -2255,7 +2885,7 @@ class EdgeCollection(Collection):
             endpoint="/graph/{}/edge/{}".format(self._graph, edge_id),
             headers=headers,
             params=params,
-            data=edge,
+            data=data,
             command=command,
             write=self.name,
         )
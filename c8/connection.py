@@ -1,10 +1,14 @@
 from __future__ import absolute_import, unicode_literals
 
-import json
+import copy
+import functools
+import inspect
 
 import requests
 
 import c8.constants as constants
+from c8.cache import MetadataCache, QueryCache
+from c8.codec import dumps, loads
 from c8.exceptions import (
     C8AuthenticationError,
     C8TenantNotFoundError,
@@ -15,6 +19,22 @@ from c8.http import DefaultHTTPClient
 __all__ = ["Connection"]
 
 
+@functools.lru_cache(maxsize=None)
+def _send_request_options(send_request):
+    """Return the optional arguments accepted by an HTTP client.
+
+    :param send_request: send_request method of the HTTP client class.
+    :type send_request: callable
+    :returns: Names among "timeout", "idempotent" and "stream".
+    :rtype: frozenset
+    """
+    names = frozenset(["timeout", "idempotent", "stream"])
+    params = inspect.signature(send_request).parameters.values()
+    if any(param.kind == param.VAR_KEYWORD for param in params):
+        return names
+    return names.intersection(param.name for param in params)
+
+
 class Connection(object):
     """HTTP connection to specific C8 tenant.
 
@@ -31,10 +51,32 @@ class Connection(object):
     :param is_fabric: Whether this a DB or streams call.
                       Anything other than streams is a DB call.
     :type is_fabric: bool
+    :param metadata_cache: Cache of collection and stream names used for
+        existence checks. Defaults to a disabled cache (TTL of 0), so that
+        every check lists the names.
+    :type metadata_cache: c8.cache.MetadataCache
+    :param query_cache: Cache of query results (see
+        :attr:`c8.c8ql.C8QL.cache`). Defaults to an empty cache.
+    :type query_cache: c8.cache.QueryCache
     """
 
-    def __init__(self, url, email, password, token, apikey, http_client, skip_tenant=False):
+    def __init__(
+        self,
+        url,
+        email,
+        password,
+        token,
+        apikey,
+        http_client,
+        skip_tenant=False,
+        metadata_cache=None,
+        query_cache=None,
+    ):
         self.url = url
+        self._metadata_cache = (
+            MetadataCache(ttl=0) if metadata_cache is None else metadata_cache
+        )
+        self._query_cache = QueryCache() if query_cache is None else query_cache
         self._tenant_name = ""
         self._fabric_name = constants.FABRIC_DEFAULT
         self._email = email
@@ -64,7 +106,7 @@ class Connection(object):
                 tenurl = self.url + "/_api/user"
                 response = requests.get(url=tenurl, headers=headers)
                 if response.status_code == 200:
-                    body = json.loads(response.text)
+                    body = loads(response.text)
                     self._tenant_name = body["result"][0]["tenant"]
 
         if self._tenant_name == "" and self._apikey is not None:
@@ -74,7 +116,7 @@ class Connection(object):
                 tenurl = self.url + "/_api/user"
                 response = requests.get(url=tenurl, headers=headers)
                 if response.status_code == 200:
-                    body = json.loads(response.text)
+                    body = loads(response.text)
                     self._tenant_name = body["result"][0]["tenant"]
 
         self._url_prefix = "{}/_fabric/{}/_api".format(url, self._fabric_name)
@@ -96,12 +138,12 @@ class Connection(object):
         else:
             data = {"email": self._email, "password": self._password}
 
-        data = json.dumps(data)
+        data = dumps(data)
         url = self.url + "/_open/auth"
         response = requests.post(url, data=data)
 
         if response.status_code == 200:
-            body = json.loads(response.text)
+            body = loads(response.text)
             tenant = body.get("tenant")
             token = body.get("jwt")
             if not tenant:
@@ -175,9 +217,65 @@ class Connection(object):
         self._url_prefix = new_prefix
         # return old_prefix, self._url_prefix
 
+    @property
+    def http_client(self):
+        """Return the HTTP client used to send requests.
+
+        :returns: HTTP client.
+        :rtype: c8.http.HTTPClient
+        """
+        return self._http_client
+
+    @property
+    def metadata_cache(self):
+        """Return the cache of collection and stream names.
+
+        :returns: Metadata cache.
+        :rtype: c8.cache.MetadataCache
+        """
+        return self._metadata_cache
+
+    @property
+    def query_cache(self):
+        """Return the cache of query results.
+
+        :returns: Query cache.
+        :rtype: c8.cache.QueryCache
+        """
+        return self._query_cache
+
+    def metadata_key(self, kind, *extra):
+        """Return the metadata cache key of a name list of the current fabric.
+
+        :param kind: List kind (e.g. "collections").
+        :type kind: str | unicode
+        :returns: Cache key.
+        :rtype: tuple
+        """
+        return (self._tenant_name, self._fabric_name, kind) + extra
+
+    def with_http_client(self, http_client):
+        """Return a copy of this connection which uses another HTTP client.
+
+        The copy shares the credentials, tenant and URL prefix of this
+        connection at the time of the call.
+
+        :param http_client: HTTP client for the new connection.
+        :type http_client: c8.http.HTTPClient
+        :returns: HTTP connection.
+        :rtype: c8.connection.Connection
+        """
+        conn = copy.copy(self)
+        conn._http_client = http_client
+        return conn
+
     def send_request(self, request, custom_prefix=None):
         """Send an HTTP request to C8 server.
 
+        If the HTTP client is asyncio based (e.g.
+        :class:`c8.http.AsyncIOHTTPClient`), the returned value is an awaitable
+        which resolves to the HTTP response.
+
         :param request: HTTP request.
         :type request: c8.request.Request
         :param custom_prefix: Custom url-path value
@@ -210,12 +308,23 @@ class Connection(object):
             headers["Authorization"] = "bearer " + self._auth_token
 
         self._header = headers
+        # Custom HTTP clients written before these options were added to the
+        # HTTPClient interface do not accept them.
+        options = _send_request_options(type(self._http_client).send_request)
+        kwargs = {}
+        if request.timeout is not None and "timeout" in options:
+            kwargs["timeout"] = request.timeout
+        if request.idempotent is not None and "idempotent" in options:
+            kwargs["idempotent"] = request.idempotent
+        if request.stream and "stream" in options:
+            kwargs["stream"] = True
         return self._http_client.send_request(
             method=request.method,
             url=final_url,
             params=request.params,
             data=request.data,
             headers=headers,
+            **kwargs
         )
 
 
@@ -226,7 +335,18 @@ class TenantConnection(Connection):
     :type connection: c8.connection.Connection
     """
 
-    def __init__(self, url, email, password, token, apikey, http_client, skip_tenant=False):
+    def __init__(
+        self,
+        url,
+        email,
+        password,
+        token,
+        apikey,
+        http_client,
+        skip_tenant=False,
+        metadata_cache=None,
+        query_cache=None,
+    ):
         super(TenantConnection, self).__init__(
             url=url,
             email=email,
@@ -235,6 +355,8 @@ class TenantConnection(Connection):
             apikey=apikey,
             http_client=http_client,
             skip_tenant=skip_tenant,
+            metadata_cache=metadata_cache,
+            query_cache=query_cache,
         )
         self._fqfabric_name = self._tenant_name + "." + self._fabric_name
 
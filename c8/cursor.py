@@ -1,6 +1,11 @@
 from __future__ import absolute_import, unicode_literals
 
+import threading
+import weakref
 from collections import deque
+from inspect import isawaitable, iscoroutinefunction
+
+from six.moves import queue
 
 from c8.exceptions import (
     CursorCloseError,
@@ -24,12 +29,21 @@ class Cursor(object):
     you must be mindful of client-side memory capacity when running queries
     that can potentially return a large result set.
 
+    With **prefetch** set, a background thread fetches up to that many batches
+    ahead while the current batch is being consumed, so the network round
+    trips overlap with the processing of results. Prefetched batches are held
+    in a bounded queue: at most **prefetch** batches besides the current one
+    are kept in memory. Prefetching is ignored with asyncio HTTP clients.
+
     :param connection: HTTP connection.
     :type connection: c8.connection.Connection
     :param init_data: Cursor initialization data.
     :type init_data: dict | list
     :param cursor_type: Cursor type ("cursor" or "export").
     :type cursor_type: str | unicode
+    :param prefetch: Max number of batches fetched ahead in the background.
+        Set to 0 to fetch batches on demand.
+    :type prefetch: int
     """
 
     __slots__ = [
@@ -43,9 +57,13 @@ class Cursor(object):
         "_has_more",
         "_batch",
         "_count",
+        "_queue",
+        "_worker",
+        "_stopped",
+        "__weakref__",
     ]
 
-    def __init__(self, connection, init_data, cursor_type="cursor"):
+    def __init__(self, connection, init_data, cursor_type="cursor", prefetch=0):
         self._conn = connection
         self._type = cursor_type
         self._batch = deque()
@@ -54,6 +72,9 @@ class Cursor(object):
         self._cached = None
         self._profile = None
         self._warnings = None
+        self._queue = None
+        self._worker = None
+        self._stopped = None
 
         if isinstance(init_data, list):
             # In transactions, cursor initialization data is a list containing
@@ -65,6 +86,13 @@ class Cursor(object):
             # In other execution contexts, cursor initialization data is a dict
             # containing cursor metadata (e.g. ID, parameters).
             self._update(init_data)
+            if (
+                prefetch > 0
+                and self._has_more
+                and self._id is not None
+                and not iscoroutinefunction(connection.http_client.send_request)
+            ):
+                self._start_prefetch(prefetch)
 
     def __iter__(self):
         return self
@@ -81,6 +109,26 @@ class Cursor(object):
     def __exit__(self, *_):
         self.close(ignore_missing=True)
 
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.empty():
+            if not self.has_more():
+                raise StopAsyncIteration
+            result = self.fetch()
+            if isawaitable(result):
+                await result
+        return self.pop()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        result = self.close(ignore_missing=True)
+        if isawaitable(result):
+            await result
+
     def __repr__(self):
         return "<Cursor {}>".format(self._id) if self._id else "<Cursor>"
 
@@ -121,6 +169,92 @@ class Cursor(object):
 
         return result
 
+    def _start_prefetch(self, prefetch):
+        """Start the background thread fetching the next batches.
+
+        :param prefetch: Max number of batches fetched ahead.
+        :type prefetch: int
+        """
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stopped = threading.Event()
+        # The worker only holds a weak reference to the cursor, and is stopped
+        # when the cursor is garbage collected without being closed.
+        weakref.finalize(self, self._stopped.set)
+        self._worker = threading.Thread(
+            target=Cursor._prefetch,
+            args=(
+                weakref.ref(self),
+                self._conn,
+                self._id,
+                self._queue,
+                self._stopped,
+            ),
+            name="c8-cursor-{}".format(self._id),
+        )
+        self._worker.daemon = True
+        self._worker.start()
+
+    @staticmethod
+    def _prefetch(ref, connection, cursor_id, batches, stopped):
+        """Fetch batches into the queue until the result set is depleted.
+
+        Each queued item is either the cursor data of a batch or the
+        exception raised while fetching it, which stops the prefetching. If
+        the cursor is garbage collected before the result set is depleted, the
+        server-side cursor is deleted.
+
+        :param ref: Weak reference to the cursor.
+        :type ref: weakref.ref
+        :param connection: HTTP connection.
+        :type connection: c8.connection.Connection
+        :param cursor_id: Cursor ID.
+        :type cursor_id: str | unicode
+        :param batches: Queue of prefetched batches.
+        :type batches: queue.Queue
+        :param stopped: Event set when the prefetching must stop.
+        :type stopped: threading.Event
+        """
+        has_more = True
+        while has_more and not stopped.is_set():
+            request = Request(
+                method="put",
+                endpoint="/cursor/{}".format(cursor_id),
+                idempotent=False,
+            )
+            try:
+                resp = connection.send_request(request)
+                if not resp.is_success:
+                    raise CursorNextError(resp, request)
+                item = resp.body
+                has_more = item["hasMore"]
+            except Exception as err:
+                item = err
+                has_more = False
+
+            # Wake up regularly to notice the cursor being closed.
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+        if has_more and ref() is None:
+            request = Request(method="delete", endpoint="/cursor/{}".format(cursor_id))
+            try:
+                connection.send_request(request)
+            except Exception:
+                pass
+
+    def _stop_prefetch(self):
+        """Stop the background thread and drop the prefetched batches."""
+        if self._worker is None:
+            return
+        self._stopped.set()
+        self._worker.join()
+        self._worker = None
+        self._queue = None
+
     @property
     def id(self):
         """Return the cursor ID.
@@ -240,13 +374,41 @@ class Cursor(object):
         """
         if self._id is None:
             raise CursorStateError("cursor ID not set")
-        request = Request(method="put", endpoint="/cursor/{}".format(self._id))
+        if self._worker is not None and self._has_more:
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                # Later batches are fetched on demand again.
+                self._stop_prefetch()
+                raise item
+            return self._update(item)
+        request = Request(
+            method="put",
+            endpoint="/cursor/{}".format(self._id),
+            idempotent=False,
+        )
         resp = self._conn.send_request(request)
+        if isawaitable(resp):
+            return self._fetch_async(resp, request)
 
         if not resp.is_success:
             raise CursorNextError(resp, request)
         return self._update(resp.body)
 
+    async def _fetch_async(self, resp, request):
+        """Await the next batch when using an asyncio HTTP client.
+
+        :param resp: Awaitable HTTP response.
+        :type resp: collections.abc.Awaitable
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :return: New batch details.
+        :rtype: dict
+        """
+        resp = await resp
+        if not resp.is_success:
+            raise CursorNextError(resp, request)
+        return self._update(resp.body)
+
     def close(self, ignore_missing=False):
         """Close the cursor and free any server resources tied to it.
 
@@ -262,8 +424,29 @@ class Cursor(object):
         """
         if self._id is None:
             return None
+        self._stop_prefetch()
         request = Request(method="delete", endpoint="/cursor/{}".format(self._id))
         resp = self._conn.send_request(request)
+        if isawaitable(resp):
+            return self._close_async(resp, request, ignore_missing)
+        return self._handle_close(resp, request, ignore_missing)
+
+    async def _close_async(self, resp, request, ignore_missing):
+        """Await the cursor deletion when using an asyncio HTTP client.
+
+        :param resp: Awaitable HTTP response.
+        :type resp: collections.abc.Awaitable
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param ignore_missing: Do not raise exception on missing cursors.
+        :type ignore_missing: bool
+        :return: True if cursor was closed successfully.
+        :rtype: bool
+        """
+        return self._handle_close(await resp, request, ignore_missing)
+
+    @staticmethod
+    def _handle_close(resp, request, ignore_missing):
         if resp.is_success:
             return True
         if resp.status_code == 404 and ignore_missing:
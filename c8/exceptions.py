@@ -293,6 +293,10 @@ class AsyncJobClearError(C8ServerError):
     """Failed to clear async job results."""
 
 
+class AsyncJobTimeoutError(C8ClientError):
+    """Async jobs were not done before the timeout."""
+
+
 ##############################
 # Batch Execution Exceptions #
 ##############################
@@ -310,6 +314,41 @@ class BatchExecuteError(C8ServerError):
     """Failed to execute batch API request."""
 
 
+###################################
+# Concurrent Execution Exceptions #
+###################################
+
+
+class ConcurrentStateError(C8ClientError):
+    """The concurrent executor was in a bad state."""
+
+
+#####################################
+# Write-Behind Execution Exceptions #
+#####################################
+
+
+class WriteBehindStateError(C8ClientError):
+    """The write-behind executor was in a bad state."""
+
+
+####################################
+# Transaction Execution Exceptions #
+####################################
+
+
+class TransactionStateError(C8ClientError):
+    """The transaction object was in a bad state."""
+
+
+class TransactionJobResultError(C8ClientError):
+    """Failed to retrieve transaction job result."""
+
+
+class TransactionExecuteError(C8ServerError):
+    """Failed to execute transaction API request"""
+
+
 #########################
 # Collection Exceptions #
 #########################
@@ -1,18 +1,37 @@
 from __future__ import absolute_import, unicode_literals
 
+import threading
+import time
 from collections import OrderedDict
-from uuid import uuid4
-
-from c8.exceptions import AsyncExecuteError, BatchExecuteError, BatchStateError
-from c8.job import AsyncJob, BatchJob
+from concurrent.futures import Future, ThreadPoolExecutor
+from inspect import isawaitable
+
+from six import string_types
+
+from c8.codec import dumps, loads
+from c8.exceptions import (
+    AsyncExecuteError,
+    BatchExecuteError,
+    BatchStateError,
+    ConcurrentStateError,
+    TransactionExecuteError,
+    TransactionStateError,
+    WriteBehindStateError,
+)
+from c8.job import AsyncJob, BatchJob, TransactionJob
+from c8.multipart import MultipartWriter, iter_multipart
 from c8.request import Request
 from c8.response import Response
 from c8.utils import suppress_warning
 
 __all__ = [
     "DefaultExecutor",
+    "AsyncIOExecutor",
     "AsyncExecutor",
     "BatchExecutor",
+    "TransactionExecutor",
+    "ConcurrentExecutor",
+    "WriteBehindExecutor",
 ]
 
 
@@ -59,6 +78,9 @@ class DefaultExecutor(Executor):
     def execute(self, request, response_handler, custom_prefix=None):
         """Execute an API request and return the result.
 
+        If the connection uses an asyncio HTTP client (see
+        :class:`c8.http.AsyncIOHTTPClient`), an awaitable is returned instead.
+
         :param request: HTTP request.
         :type request: c8.request.Request
         :param response_handler: HTTP response handler.
@@ -69,8 +91,57 @@ class DefaultExecutor(Executor):
         :rtype: str | unicode | bool | int | list | dict
         """
         response = self._conn.send_request(request, custom_prefix=custom_prefix)
+        if isawaitable(response):
+            return self._handle_awaitable(response, response_handler)
         return response_handler(response)
 
+    @staticmethod
+    async def _handle_awaitable(response, response_handler):
+        """Await the HTTP response and pass it to the response handler.
+
+        :param response: Awaitable HTTP response.
+        :type response: collections.abc.Awaitable
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: API execution result.
+        :rtype: str | unicode | bool | int | list | dict
+        """
+        return response_handler(await response)
+
+
+class AsyncIOExecutor(DefaultExecutor):
+    """Asyncio API executor.
+
+    Every API execution returns an awaitable, so that many requests can be in
+    flight on a single event loop. The connection must use an asyncio HTTP
+    client such as :class:`c8.http.AsyncIOHTTPClient`.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    """
+
+    context = "asyncio"
+
+    def __init__(self, connection):
+        super(AsyncIOExecutor, self).__init__(connection)
+
+    def execute(self, request, response_handler, custom_prefix=None):
+        """Execute an API request on the running event loop.
+
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :param custom_prefix: Custom url-path value
+        :type custom_prefix: str
+        :return: Awaitable API execution result.
+        :rtype: collections.abc.Awaitable
+        """
+        response = self._conn.send_request(request, custom_prefix=custom_prefix)
+        if not isawaitable(response):
+            raise TypeError("asyncio execution requires an asyncio HTTP client")
+        return self._handle_awaitable(response, response_handler)
+
 
 class AsyncExecutor(Executor):
     """Async API Executor.
@@ -126,13 +197,22 @@ class BatchExecutor(Executor):
         If set to False, API executions return None and no results are tracked
         client-side.
     :type return_result: bool
+    :param max_batch_size: Max number of requests sent in one batch API
+        request. Larger batches are split into several batch API requests.
+    :type max_batch_size: int | None
+    :param max_batch_bytes: Max size in bytes of one batch API request.
+    :type max_batch_bytes: int | None
     """
 
     context = "batch"
 
-    def __init__(self, connection, return_result):
+    def __init__(
+        self, connection, return_result, max_batch_size=1000, max_batch_bytes=16 << 20
+    ):
         super(BatchExecutor, self).__init__(connection)
         self._return_result = return_result
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
         self._queue = OrderedDict()
         self._committed = False
 
@@ -148,28 +228,39 @@ class BatchExecutor(Executor):
             return None
         return [job for _, job in self._queue.values()]
 
-    def execute(self, request, response_handler):
+    def execute(self, request, response_handler, custom_prefix=None):
         """Place the request in the batch queue.
 
         :param request: HTTP request.
         :type request: c8.request.Request
         :param response_handler: HTTP response handler.
         :type response_handler: callable
+        :param custom_prefix: Custom url-path value. Not supported in batches.
+        :type custom_prefix: str | unicode | None
         :return: Batch job or None if **return_result** parameter was set to
             False during initialization.
         :rtype: c8.job.BatchJob | None
         :raise c8.exceptions.BatchStateError: If batch was already
-            committed.
+            committed, or if a custom url-path is given.
         """
         if self._committed:
             raise BatchStateError("batch already committed")
+        if custom_prefix is not None:
+            raise BatchStateError("custom url-path not supported in batches")
 
         job = BatchJob(response_handler)
         self._queue[job.id] = (request, job)
         return job if self._return_result else None
 
     def commit(self):
-        """Execute the queued requests in a single batch API request.
+        """Execute the queued requests in batch API requests.
+
+        The requests are streamed to the server, in as many batch API requests
+        as needed to stay within **max_batch_size** and **max_batch_bytes**.
+        The responses are parsed as they arrive if the HTTP client streams
+        them (see :class:`c8.http.DefaultHTTPClient`). If a batch API request
+        fails, the requests sent in the previous ones have been executed
+        already.
 
         If **return_result** parameter was set to True during initialization,
         :class:`c8.job.BatchJob` instances are populated with results.
@@ -187,64 +278,620 @@ class BatchExecutor(Executor):
 
         self._committed = True
 
+        writer = MultipartWriter(
+            ((job_id, req) for job_id, (req, _) in self._queue.items()),
+            max_parts=self._max_batch_size,
+            max_bytes=self._max_batch_bytes,
+        )
+        while writer.has_more():
+            request = Request(
+                method="post",
+                endpoint="/batch",
+                headers={"Content-Type": writer.content_type},
+                data=writer.body(),
+                stream=self._return_result,
+            )
+            with suppress_warning("requests.packages.urllib3.connectionpool"):
+                resp = self._conn.send_request(request)
+
+            if not resp.is_success:
+                raise BatchExecuteError(resp, request)
+
+            if self._return_result:
+                self._update_jobs(resp, writer.boundary, writer.content_ids)
+
+        return self.jobs
+
+    def _update_jobs(self, resp, boundary, job_ids):
+        """Populate the batch jobs with the parts of a batch API response.
+
+        :param resp: Batch API response.
+        :type resp: c8.response.Response
+        :param boundary: Multipart boundary.
+        :type boundary: str | unicode
+        :param job_ids: IDs of the jobs sent in the batch API request.
+        :type job_ids: [str | unicode]
+        :raise c8.exceptions.BatchStateError: If the response does not match
+            the jobs.
+        """
+        chunks = resp.raw_content
+        if chunks is None or isinstance(chunks, (bytes, bytearray, string_types)):
+            chunks = [chunks or ""]
+        pending = set(job_ids)
+        try:
+            for part in iter_multipart(chunks, boundary):
+                if part.content_id not in pending:
+                    raise BatchStateError(
+                        "unexpected part in batch response: {}".format(
+                            part.content_id
+                        )
+                    )
+                pending.discard(part.content_id)
+
+                queued_req, queued_job = self._queue[part.content_id]
+                queued_job._response = Response(
+                    method=queued_req.method,
+                    url=self._conn.url_prefix + queued_req.endpoint,
+                    headers=part.headers,
+                    status_code=part.status_code,
+                    status_text=part.status_text,
+                    raw_body=part.body,
+                )
+                queued_job._status = "done"
+        except ValueError as err:
+            raise BatchStateError("bad batch response: {}".format(err))
+        if pending:
+            raise BatchStateError(
+                "expecting {} parts in batch response but got {}".format(
+                    len(job_ids), len(job_ids) - len(pending)
+                )
+            )
+
+
+class TransactionExecutor(Executor):
+    """Executes transaction API requests.
+
+    API requests are queued client-side and committed as a single server-side
+    JavaScript transaction: either all of them are applied, or none is.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param return_result: If set to True, API executions return instances of
+        :class:`c8.job.TransactionJob` that are populated with results on
+        commit. If set to False, API executions return None and no results are
+        tracked client-side.
+    :type return_result: bool
+    :param timeout: Timeout for waiting on collection locks. If set to 0, the
+        server waits indefinitely. If not set, system default value is used.
+    :type timeout: int
+    :param sync: Block until the transaction is synchronized to disk.
+    :type sync: bool
+    :param read: Names of collections read during the transaction, in
+        addition to those declared by the queued API requests.
+    :type read: [str | unicode]
+    :param write: Names of collections written to during the transaction, in
+        addition to those declared by the queued API requests.
+    :type write: [str | unicode]
+    """
+
+    context = "transaction"
+
+    def __init__(
+        self, connection, return_result, timeout=None, sync=None, read=None, write=None
+    ):
+        super(TransactionExecutor, self).__init__(connection)
+        self._return_result = return_result
+        self._timeout = timeout
+        self._sync = sync
+        self._read = read
+        self._write = write
+        self._queue = OrderedDict()
+        self._committed = False
+
+    @property
+    def jobs(self):
+        """Return the queued transaction jobs.
+
+        :return: Transaction jobs or None if **return_result** parameter was
+            set to False during initialization.
+        :rtype: [c8.job.TransactionJob] | None
+        """
+        if not self._return_result:
+            return None
+        return [job for _, job in self._queue.values()]
+
+    def execute(self, request, response_handler, custom_prefix=None):
+        """Place the request in the transaction queue.
+
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :param custom_prefix: Unused, as requests are committed as server-side
+            commands.
+        :type custom_prefix: str | unicode | None
+        :return: Transaction job or None if **return_result** parameter was
+            set to False during initialization.
+        :rtype: c8.job.TransactionJob | None
+        :raise c8.exceptions.TransactionStateError: If the transaction was
+            already committed or if the API request has no transaction command.
+        """
+        if self._committed:
+            raise TransactionStateError("transaction already committed")
+        if request.command is None:
+            raise TransactionStateError(
+                "{} {} is not supported in transactions".format(
+                    request.method.upper(), request.endpoint
+                )
+            )
+
+        job = TransactionJob(response_handler)
+        self._queue[job.id] = (request, job)
+        return job if self._return_result else None
+
+    def commit(self):
+        """Execute the queued requests in a single transaction API request.
+
+        If **return_result** parameter was set to True during initialization,
+        :class:`c8.job.TransactionJob` instances are populated with results.
+
+        :return: Transaction jobs or None if **return_result** parameter was
+            set to False during initialization.
+        :rtype: [c8.job.TransactionJob] | None
+        :raise c8.exceptions.TransactionStateError: If the transaction was
+            already committed.
+        :raise c8.exceptions.TransactionExecuteError: If commit fails.
+        """
+        if self._committed:
+            raise TransactionStateError("transaction already committed")
+
+        self._committed = True
+
         if len(self._queue) == 0:
             return self.jobs
 
-        # Boundary used for multipart request
-        boundary = uuid4().hex
+        read_collections = set(self._read or [])
+        write_collections = set(self._write or [])
 
-        # Buffer for building the batch request payload
-        buffer = []
+        # Buffer for building the transaction javascript command
+        cmd_buffer = [
+            'var db = require("internal").db',
+            'var gm = require("@arangodb/general-graph")',
+            "var result = {}",
+        ]
         for req, job in self._queue.values():
-            buffer.append("--{}".format(boundary))
-            buffer.append("Content-Type: application/x-c8-batchpart")
-            buffer.append("Content-Id: {}".format(job.id))
-            buffer.append("\r\n{}".format(req))
-        buffer.append("--{}--".format(boundary))
-
-        request = Request(
-            method="post",
-            endpoint="/batch",
-            headers={
-                "Content-Type": "multipart/form-data; boundary={}".format(boundary)
+            if isinstance(req.read, str):
+                read_collections.add(req.read)
+            elif req.read is not None:
+                read_collections |= set(req.read)
+
+            if isinstance(req.write, str):
+                write_collections.add(req.write)
+            elif req.write is not None:
+                write_collections |= set(req.write)
+
+            cmd_buffer.append('result["{}"] = {}'.format(job.id, req.command))
+        cmd_buffer.append("return result;")
+
+        data = {
+            "action": "function () {{ {} }}".format(";".join(cmd_buffer)),
+            "collections": {
+                "read": sorted(read_collections),
+                "write": sorted(write_collections),
+                "allowImplicit": True,
             },
-            data="\r\n".join(buffer),
-        )
-        with suppress_warning("requests.packages.urllib3.connectionpool"):
-            resp = self._conn.send_request(request)
+        }
+        if self._timeout is not None:
+            data["lockTimeout"] = self._timeout
+        if self._sync is not None:
+            data["waitForSync"] = self._sync
+
+        request = Request(method="post", endpoint="/transaction", data=data)
+        resp = self._conn.send_request(request)
 
         if not resp.is_success:
-            raise BatchExecuteError(resp, request)
+            raise TransactionExecuteError(resp, request)
 
         if not self._return_result:
             return None
 
-        raw_resps = resp.raw_body.split("--{}".format(boundary))[1:-1]
-        if len(self._queue) != len(raw_resps):
-            raise BatchStateError(
-                "expecting {} parts in batch response but got {}".format(
-                    len(self._queue), len(raw_resps)
-                )
-            )
-        for raw_resp in raw_resps:
-            # Parse and breakdown the batch response body
-            resp_parts = raw_resp.strip().split("\r\n")
-            raw_content_id = resp_parts[1]
-            raw_body = resp_parts[-1]
-            raw_status = resp_parts[3]
-            job_id = raw_content_id.split(" ")[1]
-            _, status_code, status_text = raw_status.split(" ", 2)
-
-            # Update the corresponding batch job
-            queued_req, queued_job = self._queue[job_id]
-            queued_job._response = Response(
-                method=queued_req.method,
-                url=self._conn.url_prefix + queued_req.endpoint,
+        result = resp.body["result"]
+        for req, job in self._queue.values():
+            job._response = Response(
+                method=req.method,
+                url=self._conn.url_prefix + req.endpoint,
                 headers={},
-                status_code=int(status_code),
-                status_text=status_text,
-                raw_body=raw_body,
+                status_code=200,
+                status_text="OK",
+                raw_body=dumps(result.get(job.id)),
             )
-            queued_job._status = "done"
-
+            job._status = "done"
         return self.jobs
+
+
+class ConcurrentExecutor(Executor):
+    """Concurrent API executor backed by a thread pool.
+
+    Every API execution is dispatched to a bounded thread pool and returns a
+    :class:`concurrent.futures.Future` resolved with the API execution result
+    (or the exception raised). Unlike :class:`c8.executor.AsyncExecutor`, no
+    results are stored on server.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param max_workers: Max number of requests in flight. Should not exceed
+        the connection pool size of the HTTP client.
+    :type max_workers: int
+    """
+
+    context = "concurrent"
+
+    def __init__(self, connection, max_workers=8):
+        super(ConcurrentExecutor, self).__init__(connection)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="c8-concurrent"
+        )
+
+    def _run(self, request, response_handler, custom_prefix):
+        """Send the request and handle the response, in a worker thread.
+
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :param custom_prefix: Custom url-path value
+        :type custom_prefix: str
+        :return: API execution result.
+        :rtype: str | unicode | bool | int | list | dict
+        """
+        response = self._conn.send_request(request, custom_prefix=custom_prefix)
+        return response_handler(response)
+
+    def execute(self, request, response_handler, custom_prefix=None):
+        """Dispatch an API request to the thread pool.
+
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :param custom_prefix: Custom url-path value
+        :type custom_prefix: str
+        :return: Future resolved with the API execution result.
+        :rtype: concurrent.futures.Future
+        :raise c8.exceptions.ConcurrentStateError: If the executor was shut
+            down.
+        """
+        try:
+            return self._pool.submit(
+                self._run, request, response_handler, custom_prefix
+            )
+        except RuntimeError:
+            raise ConcurrentStateError("concurrent executor shut down")
+
+    def shutdown(self, wait=True):
+        """Stop accepting API executions.
+
+        :param wait: Block until the pending API executions are done.
+        :type wait: bool
+        """
+        self._pool.shutdown(wait=wait)
+
+
+class WriteBehindExecutor(Executor):
+    """Write-behind API executor coalescing single-document writes.
+
+    Consecutive document inserts, document updates and key-value inserts
+    into the same collection (with the same options) are buffered and sent as
+    a single bulk request once the oldest buffered write has waited for
+    **linger** seconds, or as soon as **max_batch_size** writes are buffered.
+    Buffers are sent in the order the writes were made: a write of another
+    kind (or to another collection) closes the current buffer, which is sent
+    before the next one. Such writes return a
+    :class:`concurrent.futures.Future` resolved with the result (or the
+    exception) of the individual write.
+
+    Any other request flushes the buffered writes first, then executes
+    synchronously like :class:`c8.executor.DefaultExecutor`, so reads issued
+    after writes observe them.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param linger: Max time in seconds a write is buffered.
+    :type linger: int | float
+    :param max_batch_size: Max number of writes per bulk request.
+    :type max_batch_size: int
+    """
+
+    context = "write_behind"
+
+    def __init__(self, connection, linger=0.005, max_batch_size=100):
+        super(WriteBehindExecutor, self).__init__(connection)
+        self._linger = linger
+        self._max_batch_size = max_batch_size
+        # Buffers in write order: [batch key, time of the first write,
+        # [(request, handler, future)]]. Only the last one is still open.
+        self._buffers = []
+        self._cond = threading.Condition()
+        # Held while buffers are taken and sent, so that they are sent in
+        # order. Reentrant, as response handlers may issue requests.
+        self._send_lock = threading.RLock()
+        self._flusher = None
+        self._closed = False
+
+    @staticmethod
+    def _batch_key(request, custom_prefix):
+        """Return the key of the bulk request a write can be merged into.
+
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param custom_prefix: Custom url-path value
+        :type custom_prefix: str
+        :returns: Batch key, or None if the request cannot be merged.
+        :rtype: tuple | None
+        """
+        if request.data is None or request.headers.get("If-Match"):
+            return None
+        parts = request.endpoint.split("/")
+        if request.method == "post" and len(parts) == 3 and parts[1] == "document":
+            # Multi-document inserts (array bodies) are sent as they are.
+            kind = "insert" if WriteBehindExecutor._is_object(request.data) else None
+        elif request.method == "patch" and len(parts) == 4 and parts[1] == "document":
+            kind = "update"
+        elif request.method == "put" and len(parts) == 4 and parts[1] == "kv":
+            kind = "kv" if parts[3] == "value" else None
+        else:
+            kind = None
+        if kind is None:
+            return None
+        params = tuple(sorted((request.params or {}).items()))
+        return kind, custom_prefix, "/".join(parts[:3]), params
+
+    @staticmethod
+    def _is_object(data):
+        """Return True if a serialized payload is a JSON object.
+
+        :param data: Payload.
+        :type data: str | unicode | bytes | bytearray | memoryview | object
+        :rtype: bool
+        """
+        if isinstance(data, memoryview):
+            data = bytes(data[:64])
+        if isinstance(data, (bytes, bytearray)):
+            return data.lstrip()[:1] == b"{"
+        if isinstance(data, str):
+            return data.lstrip()[:1] == "{"
+        return False
+
+    def execute(self, request, response_handler, custom_prefix=None):
+        """Buffer a write, or flush the buffers and execute the request.
+
+        :param request: HTTP request.
+        :type request: c8.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :param custom_prefix: Custom url-path value
+        :type custom_prefix: str
+        :return: Future for buffered writes, API execution result otherwise.
+        :rtype: concurrent.futures.Future | str | unicode | bool | int | list
+            | dict
+        :raise c8.exceptions.WriteBehindStateError: If the executor was
+            closed.
+        """
+        key = self._batch_key(request, custom_prefix)
+        if key is None:
+            self.flush()
+            response = self._conn.send_request(request, custom_prefix=custom_prefix)
+            return response_handler(response)
+
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise WriteBehindStateError("write-behind executor closed")
+            if not self._buffers or self._buffers[-1][0] != key:
+                self._buffers.append([key, time.monotonic(), []])
+            writes = self._buffers[-1][2]
+            writes.append((request, response_handler, future))
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="c8-write-behind", daemon=True
+                )
+                self._flusher.start()
+            # Wake the flusher up when a buffer is opened, so that it waits
+            # for its linger time, and when a buffer is due.
+            if (
+                len(writes) == 1
+                or len(self._buffers) > 1
+                or len(writes) >= self._max_batch_size
+            ):
+                self._cond.notify_all()
+        return future
+
+    def _next_timeout(self):
+        """Return the time left until the first buffer is due.
+
+        Closed buffers are due right away. Must be called with the lock held.
+
+        :returns: Timeout in seconds, or None if nothing is buffered.
+        :rtype: float | None
+        """
+        if not self._buffers:
+            return None
+        _, started, writes = self._buffers[0]
+        if len(self._buffers) > 1 or len(writes) >= self._max_batch_size:
+            return 0
+        return max(started + self._linger - time.monotonic(), 0)
+
+    def _send_pending(self, force=False):
+        """Send the buffers which are due, in write order.
+
+        :param force: Send all buffers, including the open one.
+        :type force: bool
+        """
+        with self._send_lock:
+            with self._cond:
+                if force or self._last_due():
+                    due, self._buffers = self._buffers, []
+                else:
+                    due, self._buffers = self._buffers[:-1], self._buffers[-1:]
+            for key, _, writes in due:
+                self._send(key, writes)
+
+    def _last_due(self):
+        """Return True if the open buffer is due to be sent.
+
+        Must be called with the lock held.
+
+        :rtype: bool
+        """
+        if not self._buffers:
+            return False
+        _, started, writes = self._buffers[-1]
+        return (
+            len(writes) >= self._max_batch_size
+            or time.monotonic() - started >= self._linger
+        )
+
+    def _run(self):
+        """Send buffered writes in the background until closed."""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    timeout = self._next_timeout()
+                    if timeout == 0:
+                        break
+                    self._cond.wait(timeout)
+                closed = self._closed
+            self._send_pending(force=closed)
+            if closed:
+                return
+
+    def flush(self):
+        """Send all buffered writes and wait for their results."""
+        self._send_pending(force=True)
+
+    def close(self):
+        """Flush the buffered writes and stop buffering new ones."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+
+    def _send(self, key, writes):
+        """Send buffered writes, one by one or merged into bulk requests.
+
+        :param key: Batch key.
+        :type key: tuple
+        :param writes: Buffered writes.
+        :type writes: [(c8.request.Request, callable, Future)]
+        """
+        for start in range(0, len(writes), self._max_batch_size):
+            chunk = writes[start : start + self._max_batch_size]  # noqa: E203
+            try:
+                if len(chunk) == 1:
+                    request, handler, future = chunk[0]
+                    response = self._conn.send_request(request, custom_prefix=key[1])
+                    self._resolve(future, handler, response)
+                else:
+                    self._send_bulk(key, chunk)
+            except Exception as err:
+                for _, _, future in chunk:
+                    if not future.done():
+                        future.set_exception(err)
+
+    def _send_bulk(self, key, writes):
+        """Merge writes into a bulk request and dispatch the results.
+
+        :param key: Batch key.
+        :type key: tuple
+        :param writes: Buffered writes.
+        :type writes: [(c8.request.Request, callable, Future)]
+        """
+        kind, custom_prefix, endpoint, _ = key
+        first = writes[0][0]
+        counts = None
+        if kind == "insert":
+            items = [self._as_text(request.data) for request, _, _ in writes]
+            data = "[" + ",".join(items) + "]"
+        elif kind == "update":
+            docs = []
+            for request, _, _ in writes:
+                doc = loads(request.data)
+                doc.setdefault("_key", request.endpoint.rsplit("/", 1)[1])
+                docs.append(doc)
+            data = dumps(docs)
+        else:
+            pairs = [loads(request.data) for request, _, _ in writes]
+            counts = [len(items) for items in pairs]
+            data = dumps([pair for items in pairs for pair in items])
+
+        bulk_request = Request(
+            method=first.method,
+            endpoint=endpoint if kind != "kv" else first.endpoint,
+            params=first.params,
+            data=data,
+        )
+        response = self._conn.send_request(bulk_request, custom_prefix=custom_prefix)
+
+        body = response.body
+        expected = sum(counts) if counts else len(writes)
+        if not response.is_success or not isinstance(body, list):
+            body = None
+        elif len(body) != expected:
+            body = None
+        if body is None:
+            # The bulk request failed as a whole, or returned no per-write
+            # results (e.g. silent writes): every write gets the response.
+            for _, handler, future in writes:
+                self._resolve(future, handler, response)
+            return
+
+        offset = 0
+        for index, (_, handler, future) in enumerate(writes):
+            if counts is None:
+                result = body[index]
+            else:
+                result = body[offset : offset + counts[index]]  # noqa: E203
+                offset += counts[index]
+            status_code = response.status_code
+            if isinstance(result, dict) and result.get("errorNum") == 1200:
+                status_code = 412  # Revision conflict
+            sub_response = Response(
+                method=response.method,
+                url=response.url,
+                headers=response.headers,
+                status_code=status_code,
+                status_text=response.status_text,
+                raw_body=result,
+            )
+            self._resolve(future, handler, sub_response)
+
+    @staticmethod
+    def _as_text(data):
+        """Return a serialized payload as text.
+
+        :param data: Serialized payload.
+        :type data: str | unicode | bytes | bytearray
+        :rtype: str | unicode
+        """
+        if isinstance(data, (bytes, bytearray)):
+            return data.decode("utf-8")
+        return data
+
+    @staticmethod
+    def _resolve(future, handler, response):
+        """Resolve a future with the result of the response handler.
+
+        :param future: Future of the write.
+        :type future: concurrent.futures.Future
+        :param handler: HTTP response handler.
+        :type handler: callable
+        :param response: HTTP response.
+        :type response: c8.response.Response
+        """
+        try:
+            future.set_result(handler(response))
+        except Exception as err:
+            future.set_exception(err)
@@ -0,0 +1,222 @@
+from __future__ import absolute_import, unicode_literals
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from six.moves import queue
+
+from c8.c8ql import C8QL
+
+__all__ = ["ParallelExporter"]
+
+# Markers put in the page queues next to the pages of documents.
+_DONE = "done"
+_ERROR = "error"
+_PAGE = "page"
+
+
+class ParallelExporter(object):
+    """Exporter fetching key ranges of a collection concurrently.
+
+    The collection is split into key ranges (partitions), either at the given
+    boundary keys (e.g. known shard boundaries) or at keys evenly spaced in
+    the primary index. Each partition is read with keyset pagination: every
+    page seeks to the last key of the previous one, so the cost of a page
+    does not depend on its position in the collection, unlike with offset
+    paging.
+
+    Pages are handed over through bounded queues: at most **max_pending**
+    pages per partition (ordered mode) or per worker (unordered mode) are
+    held in memory at any time. Closing the generator early stops the
+    workers.
+
+    :param collection: Collection using the default execution context.
+    :type collection: c8.collection.Collection
+    :param max_workers: Max number of requests in flight.
+    :type max_workers: int
+    :param page_size: Number of documents fetched in one round trip.
+    :type page_size: int
+    :param fields: Document fields to return (projection). The "_key" field
+        is always returned.
+    :type fields: [str | unicode]
+    :param max_pending: Max number of pages fetched ahead of the consumer per
+        partition or worker.
+    :type max_pending: int
+    """
+
+    def __init__(
+        self, collection, max_workers=8, page_size=1000, fields=None, max_pending=2
+    ):
+        if collection.context != "default":
+            raise ValueError(
+                "parallel exports require the default execution context, "
+                "got {}".format(collection.context)
+            )
+        self._collection = collection
+        self._max_workers = max_workers
+        self._page_size = page_size
+        self._fields = fields
+        self._max_pending = max_pending
+
+    def __repr__(self):
+        return "<ParallelExporter {}>".format(self._collection.name)
+
+    def _boundary_key(self, after, skip):
+        """Return the key **skip** positions past the key after **after**.
+
+        The primary index is used to seek to **after**, so the lookup only
+        walks the **skip** keys in between.
+
+        :param after: Walk the keys after this key, or from the first one.
+        :type after: str | unicode | None
+        :param skip: Number of keys skipped.
+        :type skip: int
+        :returns: Key, or None if there are not enough keys.
+        :rtype: str | unicode | None
+        """
+        col = self._collection
+        bind_vars = {"@collection": col.name, "skip": skip}
+        query = "FOR doc IN @@collection "
+        if after is not None:
+            query += "FILTER doc._key > @after "
+            bind_vars["after"] = after
+        query += "SORT doc._key LIMIT @skip, 1 RETURN doc._key"
+        cursor = C8QL(col._conn, col._executor).execute(query, bind_vars=bind_vars)
+        return next(cursor, None)
+
+    def boundaries(self, partitions=None):
+        """Return the keys splitting the collection into partitions of about
+        the same number of documents.
+
+        Each key is looked up in the primary index from the previous one, so
+        finding all of them walks the index once.
+
+        :param partitions: Number of partitions. Defaults to **max_workers**.
+        :type partitions: int
+        :returns: Sorted boundary keys (one less than the partitions, fewer if
+            the collection is small).
+        :rtype: [str | unicode]
+        :raise c8.exceptions.DocumentCountError: If the count fails.
+        :raise c8.exceptions.C8QLQueryExecuteError: If a lookup fails.
+        """
+        partitions = partitions or self._max_workers
+        count = self._collection.count()
+        offsets = sorted({count * i // partitions for i in range(1, partitions)})
+        offsets = [offset for offset in offsets if 0 < offset < count]
+        keys = []
+        position = -1
+        for offset in offsets:
+            key = self._boundary_key(keys[-1] if keys else None, offset - position - 1)
+            if key is None:
+                # The collection shrank since it was counted.
+                break
+            keys.append(key)
+            position = offset
+        return keys
+
+    def _export_range(self, lower, upper, pages, stopped):
+        """Read a key range page by page and put the pages in a queue.
+
+        :param lower: Exclusive lower bound of the key range.
+        :type lower: str | unicode | None
+        :param upper: Inclusive upper bound of the key range.
+        :type upper: str | unicode | None
+        :param pages: Queue receiving (marker, value) tuples.
+        :type pages: queue.Queue
+        :param stopped: Set when the consumer is gone.
+        :type stopped: threading.Event
+        """
+        after = lower
+        while not stopped.is_set():
+            try:
+                docs = self._collection._keyset_page(
+                    after, upper, self._page_size, self._fields
+                )
+            except Exception as err:
+                self._put(pages, (_ERROR, err), stopped)
+                return
+            if docs:
+                self._put(pages, (_PAGE, docs), stopped)
+            if len(docs) < self._page_size:
+                break
+            after = docs[-1]["_key"]
+        self._put(pages, (_DONE, None), stopped)
+
+    @staticmethod
+    def _put(pages, item, stopped):
+        # Wake up regularly to notice the consumer being gone.
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def export(self, partitions=None, boundaries=None, ordered=False):
+        """Export all documents in the collection.
+
+        :param partitions: Number of partitions if **boundaries** is not set.
+            Defaults to **max_workers**.
+        :type partitions: int
+        :param boundaries: Keys splitting the collection into partitions.
+        :type boundaries: [str | unicode]
+        :param ordered: If set to True, documents are yielded in key order.
+            Otherwise they are yielded as the pages arrive, which avoids
+            waiting on slow partitions.
+        :type ordered: bool
+        :returns: Generator of documents.
+        :rtype: generator
+        :raise c8.exceptions.DocumentGetError: If retrieval fails.
+        """
+        if boundaries is None:
+            boundaries = self.boundaries(partitions)
+        else:
+            boundaries = sorted(set(boundaries))
+        ranges = list(zip([None] + boundaries, boundaries + [None]))
+
+        stopped = threading.Event()
+        if ordered:
+            queues = [queue.Queue(self._max_pending) for _ in ranges]
+        else:
+            shared = queue.Queue(self._max_pending * self._max_workers)
+            queues = [shared] * len(ranges)
+
+        pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            # Partitions are started in order, so with ordered output the
+            # partition being consumed always has a worker.
+            for (lower, upper), pages in zip(ranges, queues):
+                pool.submit(self._export_range, lower, upper, pages, stopped)
+
+            if ordered:
+                for pages in queues:
+                    for docs in self._drain(pages, 1):
+                        for doc in docs:
+                            yield doc
+            else:
+                for docs in self._drain(shared, len(ranges)):
+                    for doc in docs:
+                        yield doc
+        finally:
+            stopped.set()
+            pool.shutdown(wait=True)
+
+    @staticmethod
+    def _drain(pages, partitions):
+        """Yield the pages from a queue until the partitions are done.
+
+        :param pages: Queue of (marker, value) tuples.
+        :type pages: queue.Queue
+        :param partitions: Number of partitions feeding the queue.
+        :type partitions: int
+        :returns: Generator of pages.
+        :rtype: generator
+        """
+        while partitions:
+            marker, value = pages.get()
+            if marker == _ERROR:
+                raise value
+            if marker == _DONE:
+                partitions -= 1
+            else:
+                yield value
@@ -1,8 +1,8 @@
 from __future__ import absolute_import, unicode_literals
 
 import base64
-import json
 import random
+import uuid
 
 import warnings
 import websocket
@@ -11,6 +11,8 @@ from c8 import constants
 from c8.api import APIWrapper
 from c8.apikeys import APIKeys
 from c8.c8ql import C8QL
+from c8.cache import CacheInvalidator
+from c8.codec import dumps, loads
 from c8.collection import StandardCollection
 from c8.exceptions import (
     CollectionCreateError,
@@ -54,9 +56,20 @@ from c8.exceptions import (
     StreamListError,
     StreamPermissionError,
 )
-from c8.executor import AsyncExecutor, BatchExecutor, DefaultExecutor
+from c8.executor import (
+    AsyncExecutor,
+    AsyncIOExecutor,
+    BatchExecutor,
+    ConcurrentExecutor,
+    DefaultExecutor,
+    TransactionExecutor,
+    WriteBehindExecutor,
+)
 from c8.graph import Graph
+from c8.http import AsyncIOHTTPClient
+from c8.job import as_completed, wait_all
 from c8.keyvalue import KV
+from c8.redis.redis_commands import RedisCommands
 from c8.request import Request
 from c8.search import Search
 from c8.stream_apps import StreamApps
@@ -64,8 +77,12 @@ from c8.stream_collection import StreamCollection
 
 __all__ = [
     "StandardFabric",
+    "AsyncIOFabric",
     "AsyncFabric",
     "BatchFabric",
+    "TransactionFabric",
+    "ConcurrentFabric",
+    "WriteBehindFabric",
 ]
 ENDPOINT = "/streams"
 
@@ -133,6 +150,114 @@ class Fabric(APIWrapper):
         """
         return KV(self._conn, self._executor)
 
+    def _change_stream_subscription(self, subscription_id=None):
+        """Return a subscription name for a collection change stream.
+
+        :param subscription_id: Suffix of the subscription name. Random if not
+            set.
+        :type subscription_id: str | unicode
+        :returns: Subscription name.
+        :rtype: str | unicode
+        """
+        return "%s-%s-subscription-%s" % (
+            self.tenant_name,
+            self.fabric_name,
+            subscription_id or str(random.randint(1, 1000)),
+        )
+
+    def _change_stream_topic(self, collection, subscription_name=None):
+        """Return the consumer URL of a collection change stream.
+
+        :param collection: Collection name(s) regex.
+        :type collection: str | unicode
+        :param subscription_name: Subscription name. A new one is used if not
+            set.
+        :type subscription_name: str | unicode
+        :returns: Websocket URL.
+        :rtype: str | unicode
+        """
+        namespace = constants.STREAM_LOCAL_NS_PREFIX + self.fabric_name
+        subscription_name = subscription_name or self._change_stream_subscription()
+
+        url = self.url.split("//")[1].split(":")[0]
+
+        return "wss://{}/_ws/ws/v2/consumer/persistent/{}/{}/{}/{}".format(
+            url, self.tenant_name, namespace, collection, subscription_name
+        )
+
+    def _delete_change_stream_subscription(self, collection, subscription_name):
+        """Delete the subscription of a collection change stream.
+
+        :param collection: Collection name.
+        :type collection: str | unicode
+        :param subscription_name: Subscription name.
+        :type subscription_name: str | unicode
+        :returns: True if the subscription was deleted.
+        :rtype: bool
+        :raise c8.exceptions.StreamDeleteError: If the subscription still has
+            consumers.
+        """
+        request = Request(
+            method="delete",
+            endpoint="/streams/{}/subscriptions/{}?global=false".format(
+                collection, subscription_name
+            ),
+        )
+
+        def response_handler(resp):
+            if resp.is_success:
+                return True
+            elif resp.status_code == 403:
+                raise StreamPermissionError(resp, request)
+            elif resp.status_code == 412:
+                raise StreamDeleteError(resp, request)
+            raise StreamConnectionError(resp, request)
+
+        return self._execute(request, response_handler)
+
+    def cache_invalidator(self, collections, caches, update=False, start=True):
+        """Keep client-side caches up to date with collection change streams.
+
+        Changes made by any client are applied to the caches as soon as they
+        are received, so that entries are not served stale for longer than
+        the stream propagation delay. This allows caching with long (or no)
+        time-to-live.
+
+        :param collections: Names of the collections to watch.
+        :type collections: [str | unicode]
+        :param caches: Caches to keep up to date (e.g.
+            :class:`c8.cache.DocumentCache`).
+        :type caches: list
+        :param update: Replace cached documents with their new version instead
+            of evicting them.
+        :type update: bool
+        :param start: Start consuming the streams right away.
+        :type start: bool
+        :returns: Cache invalidator. Call its stop() method (or use it as a
+            context manager) to stop consuming the streams and delete the
+            stream subscriptions.
+        :rtype: c8.cache.CacheInvalidator
+        """
+        # Every client needs its own subscription to receive all the changes.
+        subscriptions = {
+            name: self._change_stream_subscription(uuid.uuid4().hex)
+            for name in collections
+        }
+        topics = {
+            name: self._change_stream_topic(name, subscription)
+            for name, subscription in subscriptions.items()
+        }
+
+        def unsubscribe(collection):
+            self._delete_change_stream_subscription(
+                collection, subscriptions[collection]
+            )
+
+        invalidator = CacheInvalidator(
+            topics, caches, self.header, update=update, unsubscribe=unsubscribe
+        )
+        return invalidator.start() if start else invalidator
+
     def on_change(self, collection, callback, timeout=60):
         """Execute given input function on receiving a change.
 
@@ -152,28 +277,15 @@ class Fabric(APIWrapper):
                 "data is to be watched!"
             )
 
-        namespace = constants.STREAM_LOCAL_NS_PREFIX + self.fabric_name
-
-        subscription_name = "%s-%s-subscription-%s" % (
-            self.tenant_name,
-            self.fabric_name,
-            str(random.randint(1, 1000)),
-        )
-
-        url = self.url.split("//")[1].split(":")[0]
-
-        topic = "wss://{}/_ws/ws/v2/consumer/persistent/{}/{}/{}/{}".format(
-            url, self.tenant_name, namespace, collection, subscription_name
-        )
-
+        topic = self._change_stream_topic(collection)
         ws = websocket.create_connection(topic, header=self.header, timeout=timeout)
 
         try:
             # "pyC8 Realtime: Begin monitoring realtime updates for " + topic
             while True:
-                msg = json.loads(ws.recv())
+                msg = loads(ws.recv())
                 data = base64.b64decode(msg["payload"])
-                ws.send(json.dumps({"messageId": msg["messageId"]}))
+                ws.send(dumps({"messageId": msg["messageId"]}))
                 callback(data)
         except websocket.WebSocketTimeoutException:
             pass
@@ -379,7 +491,7 @@ class Fabric(APIWrapper):
         :rtype: bool
         :raise c8.exceptions.SpotRegionAssignError: If assignment fails.
         """
-        data = json.dumps(spot_region)
+        data = dumps(spot_region)
         request = Request(method="put", endpoint="/datacenter/{}/{}".format(dc, data))
 
         def response_handler(resp):
@@ -555,6 +667,7 @@ class Fabric(APIWrapper):
                 return False
             if not resp.is_success:
                 raise FabricDeleteError(resp, request)
+            self._conn.metadata_cache.invalidate((self._conn.tenant_name, name))
             return resp.body["result"]
 
         return self._execute(request, response_handler)
@@ -563,28 +676,50 @@ class Fabric(APIWrapper):
     # Collection Management #
     #########################
 
-    def collection(self, name):
+    def collection(self, name, cache=None, lazy=False):
         """Return the standard collection API wrapper.
 
         :param name: Collection name.
         :type name: str | unicode
+        :param cache: Client-side document cache for reads by key or ID (see
+            :class:`c8.cache.DocumentCache`). It can be shared between
+            collections.
+        :type cache: c8.cache.DocumentCache
+        :param lazy: Do not check that the collection exists. Requests on a
+            missing collection then fail when they are sent.
+        :type lazy: bool
         :returns: Standard collection API wrapper.
         :rtype: c8.collection.StandardCollection
+        :raise c8.exceptions.CollectionFindError: If the collection does not
+            exist.
         """
-        if self.has_collection(name):
-            return StandardCollection(self._conn, self._executor, name)
+        if lazy or self.has_collection(name):
+            return StandardCollection(self._conn, self._executor, name, cache)
         else:
             raise CollectionFindError("Collection not found")
 
     def has_collection(self, name):
         """Check if collection exists in the fabric.
 
+        The collection names are cached (see :class:`c8.cache.MetadataCache`).
+
         :param name: Collection name.
         :type name: str | unicode
         :returns: True if collection exists, False otherwise.
         :rtype: bool
         """
-        return any(col["name"] == name for col in self.collections())
+        names = self._conn.metadata_cache.names(
+            self._conn.metadata_key("collections"), self._collection_names
+        )
+        return name in names
+
+    def _collection_names(self):
+        """Return the names of the collections in the fabric.
+
+        :returns: Collection names.
+        :rtype: [str | unicode]
+        """
+        return [col["name"] for col in self.collections()]
 
     def collections(self, collectionModel=None):
         """Return the collections in the fabric.
@@ -753,7 +888,10 @@ class Fabric(APIWrapper):
 
         def response_handler(resp):
             if resp.is_success:
-                return self.collection(name)
+                cache = self._conn.metadata_cache
+                cache.add(self._conn.metadata_key("collections"), name)
+                cache.invalidate(self._conn.metadata_key("streams"))
+                return StandardCollection(self._conn, self._executor, name)
             raise CollectionCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -817,6 +955,9 @@ class Fabric(APIWrapper):
                 return False
             if not resp.is_success:
                 raise CollectionDeleteError(resp, request)
+            cache = self._conn.metadata_cache
+            cache.discard(self._conn.metadata_key("collections"), name)
+            cache.invalidate(self._conn.metadata_key("streams"))
             return True
 
         return self._execute(request, response_handler)
@@ -936,6 +1077,9 @@ class Fabric(APIWrapper):
 
         def response_handler(resp):
             if resp.is_success:
+                self._conn.metadata_cache.invalidate(
+                    self._conn.metadata_key("collections")
+                )
                 return Graph(self._conn, self._executor, name)
             raise GraphCreateError(resp, request)
 
@@ -969,6 +1113,7 @@ class Fabric(APIWrapper):
                 return False
             if not resp.is_success:
                 raise GraphDeleteError(resp, request)
+            self._conn.metadata_cache.invalidate(self._conn.metadata_key("collections"))
             return True
 
         return self._execute(request, response_handler)
@@ -1102,6 +1247,8 @@ class Fabric(APIWrapper):
     def has_stream(self, stream, isCollectionStream=False, local=False):
         """Check if the list of streams has a stream with the given name.
 
+        The stream names are cached (see :class:`c8.cache.MetadataCache`).
+
         :param stream: The name of the stream for which to check in the list
                        of all streams.
         :type stream: str | unicode
@@ -1113,7 +1260,11 @@ class Fabric(APIWrapper):
                 stream = "c8globals." + stream
             elif local is True and "c8locals" not in stream:
                 stream = "c8locals." + stream
-        return any(mystream["name"] == stream for mystream in self.streams(local=local))
+        names = self._conn.metadata_cache.names(
+            self._conn.metadata_key("streams", local),
+            lambda: [mystream["name"] for mystream in self.streams(local=local)],
+        )
+        return stream in names
 
     def create_stream(self, stream, local=False):
         """
@@ -1134,6 +1285,9 @@ class Fabric(APIWrapper):
         def response_handler(resp):
             code = resp.status_code
             if resp.is_success:
+                self._conn.metadata_cache.invalidate(
+                    self._conn.metadata_key("streams")
+                )
                 return resp.body["result"]
             elif code == 502:
                 raise StreamCommunicationError(resp, request)
@@ -1159,6 +1313,9 @@ class Fabric(APIWrapper):
         def response_handler(resp):
             code = resp.status_code
             if resp.is_success:
+                self._conn.metadata_cache.invalidate(
+                    self._conn.metadata_key("streams")
+                )
                 return True
             elif code == 403:
                 raise StreamPermissionError(resp, request)
@@ -1364,9 +1521,7 @@ class Fabric(APIWrapper):
         :raise c8.exceptions.EventDeleteError: if event creation failed
 
         """
-        data = json.dumps((eventIds))
-
-        request = Request(method="delete", endpoint="/events", data=data)
+        request = Request(method="delete", endpoint="/events", data=eventIds)
 
         def response_handler(resp):
             if not resp.is_success:
@@ -1423,9 +1578,7 @@ class Fabric(APIWrapper):
         :param data: stream app defination string
         """
         body = {"definition": data}
-        req = Request(
-            method="post", endpoint="/streamapps/validate", data=json.dumps(body)
-        )
+        req = Request(method="post", endpoint="/streamapps/validate", data=body)
 
         def response_handler(resp):
             if resp.is_success is True:
@@ -1471,7 +1624,7 @@ class Fabric(APIWrapper):
         # create request body
         req_body = {"definition": data, "regions": dclist}
         # create request
-        req = Request(method="post", endpoint="/streamapps", data=json.dumps(req_body))
+        req = Request(method="post", endpoint="/streamapps", data=req_body)
 
         # create response handler
 
@@ -1557,7 +1710,20 @@ class StandardFabric(Fabric):
         """
         return AsyncFabric(self._conn, return_result)
 
-    def begin_batch_execution(self, return_result=True):
+    def begin_asyncio_execution(self, http_client=None):
+        """Begin asyncio execution.
+
+        :param http_client: Asyncio HTTP client. If not set, a new
+            :class:`c8.http.AsyncIOHTTPClient` is created.
+        :type http_client: c8.http.AsyncIOHTTPClient
+        :returns: Fabric API wrapper built specifically for asyncio execution.
+        :rtype: c8.fabric.AsyncIOFabric
+        """
+        return AsyncIOFabric(self._conn, http_client)
+
+    def begin_batch_execution(
+        self, return_result=True, max_batch_size=1000, max_batch_bytes=16 << 20
+    ):
         """Begin batch execution.
 
         :param return_result: If set to True, API executions return instances
@@ -1565,10 +1731,166 @@ class StandardFabric(Fabric):
             commit. If set to False, API executions return None and no results
             are tracked client-side.
         :type return_result: bool
+        :param max_batch_size: Max number of requests sent in one batch API
+            request. Larger batches are split on commit.
+        :type max_batch_size: int | None
+        :param max_batch_bytes: Max size in bytes of one batch API request.
+        :type max_batch_bytes: int | None
         :returns: Fabric API wrapper built specifically for batch execution.
         :rtype: c8.fabric.BatchFabric
         """
-        return BatchFabric(self._conn, return_result)
+        return BatchFabric(self._conn, return_result, max_batch_size, max_batch_bytes)
+
+    def begin_concurrent_execution(self, max_workers=8):
+        """Begin concurrent execution.
+
+        API executions are dispatched to a thread pool and return
+        :class:`concurrent.futures.Future` objects.
+
+        :param max_workers: Max number of requests in flight. Should not
+            exceed the connection pool size of the HTTP client.
+        :type max_workers: int
+        :returns: Fabric API wrapper built specifically for concurrent
+            execution.
+        :rtype: c8.fabric.ConcurrentFabric
+        """
+        return ConcurrentFabric(self._conn, max_workers)
+
+    def begin_write_behind_execution(self, linger=0.005, max_batch_size=100):
+        """Begin write-behind execution.
+
+        Single-document inserts and updates, and key-value inserts, are
+        buffered and sent as bulk requests. They return futures resolved with
+        the result of each write.
+
+        :param linger: Max time in seconds a write is buffered.
+        :type linger: int | float
+        :param max_batch_size: Max number of writes per bulk request.
+        :type max_batch_size: int
+        :returns: Fabric API wrapper built specifically for write-behind
+            execution.
+        :rtype: c8.fabric.WriteBehindFabric
+        """
+        return WriteBehindFabric(self._conn, linger, max_batch_size)
+
+    def begin_transaction(
+        self, return_result=True, timeout=None, sync=None, read=None, write=None
+    ):
+        """Begin transaction.
+
+        API requests are queued and committed as a single server-side
+        JavaScript transaction.
+
+        :param return_result: If set to True, API executions return instances
+            of :class:`c8.job.TransactionJob` that are populated with results
+            on commit. If set to False, API executions return None and no
+            results are tracked client-side.
+        :type return_result: bool
+        :param timeout: Timeout for waiting on collection locks. If set to 0,
+            the server waits indefinitely. If not set, system default value
+            is used.
+        :type timeout: int
+        :param sync: Block until the transaction is synchronized to disk.
+        :type sync: bool
+        :param read: Names of collections read during the transaction. Only
+            needed for collections not accessed through the API wrapper.
+        :type read: [str | unicode]
+        :param write: Names of collections written to during the transaction.
+            Only needed for collections not accessed through the API wrapper.
+        :type write: [str | unicode]
+        :returns: Fabric API wrapper built specifically for transactions.
+        :rtype: c8.fabric.TransactionFabric
+        """
+        return TransactionFabric(
+            connection=self._conn,
+            return_result=return_result,
+            timeout=timeout,
+            sync=sync,
+            read=read,
+            write=write,
+        )
+
+
+class AsyncIOFabric(Fabric):
+    """Fabric API wrapper tailored specifically for asyncio execution.
+
+    See :func:`c8.fabric.StandardFabric.begin_asyncio_execution`.
+
+    API executions return awaitables, and so do the existence checks of
+    :func:`c8.fabric.AsyncIOFabric.has_collection` and
+    :func:`c8.fabric.AsyncIOFabric.collection`.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param http_client: Asyncio HTTP client.
+    :type http_client: c8.http.AsyncIOHTTPClient
+    """
+
+    def __init__(self, connection, http_client=None):
+        connection = connection.with_http_client(http_client or AsyncIOHTTPClient())
+        super(AsyncIOFabric, self).__init__(
+            connection=connection, executor=AsyncIOExecutor(connection)
+        )
+
+    def __repr__(self):
+        return "<AsyncIOFabric {}>".format(self.name)
+
+    def collection(self, name, cache=None, lazy=False):
+        """Return the standard collection API wrapper.
+
+        Unless **lazy** is set, the existence of the collection is checked,
+        and an awaitable resolving to the wrapper is returned.
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :param cache: Client-side document cache for reads by key or ID (see
+            :class:`c8.cache.DocumentCache`).
+        :type cache: c8.cache.DocumentCache
+        :param lazy: Do not check that the collection exists, and return the
+            wrapper right away.
+        :type lazy: bool
+        :returns: Standard collection API wrapper, or an awaitable resolving
+            to it.
+        :rtype: c8.collection.StandardCollection | collections.abc.Awaitable
+        :raise c8.exceptions.CollectionFindError: If the collection does not
+            exist.
+        """
+        if lazy:
+            return StandardCollection(self._conn, self._executor, name, cache)
+        return self._find_collection(name, cache)
+
+    async def _find_collection(self, name, cache):
+        if await self.has_collection(name):
+            return StandardCollection(self._conn, self._executor, name, cache)
+        raise CollectionFindError("Collection not found")
+
+    async def has_collection(self, name):
+        """Check if collection exists in the fabric.
+
+        The collection names are cached (see :class:`c8.cache.MetadataCache`).
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :returns: Awaitable resolving to True if collection exists, False
+            otherwise.
+        :rtype: collections.abc.Awaitable
+        """
+        key = self._conn.metadata_key("collections")
+        names = self._conn.metadata_cache.get(key)
+        if names is None:
+            loaded = [col["name"] for col in await self.collections()]
+            names = self._conn.metadata_cache.names(key, lambda: loaded)
+        return name in names
+
+    async def close(self):
+        """Close the asyncio HTTP client and release its connections."""
+        await self._conn.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
 
 
 class AsyncFabric(Fabric):
@@ -1593,6 +1915,54 @@ class AsyncFabric(Fabric):
     def __repr__(self):
         return "<AsyncFabric {}>".format(self.name)
 
+    def as_completed(self, jobs, timeout=None, max_workers=8, max_interval=2.0):
+        """Yield async jobs as they complete.
+
+        Pending jobs are polled with adaptive backoff, and the results of done
+        jobs are fetched (and deleted from server) while polling. See
+        :func:`c8.job.as_completed`.
+
+        :param jobs: Async jobs.
+        :type jobs: [c8.job.AsyncJob]
+        :param timeout: Max number of seconds to wait, or None to wait forever.
+        :type timeout: int | float | None
+        :param max_workers: Max number of concurrent polls.
+        :type max_workers: int
+        :param max_interval: Max number of seconds between polling rounds.
+        :type max_interval: int | float
+        :returns: Generator of done jobs.
+        :rtype: generator
+        :raise c8.exceptions.AsyncJobTimeoutError: If jobs are still pending
+            when the timeout expires.
+        :raise c8.exceptions.AsyncJobResultError: If polling a job fails.
+        """
+        return as_completed(
+            jobs, timeout=timeout, max_workers=max_workers, max_interval=max_interval
+        )
+
+    def wait_all(self, jobs, timeout=None, max_workers=8, max_interval=2.0):
+        """Wait for async jobs to complete.
+
+        Pending jobs are polled with adaptive backoff, and the results of done
+        jobs are fetched (and deleted from server) while polling. See
+        :func:`c8.job.wait_all`.
+
+        :param jobs: Async jobs.
+        :type jobs: [c8.job.AsyncJob]
+        :param timeout: Max number of seconds to wait, or None to wait forever.
+        :type timeout: int | float | None
+        :param max_workers: Max number of concurrent polls.
+        :type max_workers: int
+        :param max_interval: Max number of seconds between polling rounds.
+        :type max_interval: int | float
+        :returns: Done jobs and jobs still pending after the timeout.
+        :rtype: ([c8.job.AsyncJob], [c8.job.AsyncJob])
+        :raise c8.exceptions.AsyncJobResultError: If polling a job fails.
+        """
+        return wait_all(
+            jobs, timeout=timeout, max_workers=max_workers, max_interval=max_interval
+        )
+
 
 class BatchFabric(Fabric):
     """Fabric API wrapper tailored specifically for batch execution.
@@ -1606,11 +1976,21 @@ class BatchFabric(Fabric):
         If set to False, API executions return None and no results are tracked
         client-side.
     :type return_result: bool
+    :param max_batch_size: Max number of requests sent in one batch API
+        request. Larger batches are split on commit.
+    :type max_batch_size: int | None
+    :param max_batch_bytes: Max size in bytes of one batch API request.
+    :type max_batch_bytes: int | None
     """
 
-    def __init__(self, connection, return_result):
+    def __init__(
+        self, connection, return_result, max_batch_size=1000, max_batch_bytes=16 << 20
+    ):
         super(BatchFabric, self).__init__(
-            connection=connection, executor=BatchExecutor(connection, return_result)
+            connection=connection,
+            executor=BatchExecutor(
+                connection, return_result, max_batch_size, max_batch_bytes
+            ),
         )
 
     def __repr__(self):
@@ -1633,7 +2013,8 @@ class BatchFabric(Fabric):
         return self._executor.jobs
 
     def commit(self):
-        """Execute the queued requests in a single batch API request.
+        """Execute the queued requests in batch API requests (more than one
+        if the batch exceeds **max_batch_size** or **max_batch_bytes**).
 
         If **return_result** parameter was set to True during initialization,
         :class:`c8.job.BatchJob` instances are populated with results.
@@ -1647,3 +2028,185 @@ class BatchFabric(Fabric):
         :raise c8.exceptions.BatchExecuteError: If commit fails.
         """
         return self._executor.commit()
+
+
+class TransactionFabric(Fabric):
+    """Fabric API wrapper tailored specifically for transactions.
+
+    See :func:`c8.fabric.StandardFabric.begin_transaction`.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param return_result: If set to True, API executions return instances of
+        :class:`c8.job.TransactionJob` that are populated with results on
+        commit. If set to False, API executions return None and no results are
+        tracked client-side.
+    :type return_result: bool
+    :param timeout: Timeout for waiting on collection locks. If set to 0, the
+        server waits indefinitely. If not set, system default value is used.
+    :type timeout: int
+    :param sync: Block until the transaction is synchronized to disk.
+    :type sync: bool
+    :param read: Names of collections read during the transaction.
+    :type read: [str | unicode]
+    :param write: Names of collections written to during the transaction.
+    :type write: [str | unicode]
+    """
+
+    def __init__(
+        self, connection, return_result, timeout=None, sync=None, read=None, write=None
+    ):
+        super(TransactionFabric, self).__init__(
+            connection=connection,
+            executor=TransactionExecutor(
+                connection=connection,
+                return_result=return_result,
+                timeout=timeout,
+                sync=sync,
+                read=read,
+                write=write,
+            ),
+        )
+
+    def __repr__(self):
+        return "<TransactionFabric {}>".format(self.name)
+
+    def _collection_names(self):
+        """Return the names of the collections in the fabric.
+
+        Queued requests only run on commit, so the collections are listed
+        right away, outside of the transaction.
+
+        :returns: Collection names.
+        :rtype: [str | unicode]
+        """
+        fabric = Fabric(connection=self._conn, executor=DefaultExecutor(self._conn))
+        return fabric._collection_names()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception, *_):
+        if exception is None:
+            self._executor.commit()
+
+    def queued_jobs(self):
+        """Return the queued transaction jobs.
+
+        :returns: Queued transaction jobs or None if **return_result** was set
+            to False during initialization.
+        :rtype: [c8.job.TransactionJob] | None
+        """
+        return self._executor.jobs
+
+    def commit(self):
+        """Execute the queued requests in a single transaction API request.
+
+        If **return_result** parameter was set to True during initialization,
+        :class:`c8.job.TransactionJob` instances are populated with results.
+
+        :returns: Transaction jobs or None if **return_result** parameter was
+            set to False during initialization.
+        :rtype: [c8.job.TransactionJob] | None
+        :raise c8.exceptions.TransactionStateError: If the transaction was
+            already committed.
+        :raise c8.exceptions.TransactionExecuteError: If commit fails.
+        """
+        return self._executor.commit()
+
+
+class ConcurrentFabric(Fabric):
+    """Fabric API wrapper tailored specifically for concurrent execution.
+
+    See :func:`c8.fabric.StandardFabric.begin_concurrent_execution`.
+
+    API executions return :class:`concurrent.futures.Future` objects. Helpers
+    which need a result client-side (e.g. :func:`c8.fabric.Fabric.collection`)
+    send their requests through the executor and wait for them.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param max_workers: Max number of requests in flight.
+    :type max_workers: int
+    """
+
+    def __init__(self, connection, max_workers):
+        super(ConcurrentFabric, self).__init__(
+            connection=connection,
+            executor=ConcurrentExecutor(connection, max_workers),
+        )
+
+    def __repr__(self):
+        return "<ConcurrentFabric {}>".format(self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+    @property
+    def redis(self):
+        """Return the Redis API wrapper.
+
+        :returns: Redis API wrapper.
+        :rtype: c8.redis.redis_commands.RedisCommands
+        """
+        return RedisCommands(self._conn, self._executor)
+
+    def _collection_names(self):
+        """Return the names of the collections in the fabric.
+
+        :returns: Collection names.
+        :rtype: [str | unicode]
+        """
+        return [col["name"] for col in self.collections().result()]
+
+    def shutdown(self, wait=True):
+        """Stop accepting API executions.
+
+        :param wait: Block until the pending API executions are done.
+        :type wait: bool
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class WriteBehindFabric(Fabric):
+    """Fabric API wrapper tailored specifically for write-behind execution.
+
+    See :func:`c8.fabric.StandardFabric.begin_write_behind_execution`.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param linger: Max time in seconds a write is buffered.
+    :type linger: int | float
+    :param max_batch_size: Max number of writes per bulk request.
+    :type max_batch_size: int
+    """
+
+    def __init__(self, connection, linger, max_batch_size):
+        super(WriteBehindFabric, self).__init__(
+            connection=connection,
+            executor=WriteBehindExecutor(connection, linger, max_batch_size),
+        )
+
+    def __repr__(self):
+        return "<WriteBehindFabric {}>".format(self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def flush(self):
+        """Send all buffered writes and wait for their results."""
+        self._executor.flush()
+
+    def close(self):
+        """Send all buffered writes and stop buffering new ones.
+
+        Writes issued after closing raise
+        :class:`c8.exceptions.WriteBehindStateError`.
+        """
+        self._executor.close()
@@ -1,6 +1,6 @@
-from json import dumps
 
 from c8.api import APIWrapper
+from c8.codec import dumps
 from c8.executor import DefaultExecutor
 from c8.function.core import FunctionServerError
 from c8.request import Request
@@ -290,7 +290,7 @@ class FunctionInterface(APIWrapper):
             "groupId": group_id,
             "hostName": host_name,
         }
-        request = Request(method="put", endpoint="/function/metadata", data=dumps(data))
+        request = Request(method="put", endpoint="/function/metadata", data=data)
 
         return self.execute(request, FunctionServerError)
 
@@ -354,7 +354,7 @@ class FunctionInterface(APIWrapper):
             "hostName": host_name,
         }
         request = Request(
-            method="post", endpoint="/function/metadata", data=dumps(data)
+            method="post", endpoint="/function/metadata", data=data
         )
 
         return self.execute(request, FunctionServerError)
@@ -163,6 +163,7 @@ class Graph(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise VertexCollectionCreateError(resp, request)
+            self._conn.metadata_cache.invalidate(self._conn.metadata_key("collections"))
             return self.vertex_collection(name)
 
         return self._execute(request, response_handler)
@@ -188,6 +189,7 @@ class Graph(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise VertexCollectionDeleteError(resp, request)
+            self._conn.metadata_cache.invalidate(self._conn.metadata_key("collections"))
             return True
 
         return self._execute(request, response_handler)
@@ -280,6 +282,7 @@ class Graph(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise EdgeDefinitionCreateError(resp, request)
+            self._conn.metadata_cache.invalidate(self._conn.metadata_key("collections"))
             return self.edge_collection(edge_collection)
 
         return self._execute(request, response_handler)
@@ -312,6 +315,7 @@ class Graph(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise EdgeDefinitionReplaceError(resp, request)
+            self._conn.metadata_cache.invalidate(self._conn.metadata_key("collections"))
             return self.edge_collection(edge_collection)
 
         return self._execute(request, response_handler)
@@ -338,6 +342,7 @@ class Graph(APIWrapper):
         def response_handler(resp):
             if not resp.is_success:
                 raise EdgeDefinitionDeleteError(resp, request)
+            self._conn.metadata_cache.invalidate(self._conn.metadata_key("collections"))
             return True
 
         return self._execute(request, response_handler)
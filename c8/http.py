@@ -1,15 +1,26 @@
 from __future__ import absolute_import, unicode_literals
 
+import asyncio
+import random
 import socket
+import threading
 import time
 from abc import ABCMeta, abstractmethod
+from email.utils import parsedate_to_datetime
+from types import GeneratorType
 
 import requests
 from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import port_by_scheme
+from urllib3.exceptions import NewConnectionError
+from urllib3.util import parse_url
 
 from c8.response import Response
 
-__all__ = ["HTTPClient", "DefaultHTTPClient"]
+__all__ = ["HTTPClient", "RetryPolicy", "DefaultHTTPClient", "AsyncIOHTTPClient"]
+
+# Size of the chunks streamed response bodies are read in.
+_STREAM_CHUNK_SIZE = 64 << 10
 
 
 class HTTPClient(object):  # pragma: no cover
@@ -19,11 +30,23 @@ class HTTPClient(object):  # pragma: no cover
 
     @abstractmethod
     def send_request(
-        self, method, url, headers=None, params=None, data=None, auth=None
+        self,
+        method,
+        url,
+        headers=None,
+        params=None,
+        data=None,
+        auth=None,
+        timeout=None,
+        idempotent=None,
+        stream=False,
     ):
         """Send an HTTP request.
 
-        This method must be overridden by the user.
+        This method must be overridden by the user. The **timeout**,
+        **idempotent** and **stream** arguments are only passed if the method
+        accepts them, so that clients implementing the former signature keep
+        working.
 
         :param method: HTTP method in lowercase (e.g. "post").
         :type method: str | unicode
@@ -37,12 +60,208 @@ class HTTPClient(object):  # pragma: no cover
         :type data: str | unicode | bool | int | list | dict
         :param auth: Username and password.
         :type auth: tuple
+        :param timeout: Connect and read timeouts in seconds, as a number or
+            a (connect, read) tuple. The client default is used if not set.
+        :type timeout: int | float | tuple
+        :param idempotent: Whether the request can be retried after it may
+            have reached the server. Defaults to whether the method is
+            idempotent.
+        :type idempotent: bool
+        :param stream: If set to True, the raw body of a successful response
+            may be an iterator of bytes chunks read while it is consumed,
+            instead of the whole body.
+        :type stream: bool
         :returns: HTTP response.
         :rtype: c8.response.Response
         """
         raise NotImplementedError
 
 
+class RetryPolicy(object):
+    """Retry policy for HTTP requests.
+
+    Failed attempts are retried after an exponential backoff with full jitter,
+    i.e. a random delay between 0 and ``backoff_factor * 2 ** attempt`` capped
+    at **max_backoff**. A ``Retry-After`` header sent with a retryable status
+    overrides the computed delay (still capped at **max_backoff**).
+
+    Requests which never reached the server (connection refused, connect
+    timeout) are retried for every HTTP method. Everything else (retryable
+    status codes, connections dropped mid-request, read timeouts) is only
+    retried for idempotent requests: those with an idempotent method, unless
+    the request says otherwise (see :class:`c8.request.Request`, e.g. cursor
+    and async job reads, which consume server-side state).
+
+    Retries are also limited by a budget shared by all requests using the
+    policy: every request deposits **budget_ratio** tokens (up to
+    **budget_cap**) and every retry spends one. When a node keeps failing,
+    the budget runs dry and requests fail fast instead of multiplying the load
+    on the server.
+
+    :param max_retries: Max number of retries per request.
+    :type max_retries: int
+    :param backoff_factor: Base delay in seconds.
+    :type backoff_factor: int | float
+    :param max_backoff: Max delay in seconds between two attempts.
+    :type max_backoff: int | float
+    :param retry_statuses: HTTP status codes to retry.
+    :type retry_statuses: [int]
+    :param retry_methods: HTTP methods (lowercase) considered idempotent.
+    :type retry_methods: [str | unicode]
+    :param respect_retry_after: Honor the ``Retry-After`` response header.
+    :type respect_retry_after: bool
+    :param budget_ratio: Tokens deposited in the retry budget per request.
+        Set to None to disable the budget.
+    :type budget_ratio: float | None
+    :param budget_cap: Max tokens held by the retry budget.
+    :type budget_cap: int | float
+    :param connect_timeout: Default connect timeout in seconds.
+    :type connect_timeout: int | float
+    :param read_timeout: Default read timeout in seconds.
+    :type read_timeout: int | float
+    """
+
+    IDEMPOTENT_METHODS = frozenset(["get", "head", "options", "put", "delete"])
+
+    def __init__(
+        self,
+        max_retries=5,
+        backoff_factor=0.25,
+        max_backoff=10,
+        retry_statuses=(429, 502, 503, 504),
+        retry_methods=IDEMPOTENT_METHODS,
+        respect_retry_after=True,
+        budget_ratio=0.2,
+        budget_cap=10,
+        connect_timeout=10,
+        read_timeout=260,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.lower() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_cap = budget_cap
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._tokens = budget_cap
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<RetryPolicy max_retries={}>".format(self.max_retries)
+
+    @property
+    def timeout(self):
+        """Return the default (connect, read) timeout.
+
+        :returns: Connect and read timeouts in seconds.
+        :rtype: (int | float, int | float)
+        """
+        return self.connect_timeout, self.read_timeout
+
+    def on_request(self):
+        """Deposit the per-request share into the retry budget."""
+        if self.budget_ratio is None:
+            return
+        with self._lock:
+            self._tokens = min(self.budget_cap, self._tokens + self.budget_ratio)
+
+    def _withdraw(self):
+        """Spend one retry from the budget.
+
+        :returns: True if the budget allowed the retry.
+        :rtype: bool
+        """
+        if self.budget_ratio is None:
+            return True
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def should_retry(
+        self, method, attempt, status_code=None, connect_error=False, idempotent=None
+    ):
+        """Decide whether a failed attempt is retried.
+
+        :param method: HTTP method in lowercase (e.g. "post").
+        :type method: str | unicode
+        :param attempt: Number of retries already made for the request.
+        :type attempt: int
+        :param status_code: HTTP status code, or None if no response was
+            received.
+        :type status_code: int | None
+        :param connect_error: True if the request never reached the server.
+        :type connect_error: bool
+        :param idempotent: Whether the request is idempotent. If not set, the
+            HTTP method decides.
+        :type idempotent: bool | None
+        :returns: True if the request should be retried.
+        :rtype: bool
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        if idempotent is None:
+            idempotent = method.lower() in self.retry_methods
+        if not connect_error and not idempotent:
+            return False
+        return self._withdraw()
+
+    def get_backoff(self, attempt, retry_after=None):
+        """Return the delay before the next attempt.
+
+        :param attempt: Number of retries already made for the request.
+        :type attempt: int
+        :param retry_after: Value of the ``Retry-After`` response header.
+        :type retry_after: str | unicode | None
+        :returns: Delay in seconds.
+        :rtype: float
+        """
+        if self.respect_retry_after and retry_after:
+            delay = self._parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def _parse_retry_after(value):
+        """Parse a ``Retry-After`` header (delta seconds or HTTP date).
+
+        :param value: Header value.
+        :type value: str | unicode
+        :returns: Delay in seconds, or None if the value is invalid.
+        :rtype: float | None
+        """
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _is_connect_error(error):
+    """Return True if the request failed before reaching the server.
+
+    :param error: Exception raised by requests.
+    :type error: requests.RequestException
+    :rtype: bool
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
 # KARTIK : 20181211 : C8Platform#166 : Remote disconnect issue.
 # https://github.com/joowani/python-arango/issues/30#issuecomment-333771027
 # Also see: https://github.com/requests/requests/issues/3808
@@ -55,20 +274,167 @@ class KeepaliveAdapter(requests.adapters.HTTPAdapter):
         ]
         super(KeepaliveAdapter, self).init_poolmanager(*args, **kwargs)
 
+    def host_pools(self):
+        """Return the per-host connection pools currently held.
+
+        :returns: Mapping of (scheme, host, port) to connection pool.
+        :rtype: dict
+        """
+        pools = self.poolmanager.pools
+        result = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                result[(pool.scheme, pool.host, pool.port)] = (key, pool)
+        return result
+
 
 class DefaultHTTPClient(HTTPClient):
-    """Default HTTP client implementation."""
+    """Default HTTP client implementation.
+
+    A separate connection pool is kept for every host the client talks to.
 
-    def __init__(self):
+    :param pool_connections: Number of per-host connection pools to cache.
+    :type pool_connections: int
+    :param pool_maxsize: Max number of connections kept per host pool. Set it
+        to at least the number of threads sharing the client, otherwise
+        connections are discarded and re-established under load.
+    :type pool_maxsize: int
+    :param pool_block: If set to True, requests wait for a free connection
+        when a host pool is exhausted instead of opening (and discarding) an
+        extra one.
+    :type pool_block: bool
+    :param pool_idle_timeout: Close the connections of a host pool once it has
+        not been used for this many seconds. If not set, connections are kept
+        until the server drops them.
+    :type pool_idle_timeout: int | float
+    :param retry_policy: Retry policy. Defaults to :class:`c8.http.RetryPolicy`
+        with its default settings.
+    :type retry_policy: c8.http.RetryPolicy
+    :param keep_raw_body: If set to False, responses release their raw body
+        once it has been deserialized (see :class:`c8.response.Response`).
+    :type keep_raw_body: bool
+    """
+
+    def __init__(
+        self,
+        pool_connections=requests.adapters.DEFAULT_POOLSIZE,
+        pool_maxsize=requests.adapters.DEFAULT_POOLSIZE,
+        pool_block=requests.adapters.DEFAULT_POOLBLOCK,
+        pool_idle_timeout=None,
+        retry_policy=None,
+        keep_raw_body=True,
+    ):
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._keep_raw_body = keep_raw_body
         self._session = requests.Session()
         # KARTIK : 20181211 : C8Platform#166 : Implement keepalive adapter
-        adapter = KeepaliveAdapter()
-        adapter.max_retries = 5
+        adapter = KeepaliveAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        # Retries are driven by the retry policy, not by urllib3.
+        adapter.max_retries = 0
         self._session.mount("https://", adapter)
         self._session.mount("http://", adapter)
+        self._adapter = adapter
+        self._pool_maxsize = pool_maxsize
+        self._pool_idle_timeout = pool_idle_timeout
+        self._last_used = {}
+        self._last_eviction = time.monotonic()
+
+    def _mark_used(self, url):
+        """Record the time a host pool was last used.
+
+        :param url: Request URL.
+        :type url: str | unicode
+        """
+        parsed = parse_url(url)
+        scheme = (parsed.scheme or "http").lower()
+        port = parsed.port or port_by_scheme.get(scheme, 80)
+        self._last_used[(scheme, (parsed.host or "").lower(), port)] = (
+            time.monotonic()
+        )
+
+    def evict_idle_connections(self, idle_timeout=None):
+        """Close the connections of host pools which have been idle too long.
+
+        :param idle_timeout: Idle time in seconds. Defaults to the
+            **pool_idle_timeout** given during initialization.
+        :type idle_timeout: int | float
+        :returns: Number of host pools evicted.
+        :rtype: int
+        """
+        idle_timeout = idle_timeout or self._pool_idle_timeout
+        if idle_timeout is None:
+            return 0
+
+        now = time.monotonic()
+        self._last_eviction = now
+        evicted = 0
+        for host, (key, _) in self._adapter.host_pools().items():
+            if now - self._last_used.get(host, 0) >= idle_timeout:
+                # Removing the pool from the manager closes its connections.
+                self._adapter.poolmanager.pools.pop(key, None)
+                self._last_used.pop(host, None)
+                evicted += 1
+        return evicted
+
+    def pool_stats(self):
+        """Return the utilization of the per-host connection pools.
+
+        :returns: One entry per host with the pool size ("maxsize"), number
+            of connections checked out ("in_use"), open connections waiting
+            for reuse ("idle"), and the total number of connections opened
+            ("connections") and requests sent ("requests") since the pool was
+            created. A "connections" count well above "maxsize" means the
+            pool is too small for the workload.
+        :rtype: [dict]
+        """
+        stats = []
+        for (scheme, host, port), (_, pool) in self._adapter.host_pools().items():
+            queue = pool.pool
+            free_slots = queue.qsize() if queue is not None else 0
+            idle = (
+                sum(1 for conn in list(queue.queue) if conn is not None)
+                if queue is not None
+                else 0
+            )
+            stats.append(
+                {
+                    "scheme": scheme,
+                    "host": host,
+                    "port": port,
+                    "maxsize": self._pool_maxsize,
+                    "in_use": max(self._pool_maxsize - free_slots, 0),
+                    "idle": idle,
+                    "connections": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+            )
+        return stats
+
+    @property
+    def retry_policy(self):
+        """Return the retry policy.
+
+        :returns: Retry policy.
+        :rtype: c8.http.RetryPolicy
+        """
+        return self._retry_policy
 
     def send_request(
-        self, method, url, params=None, data=None, headers=None, auth=None
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        auth=None,
+        timeout=None,
+        idempotent=None,
+        stream=False,
     ):
         """Send an HTTP request.
 
@@ -84,6 +450,16 @@ class DefaultHTTPClient(HTTPClient):
         :type data: str | unicode | bool | int | list | dict
         :param auth: Username and password.
         :type auth: tuple
+        :param timeout: Timeout in seconds, either a single value or a
+            (connect, read) tuple. Defaults to the retry policy timeouts.
+        :type timeout: int | float | (int | float, int | float)
+        :param idempotent: Whether the request can be retried after it may
+            have reached the server. If not set, the HTTP method decides.
+        :type idempotent: bool | None
+        :param stream: If set to True, the raw body of a 2XX response is an
+            iterator of bytes chunks read from the connection while it is
+            consumed. The connection returns to the pool once it is exhausted.
+        :type stream: bool
         :returns: HTTP response.
         :rtype: c8.response.Response
         """
@@ -95,8 +471,17 @@ class DefaultHTTPClient(HTTPClient):
                 del headers["Connection"]
             headers["Connection"] = "keep-alive"
 
-        retry = 5
-        time_sleep = 5
+        if (
+            self._pool_idle_timeout is not None
+            and time.monotonic() - self._last_eviction >= self._pool_idle_timeout
+        ):
+            self.evict_idle_connections()
+
+        policy = self._retry_policy
+        policy.on_request()
+        # Streamed bodies are consumed once sent and cannot be replayed.
+        replayable = not isinstance(data, GeneratorType)
+        attempt = 0
         while True:
             try:
                 raw_resp = self._session.request(
@@ -107,25 +492,218 @@ class DefaultHTTPClient(HTTPClient):
                     headers=headers,
                     auth=auth,
                     verify=False,
-                    timeout=260,
+                    timeout=timeout or policy.timeout,
+                    stream=stream,
                 )
-                break
-            except requests.ConnectionError:
-                if retry == 0:
+            except (requests.ConnectionError, requests.Timeout) as err:
+                connect_error = _is_connect_error(err)
+                if not (replayable or connect_error) or not policy.should_retry(
+                    method, attempt, connect_error=connect_error, idempotent=idempotent
+                ):
                     raise Exception(
                         "requests.ConnectionError: Not able to connect to "
                         "url: %s. Please make sure the federation is up and "
                         "running." % url
                     )
-                #  "Error in connecting the url. Retring..."
-                retry -= 1
-                time.sleep(time_sleep)
+                time.sleep(policy.get_backoff(attempt))
+                attempt += 1
+                continue
 
+            if not replayable or not policy.should_retry(
+                method, attempt, raw_resp.status_code, idempotent=idempotent
+            ):
+                break
+            # Release the connection back to the pool before retrying.
+            raw_resp.close()
+            time.sleep(
+                policy.get_backoff(attempt, raw_resp.headers.get("Retry-After"))
+            )
+            attempt += 1
+
+        self._mark_used(url)
+        if stream and 200 <= raw_resp.status_code < 300:
+            raw_body = raw_resp.iter_content(_STREAM_CHUNK_SIZE)
+        else:
+            raw_body = raw_resp.content
         return Response(
             method=raw_resp.request.method,
             url=raw_resp.url,
             headers=raw_resp.headers,
             status_code=raw_resp.status_code,
             status_text=raw_resp.reason,
-            raw_body=raw_resp.text,
+            raw_body=raw_body,
+            keep_raw_body=self._keep_raw_body,
         )
+
+
+async def _aiter_chunks(chunks):
+    """Wrap a generator of request body chunks into an async generator.
+
+    :param chunks: Request body chunks.
+    :type chunks: generator
+    """
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncIOHTTPClient(HTTPClient):
+    """Asyncio HTTP client implementation backed by aiohttp.
+
+    Unlike :class:`c8.http.DefaultHTTPClient`, :func:`send_request` is a
+    coroutine, so requests never block the running event loop. All requests
+    share a single aiohttp session (and its connection pool), which is created
+    lazily inside the running loop on first use.
+
+    :param limit: Max number of simultaneous connections in the pool.
+    :type limit: int
+    :param timeout: Total timeout per request in seconds.
+    :type timeout: int | float
+    :param verify: Verify SSL certificates.
+    :type verify: bool
+    :param retry_policy: Retry policy. Defaults to :class:`c8.http.RetryPolicy`
+        with its default settings.
+    :type retry_policy: c8.http.RetryPolicy
+    :param keep_raw_body: If set to False, responses release their raw body
+        once it has been deserialized (see :class:`c8.response.Response`).
+    :type keep_raw_body: bool
+    """
+
+    def __init__(
+        self,
+        limit=100,
+        timeout=260,
+        verify=False,
+        retry_policy=None,
+        keep_raw_body=True,
+    ):
+        try:
+            import aiohttp
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "aiohttp is required for AsyncIOHTTPClient. "
+                'Install it with: pip install "pyC8[asyncio]"'
+            )
+        self._aiohttp = aiohttp
+        self._limit = limit
+        self._timeout = timeout
+        self._verify = verify
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._keep_raw_body = keep_raw_body
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = self._aiohttp.TCPConnector(
+                limit=self._limit, ssl=None if self._verify else False
+            )
+            self._session = self._aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    async def send_request(
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        auth=None,
+        timeout=None,
+        idempotent=None,
+    ):
+        """Send an HTTP request without blocking the event loop.
+
+        :param method: HTTP method in lowercase (e.g. "post").
+        :type method: str | unicode
+        :param url: Request URL.
+        :type url: str | unicode
+        :param headers: Request headers.
+        :type headers: dict
+        :param params: URL (query) parameters.
+        :type params: dict
+        :param data: Request payload.
+        :type data: str | unicode | bool | int | list | dict
+        :param auth: Username and password.
+        :type auth: tuple
+        :param timeout: Timeout in seconds, either a single value (total) or
+            a (connect, read) tuple. Defaults to the client timeout.
+        :type timeout: int | float | (int | float, int | float)
+        :param idempotent: Whether the request can be retried after it may
+            have reached the server. If not set, the HTTP method decides.
+        :type idempotent: bool | None
+        :returns: HTTP response.
+        :rtype: c8.response.Response
+        """
+        kwargs = {}
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            kwargs["timeout"] = self._aiohttp.ClientTimeout(
+                sock_connect=connect, sock_read=read
+            )
+        elif timeout is not None:
+            kwargs["timeout"] = self._aiohttp.ClientTimeout(total=timeout)
+        if params is not None:
+            # aiohttp rejects None values, requests silently drops them.
+            params = {k: v for k, v in params.items() if v is not None}
+        if auth is not None:
+            auth = self._aiohttp.BasicAuth(*auth)
+        replayable = not isinstance(data, GeneratorType)
+        if not replayable:
+            # aiohttp streams async iterables with chunked transfer encoding.
+            data = _aiter_chunks(data)
+
+        policy = self._retry_policy
+        policy.on_request()
+        attempt = 0
+        while True:
+            try:
+                async with self._get_session().request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    headers=headers,
+                    auth=auth,
+                    **kwargs
+                ) as raw_resp:
+                    raw_body = await raw_resp.read()
+            except self._aiohttp.ClientConnectionError as err:
+                connect_error = isinstance(err, self._aiohttp.ClientConnectorError)
+                if not (replayable or connect_error) or not policy.should_retry(
+                    method, attempt, connect_error=connect_error, idempotent=idempotent
+                ):
+                    raise Exception(
+                        "aiohttp.ClientConnectionError: Not able to connect to "
+                        "url: %s. Please make sure the federation is up and "
+                        "running." % url
+                    )
+                await asyncio.sleep(policy.get_backoff(attempt))
+                attempt += 1
+                continue
+
+            if not replayable or not policy.should_retry(
+                method, attempt, raw_resp.status, idempotent=idempotent
+            ):
+                break
+            await asyncio.sleep(
+                policy.get_backoff(attempt, raw_resp.headers.get("Retry-After"))
+            )
+            attempt += 1
+
+        return Response(
+            method=raw_resp.method,
+            url=str(raw_resp.url),
+            headers=raw_resp.headers,
+            status_code=raw_resp.status,
+            status_text=raw_resp.reason,
+            raw_body=raw_body,
+            keep_raw_body=self._keep_raw_body,
+        )
+
+    async def close(self):
+        """Close the underlying session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 from c8.exceptions import (
@@ -7,7 +9,9 @@ from c8.exceptions import (
     AsyncJobClearError,
     AsyncJobResultError,
     AsyncJobStatusError,
+    AsyncJobTimeoutError,
     BatchJobResultError,
+    TransactionJobResultError,
 )
 from c8.request import Request
 
@@ -56,12 +60,13 @@ class AsyncJob(Job):
     :type response_handler: callable
     """
 
-    __slots__ = ["_conn", "_id", "_response_handler"]
+    __slots__ = ["_conn", "_id", "_response_handler", "_response"]
 
     def __init__(self, connection, job_id, response_handler):
         self._conn = connection
         self._id = job_id
         self._response_handler = response_handler
+        self._response = None
 
     def __repr__(self):
         return "<AsyncJob {}>".format(self._id)
@@ -105,27 +110,57 @@ class AsyncJob(Job):
 
         If the job raised an exception, it is propagated up at this point.
 
-        Once job result is retrieved, it is deleted from server and subsequent
-        queries for result will fail.
+        Once job result is retrieved, it is deleted from server. The job keeps
+        it, so subsequent calls return it without querying the server.
 
         :return: Async job result.
         :rtype: str | unicode | bool | int | list | dict
         :raise c8.exceptions.C8Error: If the job raised an exception.
         :raise c8.exceptions.AsyncJobResultError: If retrieval fails.
         """
-        request = Request(method="put", endpoint="/job/{}".format(self._id))
+        if self._response is None:
+            request, resp = self._fetch()
+            if self._response is None:
+                error_message = "job {} not done".format(self._id)
+                raise AsyncJobResultError(resp, request, error_message)
+        return self._response_handler(self._response)
+
+    def _fetch(self):
+        """Fetch the job response from server, if the job is done.
+
+        :return: Result request and its response (with status 204 if the job
+            is still pending).
+        :rtype: (c8.request.Request, c8.response.Response)
+        :raise c8.exceptions.AsyncJobResultError: If retrieval fails.
+        """
+        request = Request(
+            method="put",
+            endpoint="/job/{}".format(self._id),
+            idempotent=False,
+        )
         resp = self._conn.send_request(request)
         headers = resp.headers
         if "X-C8-Async-Id" in headers or "x-c8-async-id" in headers:
-            return self._response_handler(resp)
-        if resp.status_code == 204:
-            error_message = "job {} not done".format(self._id)
-            raise AsyncJobResultError(resp, request, error_message)
+            self._response = resp
+        elif resp.status_code == 204:
+            pass
         elif resp.error_code == 404:
             error_message = "job {} not found".format(self._id)
             raise AsyncJobResultError(resp, request, error_message)
         else:
             raise AsyncJobResultError(resp, request)
+        return request, resp
+
+    def _poll(self):
+        """Fetch the job response from server unless already fetched.
+
+        :return: True if the job is done.
+        :rtype: bool
+        :raise c8.exceptions.AsyncJobResultError: If retrieval fails.
+        """
+        if self._response is None:
+            self._fetch()
+        return self._response is not None
 
     def cancel(self, ignore_missing=False):
         """Cancel the async job.
@@ -174,6 +209,96 @@ class AsyncJob(Job):
             raise AsyncJobClearError(resp, request)
 
 
+def as_completed(
+    jobs, timeout=None, max_workers=8, min_interval=0.05, max_interval=2.0
+):
+    """Yield async jobs as they complete.
+
+    Pending jobs are polled in rounds, with at most **max_workers** requests
+    in flight. Polling a done job fetches its result, which deletes it from
+    server: the yielded jobs return their result (or raise their exception)
+    from :func:`c8.job.AsyncJob.result` without another round trip. The
+    interval between rounds doubles, up to **max_interval**, while no job
+    completes, and drops back to **min_interval** when one does.
+
+    :param jobs: Async jobs.
+    :type jobs: [c8.job.AsyncJob]
+    :param timeout: Max number of seconds to wait, or None to wait forever.
+    :type timeout: int | float | None
+    :param max_workers: Max number of concurrent polls.
+    :type max_workers: int
+    :param min_interval: Min number of seconds between polling rounds.
+    :type min_interval: int | float
+    :param max_interval: Max number of seconds between polling rounds.
+    :type max_interval: int | float
+    :return: Generator of done jobs.
+    :rtype: generator
+    :raise c8.exceptions.AsyncJobTimeoutError: If jobs are still pending
+        when the timeout expires.
+    :raise c8.exceptions.AsyncJobResultError: If polling a job fails.
+    """
+    pending = list(dict.fromkeys(jobs))
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = min_interval
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending:
+            done = list(pool.map(AsyncJob._poll, pending))
+            still_pending = []
+            for job, is_done in zip(pending, done):
+                if is_done:
+                    yield job
+                else:
+                    still_pending.append(job)
+            if not still_pending:
+                return
+            if len(still_pending) < len(pending):
+                interval = min_interval
+            else:
+                interval = min(interval * 2, max_interval)
+            pending = still_pending
+
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise AsyncJobTimeoutError(
+                        "{} async jobs not done".format(len(pending))
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+
+def wait_all(jobs, timeout=None, max_workers=8, min_interval=0.05, max_interval=2.0):
+    """Wait for async jobs to complete.
+
+    See :func:`c8.job.as_completed` for how jobs are polled.
+
+    :param jobs: Async jobs.
+    :type jobs: [c8.job.AsyncJob]
+    :param timeout: Max number of seconds to wait, or None to wait forever.
+    :type timeout: int | float | None
+    :param max_workers: Max number of concurrent polls.
+    :type max_workers: int
+    :param min_interval: Min number of seconds between polling rounds.
+    :type min_interval: int | float
+    :param max_interval: Max number of seconds between polling rounds.
+    :type max_interval: int | float
+    :return: Done jobs and jobs still pending after the timeout, in the
+        order given.
+    :rtype: ([c8.job.AsyncJob], [c8.job.AsyncJob])
+    :raise c8.exceptions.AsyncJobResultError: If polling a job fails.
+    """
+    jobs = list(jobs)
+    try:
+        for _ in as_completed(jobs, timeout, max_workers, min_interval, max_interval):
+            pass
+    except AsyncJobTimeoutError:
+        pass
+    done = [job for job in jobs if job._response is not None]
+    pending = [job for job in jobs if job._response is None]
+    return done, pending
+
+
 class BatchJob(Job):
     """Job for tracking and retrieving result of batch execution.
 
@@ -225,3 +350,54 @@ class BatchJob(Job):
         if self._status == "pending":
             raise BatchJobResultError("result not available yet")
         return self._response_handler(self._response)
+
+
+class TransactionJob(Job):
+    """Transaction API execution job.
+
+    :param response_handler: HTTP response handler.
+    :type response_handler: callable
+    """
+
+    __slots__ = ["_id", "_status", "_response", "_response_handler"]
+
+    def __init__(self, response_handler):
+        self._id = uuid4().hex
+        self._status = "pending"
+        self._response = None
+        self._response_handler = response_handler
+
+    def __repr__(self):
+        return "<TransactionJob {}>".format(self._id)
+
+    @property
+    def id(self):
+        """Return the transaction job ID.
+
+        :return: Transaction job ID.
+        :rtype: str | unicode
+        """
+        return self._id
+
+    def status(self):
+        """Return the transaction job status.
+
+        :return: Transaction job status. Possible values are "pending" (job is
+            waiting for transaction to be committed), or "done" (transaction
+            was committed and the job is updated with the result).
+        :rtype: str | unicode
+        """
+        return self._status
+
+    def result(self):
+        """Return the transaction job result.
+
+        :return: Transaction job result.
+        :rtype: str | unicode | bool | int | list | dict
+        :raise c8.exceptions.C8Error: If the job raised an exception.
+        :raise c8.exceptions.TransactionJobResultError: If job result is not
+            available (i.e. transaction is not committed yet).
+        """
+        if self._status == "pending":
+            raise TransactionJobResultError("result not available yet")
+        return self._response_handler(self._response)
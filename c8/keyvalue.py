@@ -1,8 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
-from json import dumps
-
 from c8.api import APIWrapper
+from c8.cursor import Cursor
 from c8.exceptions import (
     CreateCollectionError,
     DeleteCollectionError,
@@ -16,6 +15,7 @@ from c8.exceptions import (
     RemoveKVError,
 )
 from c8.request import Request
+from c8.utils import keyset_query
 
 
 class KV(APIWrapper):
@@ -69,6 +69,7 @@ class KV(APIWrapper):
                 raise CreateCollectionError(resp, request)
             else:
                 if resp.body["error"] is False and resp.body["name"] == name:
+                    self._conn.metadata_cache.add(self._conn.metadata_key("kv"), name)
                     return True
                 else:
                     return False
@@ -78,20 +79,18 @@ class KV(APIWrapper):
     def has_collection(self, name):
         """Checks if a Collection exists.
 
+        The collection names are cached (see :class:`c8.cache.MetadataCache`).
+
         :param name: Collection name.
         :type name: str | unicode
         :return: True if the collection exists.
         :rtype: boolean
         """
-        exists = False
-        collections = self.get_collections()
-        for collection in collections:
-            if collection["name"] == name:
-                exists = True
-                break
-            else:
-                exists = False
-        return exists
+        names = self._conn.metadata_cache.names(
+            self._conn.metadata_key("kv"),
+            lambda: [collection["name"] for collection in self.get_collections()],
+        )
+        return name in names
 
     def delete_collection(self, name):
         """Deletes Collection.
@@ -108,6 +107,9 @@ class KV(APIWrapper):
                 raise DeleteCollectionError(resp, request)
             else:
                 if resp.body["error"] is False and resp.body["name"] == name:
+                    self._conn.metadata_cache.discard(
+                        self._conn.metadata_key("kv"), name
+                    )
                     return True
                 else:
                     return False
@@ -126,7 +128,7 @@ class KV(APIWrapper):
         :raise c8.exceptions.InsertKVError: If insertion fails.
         """
         request = Request(
-            method="put", endpoint="/kv/{}/value".format(name), data=dumps(data)
+            method="put", endpoint="/kv/{}/value".format(name), data=data
         )
 
         def response_handler(resp):
@@ -173,7 +175,7 @@ class KV(APIWrapper):
         :raise c8.exceptions.DeleteEntryForKey: If deletion fails.
         """
         request = Request(
-            method="delete", endpoint="/kv/{}/values".format(name), data=dumps(keys)
+            method="delete", endpoint="/kv/{}/values".format(name), data=keys
         )
 
         def response_handler(resp):
@@ -205,7 +207,48 @@ class KV(APIWrapper):
 
         return self._execute(request, response_handler)
 
-    def get_keys(self, name, offset=None, limit=None, order=None):
+    def _keyset_page(self, name, error, after, limit, descending, keys_only):
+        """Return a page of key-value pairs in key order (keyset pagination).
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :param error: Exception raised if the request fails.
+        :type error: type
+        :param after: Return the pairs with keys after this key, in key order.
+        :type after: str | unicode | None
+        :param limit: Max number of pairs returned.
+        :type limit: int
+        :param descending: Walk the keys in descending order.
+        :type descending: bool
+        :param keys_only: Return the keys instead of the pairs.
+        :type keys_only: bool
+        :return: Keys, or pairs with their "_key", "value" and "expireAt".
+        :rtype: list
+        :raise ValueError: If the execution context defers responses.
+        """
+        self._check_sync_context("keyset pagination")
+        request = Request(
+            method="post",
+            endpoint="/cursor",
+            data=keyset_query(
+                name,
+                after=after,
+                limit=limit,
+                fields=["value", "expireAt"],
+                descending=descending,
+                keys_only=keys_only,
+            ),
+            read=name,
+        )
+
+        def response_handler(resp):
+            if not resp.is_success:
+                raise error(resp, request)
+            return list(Cursor(self._conn, resp.body))
+
+        return self._execute(request, response_handler)
+
+    def get_keys(self, name, offset=None, limit=None, order=None, start_after=None):
         """gets keys of a collection.
 
         :param name: Collection name.
@@ -216,10 +259,30 @@ class KV(APIWrapper):
         :type limit: int
         :param order: Order the results ascending (asc) or descending (desc).
         :type order: str | unicode
+        :param start_after: Return the keys following this key in the given
+            order (keyset pagination). Pass the last key of the previous page
+            to get the next one; the cost of a page does not depend on its
+            position. Cannot be combined with **offset**. Requires the default
+            execution context.
+        :type start_after: str | unicode
         :return: List of Keys.
         :rtype: list
+        :raise ValueError: If **start_after** is combined with **offset** or
+            used in an execution context deferring responses (e.g. batch).
         :raise c8.exceptions.GetKeysError: If request fails.
         """
+        if start_after is not None:
+            if offset is not None:
+                raise ValueError("offset cannot be combined with start_after")
+            return self._keyset_page(
+                name,
+                GetKeysError,
+                after=start_after,
+                limit=1000 if limit is None else limit,
+                descending=order == "desc",
+                keys_only=True,
+            )
+
         params = {}
         if offset is not None:
             params["offset"] = offset
@@ -240,6 +303,35 @@ class KV(APIWrapper):
 
         return self._execute(request, response_handler)
 
+    def iter_keys(self, name, page_size=1000, start_after=None, order=None):
+        """Yield all keys of a collection, page by page.
+
+        Pages are read with keyset pagination, so walking the whole collection
+        is a single linear pass and only one page is held in memory.
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :param page_size: Number of keys fetched in one round trip.
+        :type page_size: int
+        :param start_after: Start after this key instead of the first key.
+        :type start_after: str | unicode
+        :param order: Order the results ascending (asc) or descending (desc).
+        :type order: str | unicode
+        :return: Generator of keys.
+        :rtype: generator
+        :raise c8.exceptions.GetKeysError: If request fails.
+        """
+        after = start_after
+        while True:
+            keys = self._keyset_page(
+                name, GetKeysError, after, page_size, order == "desc", True
+            )
+            for key in keys:
+                yield key
+            if len(keys) < page_size:
+                return
+            after = keys[-1]
+
     def get_kv_count(self, name):
         """gets the kv count of a collection.
 
@@ -259,7 +351,7 @@ class KV(APIWrapper):
 
         return self._execute(request, response_handler)
 
-    def get_key_value_pairs(self, name, offset=None, limit=None):
+    def get_key_value_pairs(self, name, offset=None, limit=None, start_after=None):
         """Fetch key-value pairs from collection. Optional list of keys
         Note: Max limit is 100 keys per request.
 
@@ -269,10 +361,34 @@ class KV(APIWrapper):
         :type offset: int
         :param limit: Limit to simulate paging.
         :type limit: int
-        :return: The key value pairs from the collection.
-        :rtype: object
+        :param start_after: Return the pairs following this key in key order
+            (keyset pagination). Pass the last key of the previous page to get
+            the next one; the cost of a page does not depend on its position.
+            Cannot be combined with **offset**. Requires the default execution
+            context.
+        :type start_after: str | unicode
+        :return: The key value pairs from the collection, in the "result"
+            list of the response body. With **start_after**, the pairs are
+            read through a cursor and the returned dict only holds the
+            "result" list.
+        :rtype: dict
+        :raise ValueError: If **start_after** is combined with **offset** or
+            used in an execution context deferring responses (e.g. batch).
         :raise c8.exceptions.GetKVError: If request fails.
         """
+        if start_after is not None:
+            if offset is not None:
+                raise ValueError("offset cannot be combined with start_after")
+            pairs = self._keyset_page(
+                name,
+                GetKVError,
+                after=start_after,
+                limit=100 if limit is None else limit,
+                descending=False,
+                keys_only=False,
+            )
+            return {"result": pairs}
+
         params = {}
         if offset is not None:
             params["offset"] = offset
@@ -291,6 +407,31 @@ class KV(APIWrapper):
 
         return self._execute(request, response_handler)
 
+    def iter_key_value_pairs(self, name, page_size=100, start_after=None):
+        """Yield all key-value pairs of a collection in key order, page by page.
+
+        Pages are read with keyset pagination, so walking the whole collection
+        is a single linear pass and only one page is held in memory.
+
+        :param name: Collection name.
+        :type name: str | unicode
+        :param page_size: Number of pairs fetched in one round trip.
+        :type page_size: int
+        :param start_after: Start after this key instead of the first key.
+        :type start_after: str | unicode
+        :return: Generator of pairs with their "_key", "value" and "expireAt".
+        :rtype: generator
+        :raise c8.exceptions.GetKVError: If request fails.
+        """
+        after = start_after
+        while True:
+            pairs = self._keyset_page(name, GetKVError, after, page_size, False, False)
+            for pair in pairs:
+                yield pair
+            if len(pairs) < page_size:
+                return
+            after = pairs[-1]["_key"]
+
     def remove_key_value_pairs(self, name):
         """Remove all key-value pairs in a collection
 
@@ -0,0 +1,224 @@
+from __future__ import absolute_import, unicode_literals
+
+import codecs
+from uuid import uuid4
+
+__all__ = ["MultipartWriter", "MultipartPart", "iter_multipart"]
+
+_CRLF = "\r\n"
+
+
+class MultipartWriter(object):
+    """Incremental writer of multipart batch request bodies.
+
+    Parts are rendered one at a time while the body is sent, so a batch is
+    never held in memory as a whole. A body ends once it holds **max_parts**
+    parts or **max_bytes** bytes (but at least one part), and the remaining
+    parts go to the next body: call :func:`body` until :func:`has_more`
+    returns False.
+
+    :param parts: Content IDs and requests (rendered with ``str``).
+    :type parts: iterable
+    :param boundary: Multipart boundary. Defaults to a random one.
+    :type boundary: str | unicode
+    :param max_parts: Max number of parts in a body, or None for no limit.
+    :type max_parts: int | None
+    :param max_bytes: Max size of a body in bytes, or None for no limit.
+    :type max_bytes: int | None
+    """
+
+    def __init__(self, parts, boundary=None, max_parts=None, max_bytes=None):
+        self.boundary = boundary or uuid4().hex
+        self._parts = iter(parts)
+        self._max_parts = max_parts
+        self._max_bytes = max_bytes
+        self._pending = None
+        self.content_ids = []
+
+    @property
+    def content_type(self):
+        """Return the content type of the bodies.
+
+        :returns: Content type with the boundary.
+        :rtype: str | unicode
+        """
+        return "multipart/form-data; boundary={}".format(self.boundary)
+
+    def _peek(self):
+        """Return the next part without consuming it.
+
+        :returns: Content ID and encoded part, or None if there are no parts
+            left.
+        :rtype: (str | unicode, bytes) | None
+        """
+        if self._pending is None:
+            try:
+                content_id, request = next(self._parts)
+            except StopIteration:
+                return None
+            part = (
+                "--{}\r\n"
+                "Content-Type: application/x-c8-batchpart\r\n"
+                "Content-Id: {}\r\n"
+                "\r\n"
+                "{}\r\n".format(self.boundary, content_id, request)
+            )
+            self._pending = (content_id, part.encode("utf-8"))
+        return self._pending
+
+    def has_more(self):
+        """Return True if parts are left for another body.
+
+        :rtype: bool
+        """
+        return self._peek() is not None
+
+    def body(self):
+        """Return the next request body.
+
+        The content IDs of the parts written are listed in **content_ids**
+        once the body has been consumed.
+
+        :returns: Generator of body chunks.
+        :rtype: generator
+        """
+        self.content_ids = []
+        size = 0
+        while True:
+            pending = self._peek()
+            if pending is None:
+                break
+            content_id, part = pending
+            count = len(self.content_ids)
+            if count and (
+                (self._max_parts is not None and count >= self._max_parts)
+                or (self._max_bytes is not None and size + len(part) > self._max_bytes)
+            ):
+                break
+            self._pending = None
+            self.content_ids.append(content_id)
+            size += len(part)
+            yield part
+        yield "--{}--".format(self.boundary).encode("utf-8")
+
+
+class MultipartPart(object):
+    """Part of a multipart batch response.
+
+    :ivar content_id: Content ID of the part (i.e. of the request).
+    :vartype content_id: str | unicode | None
+    :ivar status_code: Status code of the embedded HTTP response.
+    :vartype status_code: int
+    :ivar status_text: Status text of the embedded HTTP response.
+    :vartype status_text: str | unicode
+    :ivar headers: Headers of the embedded HTTP response, in lowercase.
+    :vartype headers: dict
+    :ivar body: Body of the embedded HTTP response.
+    :vartype body: str | unicode
+    """
+
+    __slots__ = ["content_id", "status_code", "status_text", "headers", "body"]
+
+    def __init__(self, content_id, status_code, status_text, headers, body):
+        self.content_id = content_id
+        self.status_code = status_code
+        self.status_text = status_text
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self):
+        return "<MultipartPart {} {}>".format(self.content_id, self.status_code)
+
+
+def _parse_headers(head):
+    """Parse header lines.
+
+    :param head: Header lines.
+    :type head: str | unicode
+    :returns: Headers, with lowercase names.
+    :rtype: dict
+    """
+    headers = {}
+    for line in head.split(_CRLF):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _parse_part(text):
+    """Parse a batch response part.
+
+    :param text: Part between two delimiters.
+    :type text: str | unicode
+    :returns: Parsed part.
+    :rtype: c8.multipart.MultipartPart
+    :raise ValueError: If the part is malformed.
+    """
+    # The delimiter line ends with optional padding and a line break.
+    text = text.split(_CRLF, 1)[1] if _CRLF in text else ""
+    head, sep, message = text.partition(_CRLF * 2)
+    if not sep:
+        raise ValueError("batch response part has no HTTP response")
+    part_headers = _parse_headers(head)
+
+    head, _, body = message.partition(_CRLF * 2)
+    status_line, _, head = head.partition(_CRLF)
+    fields = status_line.split(" ", 2)
+    if len(fields) < 2 or not fields[1].isdigit():
+        raise ValueError("bad status line in batch part: {!r}".format(status_line))
+    return MultipartPart(
+        content_id=part_headers.get("content-id"),
+        status_code=int(fields[1]),
+        status_text=fields[2] if len(fields) > 2 else "",
+        headers=_parse_headers(head),
+        body=body,
+    )
+
+
+def iter_multipart(chunks, boundary):
+    """Parse a multipart batch response incrementally.
+
+    Parts are yielded as soon as they are complete, so only the part being
+    received is buffered. Part bodies may contain line breaks.
+
+    :param chunks: Response body chunks.
+    :type chunks: iterable
+    :param boundary: Multipart boundary.
+    :type boundary: str | unicode
+    :returns: Generator of parts.
+    :rtype: generator
+    :raise ValueError: If the response is malformed.
+    """
+    delimiter = _CRLF + "--" + boundary
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    # Start as if after a line break, so that the first delimiter matches.
+    buffer = _CRLF
+    start = 0
+    first = True
+    after_delimiter = False
+    for chunk in chunks:
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = decoder.decode(chunk)
+        buffer += chunk
+        while True:
+            if after_delimiter:
+                if len(buffer) < 2:
+                    break
+                if buffer.startswith("--"):
+                    return
+                after_delimiter = False
+            index = buffer.find(delimiter, start)
+            if index < 0:
+                # Resume the search where a delimiter may start.
+                start = max(0, len(buffer) - len(delimiter))
+                break
+            if not first:
+                yield _parse_part(buffer[:index])
+            first = False
+            buffer = buffer[index + len(delimiter) :]
+            start = 0
+            after_delimiter = True
+    if first:
+        raise ValueError("no parts in batch response")
+    raise ValueError("batch response is truncated")
@@ -0,0 +1,431 @@
+"""Local RESP gateway for the Redis API.
+
+Services speaking the Redis protocol can connect to the gateway, which runs
+their commands through :class:`c8.redis.redis_commands.RedisCommands`::
+
+    python -m c8.redis.gateway --host play.macrometa.io --apikey KEY \\
+        --collection cache
+
+Commands pipelined by a client are sent upstream together in a batch request,
+and upstream requests run on a bounded thread pool sharing the connection pool
+of the HTTP client, so that many clients can be served concurrently.
+"""
+import argparse
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from c8.client import C8Client
+from c8.exceptions import C8Error
+from c8.redis.redis_commands import RedisCommands
+
+__all__ = ["RedisGateway", "RESPParser", "SimpleString", "encode_reply", "main"]
+
+logger = logging.getLogger(__name__)
+
+# Commands sent upstream: one per RedisCommands method.
+_COMMANDS = frozenset(
+    name.upper()
+    for name in dir(RedisCommands)
+    if not name.startswith("_") and name not in ("pipeline", "execute_command")
+)
+
+# Commands replying with a status, sent as a simple string rather than a
+# bulk string.
+_STATUS_COMMANDS = frozenset(
+    [
+        "FLUSHDB",
+        "HMSET",
+        "LSET",
+        "LTRIM",
+        "MSET",
+        "PING",
+        "PSETEX",
+        "RENAME",
+        "RESET",
+        "SET",
+        "SETEX",
+        "TYPE",
+    ]
+)
+
+_MAX_LINE = 64 << 10
+
+
+class SimpleString(str):
+    """
+    Status reply, encoded as a RESP simple string (e.g. ``+OK``).
+
+    Other strings are encoded as bulk strings, whatever their value.
+    """
+
+
+def encode_reply(value):
+    """
+    Encode a command result in RESP.
+
+    :param value: Result or exception.
+    :type value: str | c8.redis.gateway.SimpleString | int | float | list | dict |
+        Exception | None
+    :returns: Encoded reply
+    :rtype: bytes
+    """
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, Exception):
+        message = getattr(value, "error_message", None) or str(value)
+        message = " ".join(message.split())
+        return "-ERR {}\r\n".format(message).encode("utf-8")
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, dict):
+        value = [item for pair in value.items() for item in pair]
+    if isinstance(value, (list, tuple)):
+        return b"*%d\r\n" % len(value) + b"".join(encode_reply(v) for v in value)
+    if isinstance(value, SimpleString):
+        return "+{}\r\n".format(" ".join(value.split())).encode("utf-8")
+    if not isinstance(value, bytes):
+        value = str(value).encode("utf-8")
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class RESPParser(object):
+    """
+    Incremental parser of RESP commands.
+
+    Commands are arrays of bulk strings, or inline commands (e.g. sent with
+    telnet). Incomplete commands are buffered until the next data is fed.
+
+    :param max_bulk_size: Max size in bytes of a command argument.
+    :type max_bulk_size: int
+    """
+
+    def __init__(self, max_bulk_size=512 << 20):
+        self._buffer = bytearray()
+        self._max_bulk_size = max_bulk_size
+
+    def feed(self, data):
+        """
+        Parse received data.
+
+        :param data: Received data
+        :type data: bytes
+        :returns: Complete commands, as lists of strings
+        :rtype: [[str]]
+        :raise ValueError: If the data is not valid RESP.
+        """
+        self._buffer += data
+        commands = []
+        pos = 0
+        while pos < len(self._buffer):
+            parsed = self._parse(pos)
+            if parsed is None:
+                break
+            command, pos = parsed
+            if command:
+                commands.append(command)
+        del self._buffer[:pos]
+        return commands
+
+    def _line(self, pos, end=b"\r\n"):
+        index = self._buffer.find(end, pos)
+        if index < 0:
+            if len(self._buffer) - pos > _MAX_LINE:
+                raise ValueError("line too long")
+            return None, pos
+        return bytes(self._buffer[pos:index]), index + len(end)
+
+    @staticmethod
+    def _length(line, limit):
+        try:
+            length = int(line[1:])
+        except ValueError:
+            raise ValueError("invalid length {!r}".format(line))
+        if length > limit:
+            raise ValueError("length {} exceeds {}".format(length, limit))
+        return length
+
+    def _parse(self, pos):
+        """
+        Parse the command starting at pos.
+
+        :returns: Command and position after it, or None if incomplete.
+        :rtype: ([str], int) | None
+        """
+        if self._buffer[pos : pos + 1] != b"*":
+            line, pos = self._line(pos, b"\n")
+            if line is None:
+                return None
+            return [arg.decode("utf-8") for arg in line.split()], pos
+
+        line, pos = self._line(pos)
+        if line is None:
+            return None
+        count = self._length(line, 1 << 20)
+        args = []
+        for _ in range(count):
+            line, pos = self._line(pos)
+            if line is None:
+                return None
+            if not line.startswith(b"$"):
+                raise ValueError("expected '$', got {!r}".format(line[:1]))
+            size = self._length(line, self._max_bulk_size)
+            if size < 0:
+                raise ValueError("invalid bulk length {}".format(size))
+            if len(self._buffer) < pos + size + 2:
+                return None
+            args.append(bytes(self._buffer[pos : pos + size]).decode("utf-8"))
+            pos += size + 2
+        return args, pos
+
+
+class RedisGateway(object):
+    """
+    RESP server running commands through the Redis API.
+
+    Clients can switch collections with ``SELECT <collection>``, and go back
+    to the default one with ``SELECT 0``.
+
+    :param redis: Redis commands interface
+    :type redis: c8.redis.redis_commands.RedisCommands
+    :param collection: Default collection commands run against
+    :type collection: str
+    :param max_workers: Max number of upstream requests in flight. Should not
+        exceed the connection pool size of the HTTP client.
+    :type max_workers: int
+    :param max_pipeline: Max number of commands sent in one upstream request.
+    :type max_pipeline: int
+    """
+
+    def __init__(self, redis, collection, max_workers=16, max_pipeline=1000):
+        self._redis = redis
+        self._collection = collection
+        self._max_pipeline = max_pipeline
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="c8-redis-gateway"
+        )
+        self._server = None
+
+    def __repr__(self):
+        return "<RedisGateway {}>".format(self._collection)
+
+    @property
+    def sockets(self):
+        """
+        Return the listening sockets.
+
+        :returns: Listening sockets, or an empty list if not started
+        :rtype: list
+        """
+        return list(self._server.sockets) if self._server is not None else []
+
+    async def start(self, host="127.0.0.1", port=6379):
+        """
+        Start listening for client connections.
+
+        :param host: Address to listen on
+        :type host: str
+        :param port: Port to listen on, or 0 for any free port
+        :type port: int
+        :returns: Server
+        :rtype: asyncio.AbstractServer
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def serve_forever(self, host="127.0.0.1", port=6379):
+        """
+        Listen and serve client connections until cancelled.
+
+        :param host: Address to listen on
+        :type host: str
+        :param port: Port to listen on
+        :type port: int
+        """
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        """
+        Stop listening and release the upstream workers.
+        """
+        if self._server is not None:
+            self._server.close()
+        self._pool.shutdown(wait=False)
+
+    def _run(self, collection, commands):
+        """
+        Run commands upstream, in a single request if there are several.
+
+        :param collection: Collection the commands run against
+        :type collection: str
+        :param commands: Commands
+        :type commands: [[str]]
+        :returns: Results or exceptions, in order
+        :rtype: list
+        """
+        try:
+            if len(commands) == 1:
+                name, args = commands[0][0].upper(), commands[0][1:]
+                results = [self._redis.execute_command(name, collection, *args)]
+            else:
+                pipe = self._redis.pipeline(max_batch_size=self._max_pipeline)
+                for command in commands:
+                    pipe.execute_command(command[0].upper(), collection, *command[1:])
+                results = pipe.execute(raise_on_error=False)
+        except C8Error as err:
+            return [err] * len(commands)
+        except Exception as err:
+            logger.warning("upstream request failed: %s", err)
+            return [err] * len(commands)
+        replies = []
+        for command, result in zip(commands, results):
+            if isinstance(result, dict):
+                result = result.get("result")
+            if isinstance(result, str) and command[0].upper() in _STATUS_COMMANDS:
+                result = SimpleString(result)
+            replies.append(result)
+        return replies
+
+    async def _dispatch(self, commands, state):
+        """
+        Run the commands of a client, in order.
+
+        Consecutive upstream commands are sent together. Connection commands
+        are answered locally.
+
+        :param commands: Commands
+        :type commands: [[str]]
+        :param state: Connection state
+        :type state: dict
+        :returns: Results or exceptions, in order
+        :rtype: list
+        """
+        loop = asyncio.get_running_loop()
+        replies = []
+        batch = []
+        for command in commands + [None]:
+            name = command[0].upper() if command is not None else None
+            if name in _COMMANDS:
+                batch.append(command)
+                continue
+            if batch:
+                replies += await loop.run_in_executor(
+                    self._pool, self._run, state["collection"], batch
+                )
+                batch = []
+
+            if name is None:
+                break
+            elif name == "QUIT":
+                state["closed"] = True
+                replies.append(SimpleString("OK"))
+                break
+            elif name == "SELECT" and len(command) == 2:
+                state["collection"] = (
+                    self._collection if command[1] == "0" else command[1]
+                )
+                replies.append(SimpleString("OK"))
+            elif name == "CLIENT":
+                replies.append(SimpleString("OK"))
+            elif name == "COMMAND":
+                replies.append([])
+            else:
+                replies.append(ValueError("unknown command '{}'".format(command[0])))
+        return replies
+
+    async def _handle(self, reader, writer):
+        """
+        Serve a client connection.
+
+        :param reader: Client stream reader
+        :type reader: asyncio.StreamReader
+        :param writer: Client stream writer
+        :type writer: asyncio.StreamWriter
+        """
+        parser = RESPParser()
+        state = {"collection": self._collection, "closed": False}
+        try:
+            while not state["closed"]:
+                # Commands pipelined while the previous ones ran upstream are
+                # read at once, so that they are sent together.
+                data = await reader.read(1 << 16)
+                if not data:
+                    break
+                try:
+                    commands = parser.feed(data)
+                except ValueError as err:
+                    error = ValueError("Protocol error: {}".format(err))
+                    writer.write(encode_reply(error))
+                    break
+                replies = await self._dispatch(commands, state)
+                writer.write(b"".join(encode_reply(reply) for reply in replies))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv=None):
+    """
+    Run the gateway from the command line.
+
+    :param argv: Command line arguments. Defaults to sys.argv.
+    :type argv: [str]
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m c8.redis.gateway",
+        description="Serve the Redis protocol on top of the Macrometa Redis API.",
+    )
+    parser.add_argument("--bind", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=6379, help="port to listen on")
+    parser.add_argument("--host", default="play.macrometa.io")
+    parser.add_argument("--protocol", default="https", choices=["http", "https"])
+    parser.add_argument("--fabric", default="_system")
+    parser.add_argument("--collection", required=True, help="default collection")
+    parser.add_argument("--apikey", default=os.environ.get("C8_APIKEY"))
+    parser.add_argument("--token", default=os.environ.get("C8_TOKEN"))
+    parser.add_argument("--email", default=os.environ.get("C8_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("C8_PASSWORD"))
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=16,
+        help="max number of upstream requests in flight",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    client = C8Client(
+        protocol=args.protocol,
+        host=args.host,
+        port=443 if args.protocol == "https" else 80,
+        geofabric=args.fabric,
+        email=args.email,
+        password=args.password,
+        apikey=args.apikey,
+        token=args.token,
+        pool_maxsize=args.max_workers,
+        pool_block=True,
+    )
+    gateway = RedisGateway(client.redis, args.collection, args.max_workers)
+    logger.info("listening on %s:%d", args.bind, args.port)
+    try:
+        asyncio.run(gateway.serve_forever(args.bind, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        gateway.close()
+
+
+if __name__ == "__main__":
+    main()
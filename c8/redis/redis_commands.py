@@ -1,11 +1,53 @@
-from c8.executor import DefaultExecutor
+from c8.executor import BatchExecutor, DefaultExecutor
+from c8.redis.core import RedisServerError
 from c8.redis.redis_interface import RedisInterface
 
 
 class RedisCommands(object):
-    def __init__(self, connection):
+    def __init__(self, connection, executor=None):
         self._conn = connection
-        self._executor = DefaultExecutor(connection)
+        self._executor = executor or DefaultExecutor(connection)
+
+    def pipeline(
+        self, single_request=False, max_batch_size=1000, max_batch_bytes=16 << 20
+    ):
+        """
+        Return a pipeline that queues commands and sends them together in batch
+        API requests, instead of one request per command.
+
+        :param single_request: If set to True, the commands are always sent in
+            a single request, which is never split. This is not a transaction:
+            commands before a failed one remain applied.
+        :type single_request: bool
+        :param max_batch_size: Max number of commands sent in one request.
+            Ignored in single-request mode.
+        :type max_batch_size: int | None
+        :param max_batch_bytes: Max size in bytes of one request. Ignored in
+            single-request mode.
+        :type max_batch_bytes: int | None
+        :returns: Redis pipeline
+        :rtype: c8.redis.redis_commands.RedisPipeline
+        """
+        return RedisPipeline(
+            self._conn, single_request, max_batch_size, max_batch_bytes
+        )
+
+    def execute_command(self, command, collection, *args):
+        """
+        Send a command as is, with its arguments in the Redis protocol order.
+
+        :param command: Command name ex. "SET"
+        :type command: str
+        :param collection: Name of the collection that we set values to
+        :type collection: str
+        :param args: Command arguments
+        :type args: str
+        :returns: Returns response from server in format {"code": xx, "result": xx}
+        :rtype: dict
+        """
+        return RedisInterface(self._conn, self._executor).command_parser(
+            command, collection, *args
+        )
 
     def set(self, key, value, collection, options=[]):
         """
@@ -3085,3 +3127,102 @@ class RedisCommands(object):
             command,
             collection,
         )
+
+
+class RedisPipeline(RedisCommands):
+    """
+    Redis commands interface that pipelines commands.
+
+    Commands are queued client-side and return :class:`c8.job.BatchJob`
+    instances. :func:`execute` sends them through the batch API, in as few
+    requests as **max_batch_size** and **max_batch_bytes** allow, and returns
+    their results in order. The pipeline can be reused after execution.
+
+    In single-request mode, the commands are sent in a single request, so that
+    they are applied in order without being split across requests. This does
+    not make them atomic: the Redis API has no rollback, and commands before a
+    failed one remain applied.
+
+    :param connection: HTTP connection.
+    :type connection: c8.connection.Connection
+    :param single_request: Send all commands in a single request.
+    :type single_request: bool
+    :param max_batch_size: Max number of commands sent in one request.
+    :type max_batch_size: int | None
+    :param max_batch_bytes: Max size in bytes of one request.
+    :type max_batch_bytes: int | None
+    """
+
+    def __init__(
+        self,
+        connection,
+        single_request=False,
+        max_batch_size=1000,
+        max_batch_bytes=16 << 20,
+    ):
+        self._single_request = single_request
+        if single_request:
+            max_batch_size = max_batch_bytes = None
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
+        super(RedisPipeline, self).__init__(connection, self._new_executor(connection))
+
+    def __repr__(self):
+        return "<RedisPipeline in {}>".format(self._conn.fabric_name)
+
+    def __len__(self):
+        return len(self._executor.jobs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception, *_):
+        if exception is None:
+            self._commit()
+        else:
+            self.reset()
+
+    def _new_executor(self, connection):
+        return BatchExecutor(
+            connection, True, self._max_batch_size, self._max_batch_bytes
+        )
+
+    def _commit(self):
+        """
+        Send the queued commands and start a new queue.
+
+        :returns: Executed jobs
+        :rtype: [c8.job.BatchJob]
+        """
+        executor, self._executor = self._executor, self._new_executor(self._conn)
+        return executor.commit()
+
+    def reset(self):
+        """
+        Discard the queued commands.
+        """
+        self._executor = self._new_executor(self._conn)
+
+    def execute(self, raise_on_error=True):
+        """
+        Send the queued commands and return their results.
+
+        :param raise_on_error: If set to True, the error of the first failed
+            command is raised (after all commands were executed). If set to
+            False, errors are placed in the result list instead.
+        :type raise_on_error: bool
+        :returns: Responses from server in format {"code": xx, "result": xx}, in
+            the order the commands were queued.
+        :rtype: list
+        :raise c8.redis.core.RedisServerError: If a command failed.
+        :raise c8.exceptions.BatchExecuteError: If a batch request fails.
+        """
+        results = []
+        for job in self._commit():
+            try:
+                results.append(job.result())
+            except RedisServerError as err:
+                if raise_on_error:
+                    raise
+                results.append(err)
+        return results
@@ -1,10 +1,12 @@
 from __future__ import absolute_import, unicode_literals
 
-import json
 import warnings
+from types import GeneratorType
 
 from six import moves, string_types
 
+from c8.codec import dumps
+
 __all__ = ["Request"]
 
 warnings.filterwarnings("ignore")
@@ -21,14 +23,26 @@ class Request(object):
     :type headers: dict
     :param params: URL parameters.
     :type params: dict
-    :param data: Request payload.
-    :type data: str | unicode | bool | int | list | dict
+    :param data: Request payload. Strings and bytes are sent as is, and
+        generators of bytes are streamed with chunked transfer encoding. Other
+        values are serialized to JSON.
+    :type data: str | unicode | bytes | generator | bool | int | list | dict
     :param command: C8Sh command.
     :type command: str | unicode
     :param read: Names of collections read during transaction.
     :type read: str | unicode | [str | unicode]
     :param write: Names of collections written to during transaction.
     :type write: str | unicode | [str | unicode]
+    :param timeout: Timeout in seconds, either a single value or a
+        (connect, read) tuple. Defaults to the HTTP client timeouts.
+    :type timeout: int | float | (int | float, int | float)
+    :param idempotent: Whether the request can be retried after it may have
+        reached the server. If not set, the HTTP method decides (see
+        :class:`c8.http.RetryPolicy`).
+    :type idempotent: bool | None
+    :param stream: Whether the body of a successful response may be returned
+        as an iterator of bytes chunks, read while it is consumed.
+    :type stream: bool
 
     :ivar method: HTTP method in lowercase (e.g. "post").
     :vartype method: str | unicode
@@ -38,14 +52,21 @@ class Request(object):
     :vartype headers: dict
     :ivar params: URL (query) parameters.
     :vartype params: dict
-    :ivar data: Request payload.
-    :vartype data: str | unicode | bool | int | list | dict
+    :ivar data: Serialized request payload.
+    :vartype data: str | unicode | bytes | generator
     :ivar command: C8Sh command.
     :vartype command: str | unicode | None
     :ivar read: Names of collections read during transaction.
     :vartype read: str | unicode | [str | unicode] | None
     :ivar write: Names of collections written to during transaction.
     :vartype write: str | unicode | [str | unicode] | None
+    :ivar timeout: Timeout in seconds or (connect, read) tuple.
+    :vartype timeout: int | float | (int | float, int | float) | None
+    :ivar idempotent: Whether the request can be retried, or None to decide
+        by HTTP method.
+    :vartype idempotent: bool | None
+    :ivar stream: Whether the response body may be streamed.
+    :vartype stream: bool
     """
 
     __slots__ = (
@@ -57,6 +78,9 @@ class Request(object):
         "command",
         "read",
         "write",
+        "timeout",
+        "idempotent",
+        "stream",
     )
 
     def __init__(
@@ -70,6 +94,9 @@ class Request(object):
         command=None,
         read=None,
         write=None,
+        timeout=None,
+        idempotent=None,
+        stream=False,
     ):
         self.method = method
         self.endpoint = endpoint
@@ -93,15 +120,20 @@ class Request(object):
         # Normalize the payload.
         if data is None:
             self.data = None
-        elif isinstance(data, string_types):
+        elif isinstance(data, (string_types, bytes, bytearray, GeneratorType)):
             self.data = data
+        elif isinstance(data, memoryview):
+            self.data = data.tobytes()
         else:
-            self.data = json.dumps(data)
+            self.data = dumps(data)
 
         # Set the transaction metadata.
         self.command = command
         self.read = read
         self.write = write
+        self.timeout = timeout
+        self.idempotent = idempotent
+        self.stream = stream
 
     def set_auth_token_in_header(self, auth_tok):
         """Set the Authorization header with the specified JWT auth token.
@@ -121,6 +153,11 @@ class Request(object):
         if self.headers is not None:
             for key, value in sorted(self.headers.items()):
                 request_strings.append("{}: {}".format(key, value))
-        if self.data is not None:
+        if isinstance(self.data, GeneratorType):
+            # Streamed payloads cannot be embedded lazily (e.g. in a batch).
+            self.data = b"".join(self.data)
+        if isinstance(self.data, (bytes, bytearray)):
+            request_strings.append("\r\n{}".format(self.data.decode("utf-8")))
+        elif self.data is not None:
             request_strings.append("\r\n{}".format(self.data))
         return "\r\n".join(request_strings)
@@ -1,6 +1,10 @@
 from __future__ import absolute_import, unicode_literals
 
-import json
+from collections.abc import Iterator
+
+from six import string_types
+
+from c8.codec import loads
 
 __all__ = ["Response"]
 
@@ -18,8 +22,14 @@ class Response(object):
     :type status_code: int
     :param status_text: Response status text.
     :type status_text: str | unicode
-    :param raw_body: Raw response body.
-    :type raw_body: str | unicode
+    :param raw_body: Raw response body. Bytes are kept as is and only decoded
+        when needed. Streamed bodies are iterators of bytes chunks, which are
+        never deserialized.
+    :type raw_body: bytes | str | unicode | iterator
+    :param keep_raw_body: If set to False, the raw body is released once
+        **body** has been deserialized, so that large responses (e.g. cursor
+        batches) are not held in memory twice. **raw_body** is then None.
+    :type keep_raw_body: bool
 
     :ivar method: HTTP method in lowercase (e.g. "post").
     :vartype method: str | unicode
@@ -31,16 +41,6 @@ class Response(object):
     :vartype status_code: int
     :ivar status_text: Response status text.
     :vartype status_text: str | unicode
-    :ivar body: JSON-deserialized response body.
-    :vartype body: str | unicode | bool | int | list | dict
-    :ivar raw_body: Raw response body.
-    :vartype raw_body: str | unicode
-    :ivar error_code: Error code from C8Db server.
-    :vartype error_code: int
-    :ivar error_message: Error message from C8Db server.
-    :vartype error_message: str | unicode
-    :ivar is_success: True if response status code was 2XX.
-    :vartype is_success: bool
     """
 
     __slots__ = (
@@ -49,34 +49,122 @@ class Response(object):
         "headers",
         "status_code",
         "status_text",
-        "body",
-        "raw_body",
-        "error_code",
-        "error_message",
-        "is_success",
+        "_raw",
+        "_body",
+        "_keep_raw",
     )
 
-    def __init__(self, method, url, headers, status_code, status_text, raw_body):
+    # Sentinel marking a body which has not been deserialized yet.
+    _UNPARSED = object()
+
+    def __init__(
+        self,
+        method,
+        url,
+        headers,
+        status_code,
+        status_text,
+        raw_body,
+        keep_raw_body=True,
+    ):
         self.method = method.lower()
         self.url = url
         self.headers = headers
         self.status_code = status_code
         self.status_text = status_text
-        self.raw_body = raw_body
-
-        # De-serialize the response body.
-        try:
-            self.body = json.loads(raw_body)
-        except (ValueError, TypeError):
-            self.body = raw_body
-
-        # Extract error code and message.
-        if isinstance(self.body, dict):
-            self.error_code = self.body.get("errorNum")
-            self.error_message = self.body.get("errorMessage")
-        else:
-            self.error_code = None
-            self.error_message = None
-
-        http_ok = 200 <= status_code < 300
-        self.is_success = http_ok and self.error_code is None
+        self._raw = raw_body
+        self._body = self._UNPARSED
+        self._keep_raw = keep_raw_body
+
+    @property
+    def body(self):
+        """Return the JSON-deserialized response body.
+
+        The body is deserialized on first access. If it is not valid JSON,
+        the raw body is returned as is.
+
+        :returns: Response body.
+        :rtype: str | unicode | bool | int | list | dict
+        """
+        if self._body is self._UNPARSED:
+            try:
+                self._body = loads(self._raw)
+            except (ValueError, TypeError):
+                self._body = self.raw_body
+            else:
+                if not self._keep_raw:
+                    self._raw = None
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+
+    @property
+    def raw_body(self):
+        """Return the raw response body.
+
+        :returns: Raw response body, or None if it was released (see
+            **keep_raw_body**).
+        :rtype: str | unicode | None
+        """
+        if isinstance(self._raw, (bytes, bytearray)):
+            return self._raw.decode("utf-8", "replace")
+        return self._raw
+
+    @property
+    def raw_content(self):
+        """Return the raw response body as received from the HTTP client.
+
+        :returns: Raw response body, or None if it was released (see
+            **keep_raw_body**).
+        :rtype: bytes | str | unicode | iterator | None
+        """
+        return self._raw
+
+    def _may_have_error(self):
+        """Check whether the body may carry a C8 error, without parsing it.
+
+        :returns: False if the raw body cannot contain an error number.
+        :rtype: bool
+        """
+        raw = self._raw
+        if isinstance(raw, (bytes, bytearray)):
+            return b'"errorNum"' in raw
+        if isinstance(raw, string_types):
+            return '"errorNum"' in raw
+        # Streamed bodies are left for the caller to consume.
+        return not isinstance(raw, Iterator)
+
+    @property
+    def error_code(self):
+        """Return the error code from C8 server.
+
+        :returns: Error code, or None if the response carries no error.
+        :rtype: int
+        """
+        if self._body is self._UNPARSED and not self._may_have_error():
+            return None
+        body = self.body
+        return body.get("errorNum") if isinstance(body, dict) else None
+
+    @property
+    def error_message(self):
+        """Return the error message from C8 server.
+
+        :returns: Error message, or None if the response carries no error.
+        :rtype: str | unicode
+        """
+        if self._body is self._UNPARSED and not self._may_have_error():
+            return None
+        body = self.body
+        return body.get("errorMessage") if isinstance(body, dict) else None
+
+    @property
+    def is_success(self):
+        """Return True if status code was 2XX and the body carries no error.
+
+        :rtype: bool
+        """
+        http_ok = 200 <= self.status_code < 300
+        return http_ok and self.error_code is None
@@ -1,5 +1,3 @@
-import json
-
 from c8.api import APIWrapper
 from c8.exceptions import StreamAppChangeActiveStateError
 from c8.request import Request
@@ -41,7 +39,7 @@ class StreamApps(APIWrapper):
         req = Request(
             method="put",
             endpoint="/streamapps/{}".format(self.name),
-            data=json.dumps(req_body),
+            data=req_body,
         )
 
         def response_handler(resp):
@@ -110,7 +108,7 @@ class StreamApps(APIWrapper):
         req = Request(
             method="post",
             endpoint="/streamapps/query/{}".format(self.name),
-            data=json.dumps(req_body),
+            data=req_body,
         )
         # create response handler
 
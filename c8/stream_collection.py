@@ -1,7 +1,6 @@
 from __future__ import absolute_import, unicode_literals
 
 import base64
-import json
 import random
 from urllib.parse import urlencode, urlparse
 
@@ -11,6 +10,7 @@ import websocket
 from c8 import constants
 from c8 import exceptions as ex
 from c8.api import APIWrapper
+from c8.codec import dumps
 from c8.request import Request
 
 __all__ = ["StreamCollection"]
@@ -19,7 +19,7 @@ __all__ = ["StreamCollection"]
 class Base64Socket(websocket.WebSocket):
     def send(self, payload, **kwargs):
         b64payload = {"payload": base64.b64encode(six.b(payload)).decode("utf-8")}
-        return super().send(json.dumps(b64payload), **kwargs)
+        return super().send(dumps(b64payload), **kwargs)
 
 
 class StreamCollection(APIWrapper):
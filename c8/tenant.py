@@ -1,8 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
-import json
-
 from c8.api import APIWrapper
+from c8.codec import dumps
 from c8.exceptions import (
     BillingAccessLevel,
     ClearBillingAccessLevel,
@@ -357,7 +356,7 @@ class Tenant(APIWrapper):
         :rtype: bool
         :raise c8.exceptions.SpotRegionAssignError: If assignment fails.
         """
-        data = json.dumps(spot_region)
+        data = dumps(spot_region)
         request = Request(method="put", endpoint="/datacenter/{}/{}".format(dc, data))
 
         def response_handler(resp):
@@ -1,13 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
 import csv
-import json
 import logging
 from collections import deque
 from contextlib import contextmanager
 
 from six import string_types
 
+from c8.codec import loads
 from c8.cursor import Cursor
 from c8.exceptions import DocumentParseError
 
@@ -80,10 +80,11 @@ def is_none_or_str(obj):
 
 
 def json_reader(filepath):
+    with open(filepath) as file:
+        data = file.read()
     try:
-        file = open(filepath)
-        return json.load(file)
-    except json.JSONDecodeError:
+        return loads(data)
+    except ValueError:
         raise Exception("Invalid JSON file")
 
 
@@ -138,3 +139,61 @@ def clean_doc(obj):
             for field, value in obj.items()
             if field in {"_key", "_from", "_to"} or not field.startswith("_")
         }
+
+
+def keyset_query(
+    collection,
+    after=None,
+    upper=None,
+    limit=1000,
+    fields=None,
+    descending=False,
+    keys_only=False,
+):
+    """Return the body of a cursor request reading a page of documents in key
+    order (keyset pagination).
+
+    The page starts right after key **after** instead of at an offset, so
+    the server seeks to it in the primary index and reading page N costs the
+    same as reading the first one.
+
+    :param collection: Collection name.
+    :type collection: str | unicode
+    :param after: Return documents with keys after this key, in key order.
+    :type after: str | unicode
+    :param upper: Return documents with keys lower than or equal to this key.
+    :type upper: str | unicode
+    :param limit: Max number of documents returned.
+    :type limit: int
+    :param fields: Document fields to return (projection). The "_key" field
+        is always returned.
+    :type fields: [str | unicode]
+    :param descending: Walk the keys in descending order.
+    :type descending: bool
+    :param keys_only: Return the keys instead of the documents.
+    :type keys_only: bool
+    :return: Cursor request body.
+    :rtype: dict
+    """
+    bind_vars = {"@collection": collection, "limit": limit}
+    filters = []
+    if after is not None:
+        filters.append("doc._key {} @after".format("<" if descending else ">"))
+        bind_vars["after"] = after
+    if upper is not None:
+        filters.append("doc._key <= @upper")
+        bind_vars["upper"] = upper
+    if keys_only:
+        projection = "doc._key"
+    elif fields is not None:
+        projection = "KEEP(doc, @fields)"
+        bind_vars["fields"] = ["_key"] + [f for f in fields if f != "_key"]
+    else:
+        projection = "doc"
+
+    query = "FOR doc IN @@collection {}SORT doc._key {} LIMIT @limit RETURN {}".format(
+        "FILTER {} ".format(" && ".join(filters)) if filters else "",
+        "DESC" if descending else "ASC",
+        projection,
+    )
+    return {"query": query, "bindVars": bind_vars, "batchSize": limit}
@@ -15,6 +15,7 @@ setup(
     packages=find_packages(exclude=["tests"]),
     include_package_data=True,
     install_requires=["requests>=2.31.0", "six", "websocket-client==0.57.0"],
+    extras_require={"asyncio": ["aiohttp>=3.8"], "orjson": ["orjson>=3.6"]},
     tests_require=["pytest", "mock", "flake8"],
     classifiers=[
         "Intended Audience :: Developers",
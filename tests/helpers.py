@@ -1,12 +1,16 @@
 from __future__ import absolute_import, unicode_literals
 
+import json
 from collections import deque
 from uuid import uuid4
 
 import pytest
 
+from c8.connection import Connection
 from c8.cursor import Cursor
 from c8.exceptions import AsyncExecuteError, BatchExecuteError
+from c8.http import HTTPClient
+from c8.response import Response
 
 
 def generate_fabric_name():
@@ -181,3 +185,54 @@ def assert_raises(exception):
             BatchExecuteError,
         )
     )
+
+
+class FakeHTTPClient(HTTPClient):
+    """HTTP client answering requests offline.
+
+    :param handler: Called with (method, url, params, data) for every
+        request. Returns the response body (serialized to JSON) or a
+        (status_code, body) tuple.
+    :type handler: callable
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def send_request(
+        self, method, url, params=None, data=None, headers=None, auth=None
+    ):
+        self.requests.append((method, url, params, data))
+        result = self.handler(method, url, params, data)
+        status_code, body = result if isinstance(result, tuple) else (200, result)
+        return Response(
+            method=method,
+            url=url,
+            headers={},
+            status_code=status_code,
+            status_text="",
+            raw_body=json.dumps(body),
+        )
+
+
+def get_offline_connection(http_client, metadata_cache=None):
+    """Return a connection which does not authenticate against a server.
+
+    :param http_client: HTTP client.
+    :type http_client: c8.http.HTTPClient
+    :param metadata_cache: Cache of collection and stream names.
+    :type metadata_cache: c8.cache.MetadataCache
+    :return: Connection.
+    :rtype: c8.connection.Connection
+    """
+    return Connection(
+        url="http://localhost",
+        email="",
+        password="",
+        token="token",
+        apikey=None,
+        http_client=http_client,
+        skip_tenant=True,
+        metadata_cache=metadata_cache,
+    )
@@ -0,0 +1,79 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import threading
+
+import pytest
+
+from c8.exceptions import AsyncJobResultError, AsyncJobTimeoutError, C8ServerError
+from c8.job import AsyncJob, as_completed, wait_all
+from c8.response import Response
+from tests.helpers import get_offline_connection
+
+
+class JobServer(object):
+    """HTTP client answering async job result requests. Job N is done after
+    N polls; job "bad" fails."""
+
+    def __init__(self):
+        self.polls = {}
+        self.lock = threading.Lock()
+
+    def send_request(self, method, url, params=None, data=None, headers=None):
+        job_id = url.rsplit("/", 1)[-1]
+        with self.lock:
+            self.polls[job_id] = self.polls.get(job_id, 0) + 1
+            polls = self.polls[job_id]
+        if job_id == "missing":
+            body = {"error": True, "errorNum": 404, "code": 404}
+            return Response(method, url, {}, 404, "", json.dumps(body))
+        if job_id != "bad" and polls <= int(job_id):
+            return Response(method, url, {}, 204, "", "")
+        status = 400 if job_id == "bad" else 200
+        body = {"job": job_id}
+        if job_id == "bad":
+            body.update(error=True, errorNum=1)
+        headers = {"x-c8-async-id": job_id}
+        return Response(method, url, headers, status, "", json.dumps(body))
+
+
+def handler(resp):
+    if not resp.is_success:
+        raise C8ServerError(resp, None)
+    return resp.body["job"]
+
+
+def get_jobs(*job_ids):
+    server = JobServer()
+    conn = get_offline_connection(server)
+    return [AsyncJob(conn, job_id, handler) for job_id in job_ids], server
+
+
+def test_as_completed():
+    jobs, server = get_jobs("2", "0", "bad", "1")
+    done = list(as_completed(jobs, min_interval=0.001, max_interval=0.01))
+    assert [job.id for job in done] == ["0", "bad", "1", "2"]
+
+    # Results were fetched while polling.
+    assert [job.result() for job in done if job.id != "bad"] == ["0", "1", "2"]
+    with pytest.raises(C8ServerError):
+        done[1].result()
+    assert server.polls == {"0": 1, "bad": 1, "1": 2, "2": 3}
+
+
+def test_wait_all_timeout():
+    jobs, server = get_jobs("0", "1000")
+    done, pending = wait_all(jobs, timeout=0.05, min_interval=0.001)
+    assert done == jobs[:1]
+    assert pending == jobs[1:]
+    # Backoff keeps the number of polls low.
+    assert server.polls["1000"] < 20
+
+    with pytest.raises(AsyncJobTimeoutError):
+        list(as_completed(jobs, timeout=0.01))
+
+
+def test_as_completed_missing_job():
+    jobs, _ = get_jobs("missing")
+    with pytest.raises(AsyncJobResultError):
+        list(as_completed(jobs))
@@ -0,0 +1,126 @@
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+import json
+
+import pytest
+
+from c8.connection import Connection
+from c8.exceptions import CollectionFindError
+from c8.executor import AsyncIOExecutor
+from c8.fabric import AsyncIOFabric, StandardFabric
+from c8.http import HTTPClient
+from c8.response import Response
+
+
+class FakeAsyncHTTPClient(HTTPClient):
+    def __init__(self, bodies):
+        self.bodies = list(bodies)
+        self.requests = []
+        self.closed = False
+
+    async def send_request(
+        self, method, url, params=None, data=None, headers=None, auth=None
+    ):
+        self.requests.append((method, url))
+        await asyncio.sleep(0)
+        return Response(
+            method=method,
+            url=url,
+            headers={},
+            status_code=200,
+            status_text="OK",
+            raw_body=json.dumps(self.bodies.pop(0)),
+        )
+
+    async def close(self):
+        self.closed = True
+
+
+def get_connection(http_client=None):
+    return Connection(
+        url="http://localhost",
+        email="",
+        password="",
+        token="token",
+        apikey=None,
+        http_client=http_client,
+        skip_tenant=True,
+    )
+
+
+def test_asyncio_fabric_execute():
+    http_client = FakeAsyncHTTPClient([{"_key": "1"}, {"_key": "2"}])
+    fabric = StandardFabric(get_connection())
+    aio_fabric = fabric.begin_asyncio_execution(http_client=http_client)
+    assert isinstance(aio_fabric, AsyncIOFabric)
+    assert isinstance(aio_fabric._executor, AsyncIOExecutor)
+    assert aio_fabric.context == "asyncio"
+    assert "AsyncIOFabric" in repr(aio_fabric)
+
+    col = aio_fabric.collection("students", lazy=True)
+    assert col.context == "asyncio"
+
+    async def run():
+        async with aio_fabric:
+            return await asyncio.gather(
+                col.insert({"_key": "1"}), col.insert({"_key": "2"})
+            )
+
+    assert asyncio.run(run()) == [{"_key": "1"}, {"_key": "2"}]
+    assert http_client.closed is True
+    assert http_client.requests[0][0] == "post"
+    assert http_client.requests[0][1].endswith("/document/students")
+
+    # The original connection keeps its own HTTP client.
+    assert fabric._conn.http_client is not http_client
+
+
+def test_asyncio_collection_check():
+    info = {"id": "1", "name": "students", "isSystem": False}
+    info.update(type=2, status=3, collectionModel="DOC")
+    http_client = FakeAsyncHTTPClient([{"result": [info]}] * 3)
+    fabric = StandardFabric(get_connection())
+    aio_fabric = fabric.begin_asyncio_execution(http_client=http_client)
+
+    async def run():
+        col = await aio_fabric.collection("students")
+        assert col.name == "students"
+        assert await aio_fabric.has_collection("students") is True
+        with pytest.raises(CollectionFindError):
+            await aio_fabric.collection("teachers")
+
+    asyncio.run(run())
+    assert http_client.requests[0][0] == "get"
+    assert http_client.requests[0][1].endswith("/_api/collection")
+
+
+def test_asyncio_cursor_iteration():
+    http_client = FakeAsyncHTTPClient(
+        [
+            {"id": "1", "hasMore": True, "result": [1, 2]},
+            {"id": "1", "hasMore": False, "result": [3]},
+            {"error": False},
+        ]
+    )
+    aio_fabric = AsyncIOFabric(get_connection(), http_client)
+
+    async def run():
+        cursor = await aio_fabric.c8ql.execute("FOR d IN c RETURN d", batch_size=2)
+        async with cursor:
+            return [item async for item in cursor]
+
+    assert asyncio.run(run()) == [1, 2, 3]
+    assert [method for method, _ in http_client.requests] == [
+        "post",
+        "put",
+        "delete",
+    ]
+
+
+def test_default_executor_with_asyncio_http_client():
+    http_client = FakeAsyncHTTPClient([{"version": "3.0"}])
+    fabric = StandardFabric(get_connection(http_client))
+    result = fabric.version()
+    assert asyncio.iscoroutine(result)
+    assert asyncio.run(result) == "3.0"
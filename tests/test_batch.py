@@ -0,0 +1,164 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.exceptions import BatchStateError
+from c8.executor import BatchExecutor
+from c8.multipart import MultipartWriter, iter_multipart
+from c8.request import Request
+from c8.response import Response
+from tests.helpers import get_offline_connection
+
+
+def batch_handler(bodies, drop=0):
+    """Answer each batch part with its request body, pretty-printed so that
+    it spans several lines."""
+
+    def handler(method, url, params, data):
+        body = b"".join(data).decode("utf-8")
+        bodies.append(body)
+        boundary = body.split("\r\n", 1)[0][2:]
+        parts = body.split("--" + boundary)[1:-1]
+        out = []
+        for part in parts[drop:]:
+            head, _, request = part.partition("\r\n\r\n")
+            content_id = head.split("Content-Id: ")[1].strip()
+            payload = request.partition("\r\n\r\n")[2].rstrip("\r\n")
+            doc = json.dumps(json.loads(payload), indent=2).replace("\n", "\r\n")
+            out.append(
+                "--{}\r\nContent-Type: application/x-c8-batchpart\r\n"
+                "Content-Id: {}\r\n\r\nHTTP/1.1 202 Accepted\r\n"
+                "Content-Type: application/json\r\n\r\n{}\r\n".format(
+                    boundary, content_id, doc
+                )
+            )
+        out.append("--{}--".format(boundary))
+        return 200, "".join(out)
+
+    return handler
+
+
+class RawHTTPClient(object):
+    """HTTP client returning the raw bodies built by a handler."""
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def send_request(self, method, url, params=None, data=None, headers=None):
+        status_code, body = self.handler(method, url, params, data)
+        return Response(method, url, {}, status_code, "", body)
+
+
+class StreamingHTTPClient(RawHTTPClient):
+    """HTTP client streaming the raw bodies built by a handler."""
+
+    def __init__(self, handler):
+        super(StreamingHTTPClient, self).__init__(handler)
+        self.sent = []
+
+    def send_request(
+        self, method, url, params=None, data=None, headers=None, stream=False
+    ):
+        status_code, body = self.handler(method, url, params, data)
+        if stream:
+            body = self.chunks(body.encode("utf-8"))
+        return Response(method, url, {}, status_code, "", body)
+
+    def chunks(self, body):
+        for i in range(0, len(body), 7):
+            self.sent.append(i)
+            yield body[i : i + 7]
+
+
+def get_executor(handler, http_client=RawHTTPClient, **kwargs):
+    conn = get_offline_connection(http_client(handler))
+    return BatchExecutor(conn, return_result=True, **kwargs)
+
+
+def queue(executor, count):
+    return [
+        executor.execute(
+            Request(method="post", endpoint="/document/c", data={"n": i}),
+            lambda resp: (resp.status_code, resp.headers, resp.body),
+        )
+        for i in range(count)
+    ]
+
+
+def test_multipart_parser_is_incremental():
+    body = (
+        "--b\r\nContent-Type: application/x-c8-batchpart\r\n"
+        "Content-Id: 1\r\n\r\nHTTP/1.1 200 OK\r\n"
+        "Content-Type: application/json\r\n\r\n"
+        '{\r\n"a": "--b"\r\n}\r\n'
+        "--b\r\nContent-Id: 2\r\n\r\nHTTP/1.1 404 Not Found\r\n\r\n"
+        "\r\n--b--"
+    ).encode("utf-8")
+    chunks = [body[i : i + 3] for i in range(0, len(body), 3)]
+    parts = list(iter_multipart(chunks, "b"))
+    assert [part.content_id for part in parts] == ["1", "2"]
+    assert parts[0].status_code == 200
+    assert parts[0].headers == {"content-type": "application/json"}
+    assert json.loads(parts[0].body) == {"a": "--b"}
+    assert parts[1].status_text == "Not Found"
+    assert parts[1].body == ""
+
+    with pytest.raises(ValueError):
+        list(iter_multipart([body[:-10]], "b"))
+
+
+def test_multipart_writer_splits_bodies():
+    parts = [(str(i), "x" * 10) for i in range(5)]
+    writer = MultipartWriter(parts, boundary="b", max_parts=2, max_bytes=200)
+    sizes = []
+    while writer.has_more():
+        b"".join(writer.body())
+        sizes.append(list(writer.content_ids))
+    assert sizes == [["0", "1"], ["2", "3"], ["4"]]
+
+    # Parts larger than max_bytes are sent on their own.
+    writer = MultipartWriter(parts, boundary="b", max_bytes=10)
+    b"".join(writer.body())
+    assert writer.content_ids == ["0"]
+
+
+def test_batch_commit_splits_and_parses():
+    bodies = []
+    executor = get_executor(batch_handler(bodies), max_batch_size=2)
+    jobs = queue(executor, 5)
+    assert executor.commit() == jobs
+    assert len(bodies) == 3
+    for i, job in enumerate(jobs):
+        status_code, headers, body = job.result()
+        assert status_code == 202
+        assert headers["content-type"] == "application/json"
+        assert body == {"n": i}
+
+    with pytest.raises(BatchStateError):
+        executor.commit()
+
+
+def test_batch_commit_streams_responses():
+    executor = get_executor(batch_handler([]), http_client=StreamingHTTPClient)
+    jobs = queue(executor, 3)
+    executor.commit()
+    assert executor._conn.http_client.sent
+    assert [job.result()[2] for job in jobs] == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    # Responses are not streamed if no results are tracked.
+    executor = BatchExecutor(
+        get_offline_connection(StreamingHTTPClient(batch_handler([]))),
+        return_result=False,
+    )
+    queue(executor, 1)
+    executor.commit()
+    assert not executor._conn.http_client.sent
+
+
+def test_batch_commit_missing_parts():
+    executor = get_executor(batch_handler([], drop=1))
+    queue(executor, 2)
+    with pytest.raises(BatchStateError):
+        executor.commit()
@@ -0,0 +1,202 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import time
+from types import GeneratorType
+
+import pytest
+
+from c8 import collection
+from c8.bulk import BulkWriter
+from c8.collection import StandardCollection
+from c8.exceptions import DocumentDeleteError, DocumentInsertError
+from c8.executor import DefaultExecutor
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+def read_body(data):
+    return b"".join(data) if isinstance(data, GeneratorType) else data
+
+
+def insert_handler(method, url, params, data):
+    return [{"_id": "students/" + doc["_key"]} for doc in json.loads(read_body(data))]
+
+
+def get_collection(handler=insert_handler):
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    return StandardCollection(conn, DefaultExecutor(conn), "students"), http_client
+
+
+def test_insert_many_pre_encoded():
+    col, http_client = get_collection()
+
+    payload = b'[{"_key":"1"},{"_key":"2"}]'
+    assert col.insert_many(payload) == [{"_id": "students/1"}, {"_id": "students/2"}]
+    assert http_client.requests[-1][3] == payload
+
+    col.insert_many(memoryview(payload))
+    assert http_client.requests[-1][3] == payload
+
+    docs = [b'{"_key":"1"}', memoryview(b'{"_key":"2"}'), '{"_key":"3"}']
+    assert len(col.insert_many(docs)) == 3
+    assert http_client.requests[-1][3] == b'[{"_key":"1"},{"_key":"2"},{"_key":"3"}]'
+
+    # Regular documents are still normalized.
+    col.insert_many([{"_id": "students/4"}])
+    assert json.loads(http_client.requests[-1][3]) == [
+        {"_id": "students/4", "_key": "4"}
+    ]
+    assert col.insert_many([]) == []
+
+
+def test_replace_many_pre_encoded():
+    col, http_client = get_collection(
+        lambda method, url, params, data: [
+            {"_id": "students/" + doc["_key"], "_oldRev": "1"}
+            for doc in json.loads(data)
+        ]
+    )
+    result = col.replace_many([b'{"_key":"1","a":1}'])
+    assert result == [{"_id": "students/1", "_old_rev": "1"}]
+    assert http_client.requests[-1][0] == "put"
+    assert http_client.requests[-1][3] == b'[{"_key":"1","a":1}]'
+
+
+def test_import_bulk_pre_encoded():
+    col, http_client = get_collection(lambda *args: {"created": 2})
+
+    assert col.import_bulk(b'[{"_key":"1"},{"_key":"2"}]') == {"created": 2}
+    body = http_client.requests[-1][3]
+    assert json.loads(body) == {
+        "data": [{"_key": "1"}, {"_key": "2"}],
+        "details": True,
+        "replace": False,
+    }
+
+    col.import_bulk([{"_id": "students/3"}], details=None, replace=None)
+    assert json.loads(http_client.requests[-1][3]) == {
+        "data": [{"_id": "students/3", "_key": "3"}]
+    }
+
+
+def test_bulk_write_streaming(monkeypatch):
+    monkeypatch.setattr(collection, "STREAM_CHUNK_SIZE", 32)
+    chunks = []
+
+    def handler(method, url, params, data):
+        assert isinstance(data, GeneratorType)
+        chunks.extend(data)
+        return insert_handler(method, url, params, b"".join(chunks))
+
+    col, http_client = get_collection(handler)
+    docs = ({"_key": str(i), "value": "x" * 10} for i in range(10))
+    assert len(col.insert_many(docs)) == 10
+    assert len(chunks) > 1
+    assert [doc["_key"] for doc in json.loads(b"".join(chunks))] == [
+        str(i) for i in range(10)
+    ]
+
+    del chunks[:]
+    col, http_client = get_collection(lambda method, url, params, data: {"created": 3})
+    docs = iter([{"_id": "students/1"}, b'{"_key":"2"}', '{"_key":"3"}'])
+    assert col.import_bulk(docs) == {"created": 3}
+    assert json.loads(b"".join(http_client.requests[-1][3])) == {
+        "data": [{"_id": "students/1", "_key": "1"}, {"_key": "2"}, {"_key": "3"}],
+        "details": True,
+        "replace": False,
+    }
+
+    # Empty iterators are streamed as empty arrays.
+    col.import_bulk(iter([]), details=None, replace=None)
+    assert json.loads(b"".join(http_client.requests[-1][3])) == {"data": []}
+
+
+def test_bulk_writer_split_and_merge():
+    def handler(method, url, params, data):
+        docs = json.loads(read_body(data))
+        # Answer out of order: the first chunks are the slowest.
+        time.sleep(0.01 * (10 - int(docs[0]["_key"])) / 10)
+        return [
+            {"_id": "students/" + doc["_key"]}
+            if doc["_key"] != "5"
+            else {"error": True, "errorNum": 1210, "errorMessage": "conflict"}
+            for doc in docs
+        ]
+
+    col, http_client = get_collection(handler)
+    writer = col.bulk_writer(batch_size=3, max_workers=3)
+    assert isinstance(writer, BulkWriter)
+
+    results = writer.insert_many({"_key": str(i)} for i in range(10))
+    assert len(http_client.requests) == 4
+    assert len(results) == 10
+    assert isinstance(results[5], DocumentInsertError)
+    assert [r["_id"] for i, r in enumerate(results) if i != 5] == [
+        "students/{}".format(i) for i in range(10) if i != 5
+    ]
+
+    # Chunks are also bounded by their serialized size.
+    col, http_client = get_collection()
+    writer = col.bulk_writer(max_bytes=40)
+    writer.insert_many([{"_key": str(i), "value": "x" * 10} for i in range(4)])
+    assert len(http_client.requests) == 4
+
+    # Empty writes still reach the server once.
+    assert writer.insert_many([]) == []
+
+
+def test_bulk_writer_import_bulk():
+    def handler(method, url, params, data):
+        docs = json.loads(read_body(data))["data"]
+        return {"error": False, "created": len(docs), "errors": 0, "details": []}
+
+    col, http_client = get_collection(handler)
+    writer = BulkWriter(col, batch_size=2)
+    result = writer.import_bulk([{"_key": str(i)} for i in range(5)])
+    assert len(http_client.requests) == 3
+    assert result == {"error": False, "created": 5, "errors": 0, "details": []}
+
+
+def test_bulk_writer_update_and_delete(monkeypatch):
+    def handler(method, url, params, data):
+        return [{"_id": "students/1", "_oldRev": "1"} for _ in json.loads(data)]
+
+    encoded = []
+
+    def counting_dumps(obj):
+        encoded.append(obj)
+        return json.dumps(obj)
+
+    col, http_client = get_collection(handler)
+    monkeypatch.setattr("c8.bulk.dumps", counting_dumps)
+    monkeypatch.setattr(collection, "dumps", counting_dumps)
+    writer = col.bulk_writer(batch_size=2)
+
+    # Documents are encoded once, and spliced into the request bodies.
+    results = writer.update_many([{"_id": "students/1", "a": 1}, {"_key": "2"}])
+    assert len(results) == 2
+    assert http_client.requests[-1][0] == "patch"
+    body = http_client.requests[-1][3]
+    assert isinstance(body, bytes)
+    assert json.loads(body) == [
+        {"_id": "students/1", "a": 1, "_key": "1"},
+        {"_key": "2"},
+    ]
+    assert len([obj for obj in encoded if isinstance(obj, dict)]) == 2
+
+    del encoded[:]
+    assert len(writer.delete_many(["1", {"_key": "2"}, "students/3"])) == 3
+    assert [r[0] for r in http_client.requests[-2:]] == ["delete", "delete"]
+    assert http_client.requests[-2][3] == b'["1",{"_key": "2"}]'
+    assert http_client.requests[-1][3] == b'["students/3"]'
+    assert encoded == ["1", {"_key": "2"}, "students/3"]
+
+
+def test_bulk_writer_error():
+    def handler(method, url, params, data):
+        return 503, {"error": True, "errorNum": 503, "errorMessage": "unavailable"}
+
+    col, _ = get_collection(handler)
+    with pytest.raises(DocumentDeleteError):
+        col.bulk_writer(batch_size=1).delete_many(["1", "2", "3"])
@@ -0,0 +1,269 @@
+from __future__ import absolute_import, unicode_literals
+
+import base64
+import json
+import time
+
+import websocket
+from six.moves import queue
+
+from c8.cache import CacheInvalidator, DocumentCache, FIFOPolicy
+from c8.collection import StandardCollection
+from c8.executor import DefaultExecutor, WriteBehindExecutor
+from c8.fabric import StandardFabric
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+class Store(object):
+    """Fake document API honoring If-None-Match."""
+
+    def __init__(self):
+        self.docs = {}
+        self.headers = []
+
+    def __call__(self, method, url, params, data):
+        handle = url.split("/_api/document/")[1]
+        if method == "get":
+            doc = self.docs.get(handle)
+            if doc is None:
+                return 404, {"error": True, "errorNum": 1202, "errorMessage": "nf"}
+            if self.headers[-1].get("If-None-Match") == doc["_rev"]:
+                return 304, None
+            return doc
+        if method == "delete":
+            self.docs.pop(handle, None)
+            return {"_id": handle}
+        body = json.loads(data)
+        doc = self.docs[handle]
+        doc.update(body)
+        doc["_rev"] = str(int(doc["_rev"]) + 1)
+        return {"_id": handle, "_rev": doc["_rev"], "_oldRev": "0"}
+
+
+def get_collection(cache):
+    store = Store()
+    store.docs["students/1"] = {"_id": "students/1", "_key": "1", "_rev": "1"}
+    http_client = FakeHTTPClient(store)
+    send_request = http_client.send_request
+
+    def record_headers(method, url, params=None, data=None, headers=None, **kwargs):
+        store.headers.append(headers or {})
+        return send_request(method, url, params, data, headers)
+
+    http_client.send_request = record_headers
+    conn = get_offline_connection(http_client)
+    col = StandardCollection(conn, DefaultExecutor(conn), "students", cache)
+    return col, store, http_client
+
+
+def test_document_cache_bounds():
+    cache = DocumentCache(max_entries=2)
+    for i in range(3):
+        cache.put("students/{}".format(i), {"_rev": "1", "i": i})
+    assert "students/0" not in cache and len(cache) == 2
+
+    # Hits keep entries alive under LRU, but not under FIFO.
+    cache.get("students/1")
+    cache.put("students/3", {"_rev": "1"})
+    assert "students/1" in cache and "students/2" not in cache
+    cache = DocumentCache(max_entries=2, policy=FIFOPolicy())
+    cache.put("a/1", {})
+    cache.put("a/2", {})
+    cache.get("a/1")
+    cache.put("a/3", {})
+    assert "a/1" not in cache
+
+    cache = DocumentCache(max_bytes=30)
+    cache.put("a/1", {"v": "x" * 10})
+    cache.put("a/2", {"v": "x" * 10})
+    assert list(cache._entries) == ["a/2"]
+    assert cache.size == len(b'{"v": "xxxxxxxxxx"}')
+    cache.put("a/3", {"v": "x" * 40})
+    assert "a/3" not in cache
+
+    # Callers get their own copies.
+    cache.get("a/2")["v"] = "changed"
+    assert cache.get("a/2")["v"] == "x" * 10
+    cache.invalidate_collection("a")
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_collection_cache_invalidation():
+    col, store, http_client = get_collection(DocumentCache())
+    assert col.get("1")["_rev"] == "1"
+    assert col.get({"_id": "students/1"})["_rev"] == "1"
+    assert col["1"]["_rev"] == "1"
+    assert len(http_client.requests) == 1
+    assert col.cache.hits == 2
+
+    # Revision checked reads bypass the cache.
+    col.get("1", rev="1")
+    assert len(http_client.requests) == 2
+
+    col.update({"_key": "1", "a": 1})
+    assert "students/1" not in col.cache
+    assert col.get("1")["a"] == 1
+    col.delete("1")
+    assert col.get("1") is None
+    assert "students/1" not in col.cache
+
+
+def test_collection_cache_invalidated_after_deferred_write():
+    col, store, http_client = get_collection(DocumentCache())
+    executor = WriteBehindExecutor(col._conn, linger=60)
+    wb_col = StandardCollection(col._conn, executor, "students", col.cache)
+
+    future = wb_col.update({"_key": "1", "a": 1})
+    # A read before the write is sent caches the old document again.
+    assert "a" not in col.get("1")
+    assert "students/1" in col.cache
+
+    executor.flush()
+    assert future.result()["_rev"] == "2"
+    assert "students/1" not in col.cache
+    assert col.get("1")["a"] == 1
+
+
+def test_collection_cache_read_racing_write():
+    col, store, http_client = get_collection(DocumentCache())
+
+    def racing_store(method, url, params, data):
+        result = store(method, url, params, data)
+        # Another write through the cache completes while the read is sent.
+        col.cache.invalidate("students/1")
+        return result
+
+    http_client.handler = racing_store
+    assert col.get("1")["_rev"] == "1"
+    assert "students/1" not in col.cache
+
+    http_client.handler = store
+    assert col.get("1")["_rev"] == "1"
+    assert "students/1" in col.cache
+    col.cache.clear()
+    assert col.cache.generation("students/1") != (0, 0)
+
+
+def test_document_cache_default_ttl():
+    cache = DocumentCache()
+    cache.put("students/1", {"_rev": "1"})
+    assert cache.lookup("students/1")[2]
+    cache._entries["students/1"].expires = time.monotonic()
+    # Changes by other clients are picked up once the entry expires.
+    assert cache.get("students/1") is None
+
+
+def test_collection_cache_revalidation():
+    col, store, http_client = get_collection(DocumentCache(ttl=0.01, revalidate=True))
+    assert col.get("1")["_rev"] == "1"
+    time.sleep(0.02)
+
+    # Unchanged document: a 304 answer refreshes the entry.
+    assert col.get("1")["_rev"] == "1"
+    assert store.headers[-1]["If-None-Match"] == "1"
+    assert col.get("1")["_rev"] == "1"
+    assert len(http_client.requests) == 2
+
+    # Changed by another client: the new body replaces the entry.
+    store.docs["students/1"]["_rev"] = "7"
+    time.sleep(0.02)
+    assert col.get("1")["_rev"] == "7"
+    assert col.cache.get("students/1")["_rev"] == "7"
+
+
+class FakeWebSocket(object):
+    def __init__(self, messages):
+        self.messages = messages
+        self.acks = []
+        self.closed = False
+
+    def recv(self):
+        try:
+            return self.messages.get(timeout=0.01)
+        except queue.Empty:
+            raise websocket.WebSocketTimeoutException()
+
+    def send(self, data):
+        self.acks.append(json.loads(data)["messageId"])
+
+    def close(self):
+        self.closed = True
+
+
+def change(message_id, document):
+    payload = base64.b64encode(json.dumps(document).encode("utf-8"))
+    return json.dumps({"messageId": message_id, "payload": payload.decode("utf-8")})
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_cache_invalidator():
+    cache = DocumentCache()
+    messages = queue.Queue()
+    sockets = []
+    unsubscribed = []
+
+    def connect(url, header=None, timeout=None):
+        assert url == "wss://topic" and header == {"Authorization": "token"}
+        sockets.append(FakeWebSocket(messages))
+        return sockets[-1]
+
+    cache.put("other/1", {"_rev": "1"})
+    cache.put("students/1", {"_rev": "1"})
+    invalidator = CacheInvalidator(
+        {"students": "wss://topic"},
+        [cache],
+        {"Authorization": "token"},
+        update=True,
+        connect=connect,
+        timeout=0.01,
+        unsubscribe=unsubscribed.append,
+    )
+    with invalidator.start():
+        # Connecting drops the entries of the collection.
+        wait_for(lambda: "students/1" not in cache)
+        assert "other/1" in cache
+
+        cache.put("students/1", {"_rev": "1"})
+        messages.put(change("a", {"_key": "1", "_rev": "2", "v": 1}))
+        messages.put(change("b", {"_key": "2", "_rev": "1"}))
+        wait_for(lambda: sockets[0].acks == ["a", "b"])
+        assert cache.get("students/1") == {"_key": "1", "_rev": "2", "v": 1}
+        assert "students/2" not in cache
+
+        messages.put(change("c", {"_key": "1", "_delete": True}))
+        wait_for(lambda: "students/1" not in cache)
+    assert sockets[0].closed
+    assert unsubscribed == ["students"]
+    invalidator.stop()
+    assert unsubscribed == ["students"]
+
+
+def test_fabric_cache_invalidator():
+    http_client = FakeHTTPClient(lambda *a: {})
+    fabric = StandardFabric(get_offline_connection(http_client))
+    invalidator = fabric.cache_invalidator(
+        ["students", "teachers"], [DocumentCache()], start=False
+    )
+    assert isinstance(invalidator, CacheInvalidator)
+    topics = invalidator._topics
+    assert sorted(topics) == ["students", "teachers"]
+    assert topics["students"].startswith("wss://localhost/_ws/ws/v2/consumer/")
+    assert "/students/" in topics["students"]
+    assert topics["students"].split("-")[-1] != topics["teachers"].split("-")[-1]
+
+    # Stopping deletes the subscriptions, which would otherwise be kept.
+    invalidator._connect = lambda *args, **kwargs: FakeWebSocket(queue.Queue())
+    invalidator.start().stop()
+    deleted = sorted(request[1] for request in http_client.requests)
+    assert [request[0] for request in http_client.requests] == ["delete"] * 2
+    assert deleted == [
+        "http://localhost/_fabric/_system/_api/streams/{}/subscriptions/{}"
+        "?global=false".format(name, topics[name].rsplit("/", 1)[-1])
+        for name in ["students", "teachers"]
+    ]
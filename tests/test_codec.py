@@ -0,0 +1,63 @@
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+
+from c8 import codec
+from c8.codec import JSONCodec, OrjsonCodec, get_codec, set_default_codec
+from c8.request import Request
+from c8.response import Response
+
+
+@pytest.fixture
+def default_codec():
+    previous = codec.get_default_codec()
+    yield
+    set_default_codec(previous)
+
+
+def test_get_codec():
+    assert isinstance(get_codec("json"), JSONCodec)
+    assert not isinstance(get_codec("json"), OrjsonCodec)
+    custom = JSONCodec()
+    assert get_codec(custom) is custom
+    with pytest.raises(ValueError):
+        get_codec("invalid")
+
+
+def test_orjson_codec(default_codec):
+    pytest.importorskip("orjson")
+    assert isinstance(get_codec("auto"), OrjsonCodec)
+
+    orjson_codec = set_default_codec("orjson")
+    assert codec.get_default_codec() is orjson_codec
+    assert orjson_codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+    assert orjson_codec.dumps({1: "a"}) == '{"1":"a"}'
+    # Integers orjson cannot represent fall back to the standard library.
+    assert orjson_codec.dumps(2**70) == str(2**70)
+    assert orjson_codec.loads(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(TypeError):
+        orjson_codec.loads({"a": 1})
+
+    request = Request(method="post", endpoint="/test", data={"baz": "qux"})
+    assert request.data == '{"baz":"qux"}'
+
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_code=200,
+        status_text="OK",
+        raw_body=b'{"errorNum": 1, "errorMessage": "qux"}',
+    )
+    assert response.body == {"errorNum": 1, "errorMessage": "qux"}
+    assert response.error_code == 1
+
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_code=200,
+        status_text="OK",
+        raw_body="invalid",
+    )
+    assert response.body == "invalid"
@@ -0,0 +1,63 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import threading
+from concurrent.futures import Future, wait
+
+import pytest
+
+from c8.cache import DocumentCache
+from c8.exceptions import (
+    CollectionFindError,
+    ConcurrentStateError,
+    DocumentInsertError,
+)
+from c8.fabric import ConcurrentFabric, StandardFabric
+from c8.redis.core import RedisServerError
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+def test_concurrent_fabric():
+    threads = set()
+    barrier = threading.Barrier(4)
+
+    def handler(method, url, params, data):
+        if url.endswith("/collection"):
+            info = {"id": "1", "name": "students", "isSystem": False}
+            info.update(type=2, status=3, collectionModel="DOC")
+            return {"result": [info]}
+        threads.add(threading.current_thread().name)
+        if url.endswith("/redis/cache"):
+            return 400, {"error": True, "errorNum": 400, "errorMessage": "bad"}
+        body = json.loads(data)
+        if body["_key"] == "bad":
+            return 409, {"error": True, "errorNum": 1210, "errorMessage": "dup"}
+        # All requests must be in flight at the same time to pass the barrier.
+        barrier.wait(timeout=5)
+        return {"_id": "students/" + body["_key"]}
+
+    fabric = StandardFabric(get_offline_connection(FakeHTTPClient(handler)))
+    with fabric.begin_concurrent_execution(max_workers=4) as cc_fabric:
+        assert isinstance(cc_fabric, ConcurrentFabric)
+        assert cc_fabric.context == "concurrent"
+        assert "ConcurrentFabric" in repr(cc_fabric)
+
+        assert cc_fabric.has_collection("students") is True
+        col = cc_fabric.collection("students", cache=DocumentCache())
+        with pytest.raises(CollectionFindError):
+            cc_fabric.collection("teachers")
+        futures = [col.insert({"_key": str(i)}) for i in range(4)]
+        assert all(isinstance(future, Future) for future in futures)
+        wait(futures, timeout=5)
+        assert [f.result()["_id"] for f in futures] == [
+            "students/{}".format(i) for i in range(4)
+        ]
+        assert len(threads) == 4
+
+        with pytest.raises(DocumentInsertError):
+            col.insert({"_key": "bad"}).result()
+        with pytest.raises(RedisServerError):
+            cc_fabric.redis.get("key", "cache").result()
+
+    with pytest.raises(ConcurrentStateError):
+        col.insert({"_key": "5"})
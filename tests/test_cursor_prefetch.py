@@ -0,0 +1,161 @@
+from __future__ import absolute_import, unicode_literals
+
+import gc
+import json
+import threading
+import time
+
+import pytest
+
+from c8.c8ql import C8QL
+from c8.collection import StandardCollection
+from c8.cursor import Cursor
+from c8.exceptions import C8QLGetAllBatchesError, CursorNextError
+from c8.executor import DefaultExecutor
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+def get_c8ql(batches, fail_at=None):
+    """Return a C8QL wrapper over a fake cursor with the given batch count."""
+    fetched = threading.Semaphore(0)
+    state = {"next": 1}
+
+    def handler(method, url, params, data):
+        if method == "post":
+            return {"id": "1", "hasMore": batches > 1, "result": [{"_rev": "_", "i": 0}]}
+        if method == "delete":
+            return {}
+        index = state["next"]
+        state["next"] += 1
+        fetched.release()
+        if index == fail_at:
+            return 404, {"error": True, "errorNum": 1600, "errorMessage": "gone"}
+        result = [{"_rev": "_", "i": index}]
+        return {"id": "1", "hasMore": index < batches - 1, "result": result}
+
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    return C8QL(conn, DefaultExecutor(conn)), http_client, fetched
+
+
+def test_cursor_prefetch():
+    c8ql, http_client, fetched = get_c8ql(batches=5)
+    cursor = c8ql.execute("FOR d IN c RETURN d", batch_size=1, prefetch=2)
+    assert isinstance(cursor, Cursor)
+
+    # The worker fetches ahead without the cursor being consumed, up to the
+    # queue bound (plus one batch waiting to be queued).
+    for _ in range(3):
+        assert fetched.acquire(timeout=5)
+    assert not fetched.acquire(timeout=0.3)
+    assert len(cursor.batch()) == 1
+
+    assert [doc["i"] for doc in cursor] == [0, 1, 2, 3, 4]
+    assert [method for method, _, _, _ in http_client.requests] == [
+        "post",
+        "put",
+        "put",
+        "put",
+        "put",
+    ]
+    assert cursor.close(ignore_missing=True) is True
+
+
+def test_cursor_prefetch_close_early():
+    c8ql, http_client, fetched = get_c8ql(batches=100)
+    with c8ql.execute("FOR d IN c RETURN d", prefetch=1) as cursor:
+        assert cursor.next()["i"] == 0
+        assert cursor.next()["i"] == 1
+    assert cursor._worker is None
+    assert http_client.requests[-1][0] == "delete"
+    # No batches are fetched once the cursor is closed.
+    sent = len(http_client.requests)
+    time.sleep(0.2)
+    assert len(http_client.requests) == sent
+
+
+def test_cursor_prefetch_error():
+    c8ql, http_client, _ = get_c8ql(batches=5, fail_at=2)
+    cursor = c8ql.execute("FOR d IN c RETURN d", prefetch=3)
+    assert cursor.next()["i"] == 0
+    assert cursor.next()["i"] == 1
+    with pytest.raises(CursorNextError):
+        cursor.next()
+    # Prefetching stops and later batches are fetched on demand.
+    assert cursor._worker is None
+    assert cursor.next()["i"] == 3
+
+
+def test_c8ql_iter_batches():
+    c8ql, http_client, _ = get_c8ql(batches=3)
+    # System fields are stripped.
+    batches = list(c8ql.iter_batches("FOR d IN c RETURN d"))
+    assert batches == [[{"i": 0}], [{"i": 1}], [{"i": 2}]]
+    assert http_client.requests[-1][0] == "put"
+
+    c8ql, http_client, _ = get_c8ql(batches=3)
+    assert c8ql.get_all_batches("FOR d IN c RETURN d") == [
+        {"i": 0},
+        {"i": 1},
+        {"i": 2},
+    ]
+
+
+def test_c8ql_iter_documents_close_early():
+    c8ql, http_client, _ = get_c8ql(batches=100)
+    docs = c8ql.iter_documents("FOR d IN c RETURN d", batch_size=1)
+    for doc in docs:
+        if doc["i"] == 1:
+            break
+    docs.close()
+    # Closing the generator closes the server cursor.
+    assert [method for method, _, _, _ in http_client.requests] == [
+        "post",
+        "put",
+        "delete",
+    ]
+
+    # Write queries are rejected on call, before iterating.
+    with pytest.raises(C8QLGetAllBatchesError):
+        c8ql.iter_documents("FOR d IN c REMOVE d IN c")
+    with pytest.raises(C8QLGetAllBatchesError):
+        c8ql.iter_batches("FOR d IN c REMOVE d IN c")
+
+
+def test_collection_all():
+    c8ql, http_client, _ = get_c8ql(batches=3)
+    col = StandardCollection(c8ql._conn, c8ql._executor, "students")
+
+    with col.all(batch_size=1, fields=["i"], prefetch=1) as cursor:
+        assert [doc["i"] for doc in cursor] == [0, 1, 2]
+    body = json.loads(http_client.requests[0][3])
+    assert body["bindVars"] == {"@collection": "students", "fields": ["i"]}
+    assert body["batchSize"] == 1
+    assert body["options"] == {"stream": True}
+    assert "KEEP(doc, @fields)" in body["query"]
+
+    # Iterating the collection closes the server cursor when left early.
+    c8ql, http_client, _ = get_c8ql(batches=100)
+    col = StandardCollection(c8ql._conn, c8ql._executor, "students")
+    for doc in col:
+        break
+    assert [method for method, _, _, _ in http_client.requests] == [
+        "post",
+        "delete",
+    ]
+
+
+def test_cursor_prefetch_dropped_cursor():
+    c8ql, http_client, fetched = get_c8ql(batches=10)
+    cursor = c8ql.execute("FOR d IN c RETURN d", batch_size=1, prefetch=1)
+    worker = cursor._worker
+    for _ in range(2):
+        assert fetched.acquire(timeout=5)
+
+    # Dropping an unread cursor stops the worker and deletes the server-side
+    # cursor.
+    del cursor
+    gc.collect()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert http_client.requests[-1][0] == "delete"
@@ -0,0 +1,86 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import threading
+
+import pytest
+
+from c8.collection import StandardCollection
+from c8.exceptions import DocumentGetError
+from c8.executor import DefaultExecutor
+from c8.export import ParallelExporter
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+KEYS = sorted("{:04d}".format(i) for i in range(250))
+
+
+def get_collection(fail_after=None):
+    threads = set()
+
+    def handler(method, url, params, data):
+        threads.add(threading.current_thread().name)
+        if url.endswith("/count"):
+            return {"count": len(KEYS)}
+        bind_vars = json.loads(data)["bindVars"]
+        if "skip" in bind_vars:
+            keys = [key for key in KEYS if key > bind_vars.get("after", "")]
+            return {"hasMore": False, "result": keys[bind_vars["skip"] :][:1]}
+        if fail_after is not None and bind_vars.get("after") == fail_after:
+            return 500, {"error": True, "errorNum": 500, "errorMessage": "boom"}
+        keys = [
+            key
+            for key in KEYS
+            if key > bind_vars.get("after", "")
+            and key <= bind_vars.get("upper", "￿")
+        ]
+        result = [{"_key": key, "_rev": "_"} for key in keys[: bind_vars["limit"]]]
+        return {"hasMore": False, "result": result}
+
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    col = StandardCollection(conn, DefaultExecutor(conn), "students")
+    return col, http_client, threads
+
+
+def test_export_parallel_ordered():
+    col, http_client, threads = get_collection()
+    exporter = ParallelExporter(col, max_workers=4, page_size=30)
+    assert exporter.boundaries() == ["0062", "0125", "0187"]
+
+    docs = col.export_parallel(max_workers=4, page_size=30, ordered=True)
+    assert [doc["_key"] for doc in docs] == KEYS
+    assert len(threads) > 1
+
+    # Pages seek past the last key of the previous page.
+    pages = [
+        json.loads(data)["bindVars"]
+        for _, url, _, data in http_client.requests
+        if url.endswith("/cursor") and "limit" in json.loads(data)["bindVars"]
+    ]
+    assert len(pages) == 4 * 3
+    assert len([page for page in pages if "after" not in page]) == 1
+
+
+def test_export_parallel_unordered():
+    col, http_client, _ = get_collection()
+    docs = col.export_parallel(
+        boundaries=["0100", "0010", "0200"], page_size=7, fields=["name"]
+    )
+    assert sorted(doc["_key"] for doc in docs) == KEYS
+    # No boundary lookups with explicit boundaries.
+    assert not any(url.endswith("/count") for _, url, _, _ in http_client.requests)
+    bind_vars = json.loads(http_client.requests[-1][3])["bindVars"]
+    assert bind_vars["fields"] == ["_key", "name"]
+
+
+def test_export_parallel_close_and_error():
+    col, http_client, _ = get_collection()
+    docs = col.export_parallel(max_workers=2, page_size=10, ordered=True)
+    assert next(docs)["_key"] == "0000"
+    docs.close()
+    # The workers stop once the generator is closed.
+    assert len(http_client.requests) < 20
+
+    col, _, _ = get_collection(fail_after="0009")
+    with pytest.raises(DocumentGetError):
+        list(col.export_parallel(max_workers=2, page_size=10))
@@ -0,0 +1,100 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.collection import EdgeCollection, StandardCollection, VertexCollection
+from c8.exceptions import DocumentGetError, DocumentParseError, DocumentRevisionError
+from c8.executor import BatchExecutor, DefaultExecutor
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+STORED = {"students/{}".format(i): str(i) for i in range(10)}
+
+
+def handler(method, url, params, data):
+    bind_vars = json.loads(data)["bindVars"]
+    docs = []
+    for handle in bind_vars["handles"]:
+        if handle not in STORED:
+            docs.append(None)
+            continue
+        doc = {"_id": handle, "_key": handle[9:], "_rev": STORED[handle], "a": 1}
+        if "fields" in bind_vars:
+            doc = {field: doc[field] for field in bind_vars["fields"] if field in doc}
+        docs.append(doc)
+    return {"hasMore": False, "result": docs}
+
+
+def get_collection(cls=StandardCollection, handler=handler):
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    args = (conn, DefaultExecutor(conn))
+    if cls is not StandardCollection:
+        args += ("school",)
+    return cls(*(args + ("students",))), http_client
+
+
+def test_get_many():
+    col, http_client = get_collection()
+    documents = ["1", "students/2", {"_key": "missing"}, {"_id": "students/3"}]
+    results = col.get_many(documents)
+    assert [doc and doc["_key"] for doc in results] == ["1", "2", None, "3"]
+    assert len(http_client.requests) == 1
+    assert json.loads(http_client.requests[0][3])["bindVars"]["handles"] == [
+        "students/1",
+        "students/2",
+        "students/missing",
+        "students/3",
+    ]
+
+    results = col.get_many(["4"], projection=["b"])
+    assert results == [{"_id": "students/4", "_key": "4", "_rev": "4"}]
+
+    with pytest.raises(DocumentParseError):
+        col.get_many(["teachers/1"])
+
+
+def test_get_many_revision_and_chunks():
+    col, http_client = get_collection(VertexCollection)
+    docs = [{"_key": "1", "_rev": "1"}, {"_key": "2", "_rev": "old"}]
+    results = col.get_many(docs)
+    assert results[0]["_key"] == "1"
+    assert isinstance(results[1], DocumentRevisionError)
+    assert results[1].http_code == 412
+    assert results[1].error_code == 1200
+    assert col.get_many(docs, check_rev=False)[1]["_key"] == "2"
+
+    col, http_client = get_collection(EdgeCollection)
+    results = col.get_many([str(i) for i in range(10)], batch_size=4)
+    assert [doc["_key"] for doc in results] == [str(i) for i in range(10)]
+    assert len(http_client.requests) == 3
+
+    col, _ = get_collection(handler=lambda *args: (500, {"error": True}))
+    with pytest.raises(DocumentGetError):
+        col.get_many(["1"])
+
+
+def test_get_many_reads_all_batches():
+    batches = []
+
+    def batch_handler(method, url, params, data):
+        if method == "put":
+            return {"id": "1", "hasMore": False, "result": batches.pop()}
+        docs = handler(method, url, params, data)["result"]
+        batches.append(docs[2:])
+        return {"id": "1", "hasMore": True, "result": docs[:2]}
+
+    col, http_client = get_collection(handler=batch_handler)
+    results = col.get_many([str(i) for i in range(5)])
+    assert [doc["_key"] for doc in results] == [str(i) for i in range(5)]
+    assert [req[0] for req in http_client.requests] == ["post", "put"]
+
+    col, _ = get_collection(handler=lambda *args: {"hasMore": False, "result": [None]})
+    with pytest.raises(DocumentGetError):
+        col.get_many(["1", "2"])
+
+    # Deferred responses cannot be read through a cursor.
+    col = StandardCollection(col._conn, BatchExecutor(col._conn, True), "students")
+    with pytest.raises(ValueError):
+        col.get_many(["1"])
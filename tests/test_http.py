@@ -0,0 +1,214 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from c8.cursor import Cursor
+from c8.http import DefaultHTTPClient, HTTPClient, RetryPolicy
+from c8.request import Request
+from c8.response import Response
+from tests.helpers import get_offline_connection
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def do_GET(self):
+        self.hits.append((self.command, self.path))
+        # "/unavailable/<n>" answers 503 until it has been hit n times.
+        if self.path.startswith("/unavailable/"):
+            failures = int(self.path.rsplit("/", 1)[1])
+            if self.hits.count((self.command, self.path)) <= failures:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return self.do_GET()
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            body += self.rfile.read(size + 2)[:size]
+            if size == 0:
+                break
+        self.hits.append((self.command, self.path))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    EchoHandler.hits = []
+    server = HTTPServer(("127.0.0.1", 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_pool_stats(server_url):
+    http_client = DefaultHTTPClient(pool_connections=2, pool_maxsize=4)
+    assert http_client.pool_stats() == []
+
+    for _ in range(3):
+        resp = http_client.send_request("get", server_url + "/test")
+        assert resp.status_code == 200
+        assert resp.body == {"path": "/test"}
+
+    stats = http_client.pool_stats()
+    assert len(stats) == 1
+    assert stats[0]["host"] == "127.0.0.1"
+    assert stats[0]["maxsize"] == 4
+    assert stats[0]["in_use"] == 0
+    assert stats[0]["idle"] == 1
+    assert stats[0]["connections"] == 1
+    assert stats[0]["requests"] == 3
+
+
+def test_http_client_evict_idle_connections(server_url):
+    http_client = DefaultHTTPClient()
+    assert http_client.evict_idle_connections() == 0
+
+    http_client.send_request("get", server_url)
+    assert len(http_client.pool_stats()) == 1
+    assert http_client.evict_idle_connections(idle_timeout=60) == 0
+    assert http_client.evict_idle_connections(idle_timeout=1e-9) == 1
+    assert http_client.pool_stats() == []
+
+
+def test_http_client_retry_status(server_url):
+    http_client = DefaultHTTPClient(retry_policy=RetryPolicy(max_retries=3))
+
+    resp = http_client.send_request("get", server_url + "/unavailable/2")
+    assert resp.status_code == 200
+    assert len(EchoHandler.hits) == 3
+
+    # Non-idempotent requests are not retried.
+    resp = http_client.send_request("post", server_url + "/unavailable/2")
+    assert resp.status_code == 503
+    assert len(EchoHandler.hits) == 4
+
+    # Requests consuming server-side state are not retried either.
+    resp = http_client.send_request(
+        "get", server_url + "/unavailable/1", idempotent=False
+    )
+    assert resp.status_code == 503
+    assert len(EchoHandler.hits) == 5
+
+    # The last response is returned once retries are exhausted.
+    resp = http_client.send_request("get", server_url + "/unavailable/9")
+    assert resp.status_code == 503
+    assert len(EchoHandler.hits) == 9
+
+
+def test_http_client_retry_budget(server_url):
+    policy = RetryPolicy(max_retries=5, budget_ratio=0.5, budget_cap=2)
+    http_client = DefaultHTTPClient(retry_policy=policy)
+
+    resp = http_client.send_request("get", server_url + "/unavailable/9")
+    assert resp.status_code == 503
+    assert len(EchoHandler.hits) == 3
+
+
+def test_http_client_connect_error():
+    policy = RetryPolicy(max_retries=2, backoff_factor=0)
+    http_client = DefaultHTTPClient(retry_policy=policy)
+    with pytest.raises(Exception) as err:
+        http_client.send_request("post", "http://127.0.0.1:1", timeout=(1, 1))
+    assert "Not able to connect" in str(err.value)
+
+
+def test_http_client_chunked_body(server_url):
+    http_client = DefaultHTTPClient()
+    chunks = (chunk for chunk in [b"[1,", b"2,", b"3]"])
+    resp = http_client.send_request("post", server_url + "/stream", data=chunks)
+    assert resp.status_code == 200
+    assert resp.body == [1, 2, 3]
+
+
+def test_retry_policy():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=4, budget_ratio=None)
+    assert policy.timeout == (10, 260)
+    assert policy.should_retry("get", 0, 503) is True
+    assert policy.should_retry("get", 0, 500) is False
+    assert policy.should_retry("get", 5, 503) is False
+    assert policy.should_retry("post", 0, 503) is False
+    assert policy.should_retry("post", 0, connect_error=True) is True
+    assert policy.should_retry("put", 0, 503, idempotent=False) is False
+    assert policy.should_retry("put", 0, connect_error=True, idempotent=False)
+    assert policy.should_retry("post", 0, 503, idempotent=True) is True
+
+    for attempt in range(6):
+        assert 0 <= policy.get_backoff(attempt) <= min(4, 2**attempt)
+    assert policy.get_backoff(0, "3") == 3
+    assert policy.get_backoff(0, "120") == 4
+    assert policy.get_backoff(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert 0 <= policy.get_backoff(0, "invalid") <= 1
+
+
+class RecordingHTTPClient(DefaultHTTPClient):
+    def __init__(self):
+        super(RecordingHTTPClient, self).__init__()
+        self.calls = []
+
+    def send_request(self, method, url, idempotent=None, **kwargs):
+        self.calls.append((method, idempotent))
+        body = {"id": "1", "hasMore": False, "result": [2]}
+        return Response(method, url, {}, 200, "OK", json.dumps(body))
+
+
+def test_cursor_fetch_is_not_idempotent():
+    http_client = RecordingHTTPClient()
+    conn = get_offline_connection(http_client)
+    cursor = Cursor(conn, {"id": "1", "hasMore": True, "result": [1]})
+    assert list(cursor) == [1, 2]
+    assert http_client.calls == [("put", False)]
+
+
+class LegacyHTTPClient(HTTPClient):
+    """Custom client with the former HTTPClient.send_request signature."""
+
+    def __init__(self):
+        self.calls = []
+
+    def send_request(
+        self, method, url, headers=None, params=None, data=None, auth=None
+    ):
+        self.calls.append(method)
+        body = {"id": "1", "hasMore": False, "result": [2]}
+        return Response(method, url, {}, 200, "OK", json.dumps(body))
+
+
+def test_custom_http_client_options():
+    http_client = LegacyHTTPClient()
+    conn = get_offline_connection(http_client)
+    request = Request(method="get", endpoint="/version", timeout=5)
+    assert conn.send_request(request).is_success
+    cursor = Cursor(conn, {"id": "1", "hasMore": True, "result": [1]})
+    assert list(cursor) == [1, 2]
+    assert http_client.calls == ["get", "put"]
+
+    # Clients accepting the options get them.
+    http_client = RecordingHTTPClient()
+    conn = get_offline_connection(http_client)
+    conn.send_request(Request(method="get", endpoint="/version", idempotent=True))
+    assert http_client.calls == [("get", True)]
@@ -0,0 +1,158 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.collection import StandardCollection
+from c8.exceptions import GetKeysError
+from c8.executor import BatchExecutor, DefaultExecutor
+from c8.keyvalue import KV
+from c8.utils import keyset_query
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+KEYS = ["{:03d}".format(i) for i in range(25)]
+
+
+def handler(method, url, params, data):
+    """Evaluate keyset queries over KEYS."""
+    if url.endswith("/export/students"):
+        return {"result": [{"_key": KEYS[params["offset"]]}]}
+    body = json.loads(data)
+    bind_vars = body["bindVars"]
+    if bind_vars["@collection"] == "missing":
+        return 404, {"error": True, "errorNum": 1203, "errorMessage": "missing"}
+    desc = "DESC" in body["query"]
+    keys = sorted(KEYS, reverse=desc)
+    if "after" in bind_vars:
+        after = bind_vars["after"]
+        keys = [key for key in keys if (key < after if desc else key > after)]
+    keys = keys[: bind_vars["limit"]]
+    if "RETURN doc._key" in body["query"]:
+        return {"hasMore": False, "result": keys}
+    return {
+        "hasMore": False,
+        "result": [{"_key": key, "value": int(key), "expireAt": 0} for key in keys],
+    }
+
+
+def get_connection():
+    http_client = FakeHTTPClient(handler)
+    return get_offline_connection(http_client), http_client
+
+
+def test_keyset_query():
+    body = keyset_query("students", after="b", upper="x", limit=10, fields=["a"])
+    assert body["query"] == (
+        "FOR doc IN @@collection FILTER doc._key > @after && doc._key <= @upper "
+        "SORT doc._key ASC LIMIT @limit RETURN KEEP(doc, @fields)"
+    )
+    assert body["bindVars"] == {
+        "@collection": "students",
+        "after": "b",
+        "upper": "x",
+        "limit": 10,
+        "fields": ["_key", "a"],
+    }
+    assert body["batchSize"] == 10
+
+    body = keyset_query("students", after="b", descending=True, keys_only=True)
+    assert "doc._key < @after" in body["query"]
+    assert body["query"].endswith("SORT doc._key DESC LIMIT @limit RETURN doc._key")
+
+
+def test_collection_keyset_export():
+    conn, http_client = get_connection()
+    col = StandardCollection(conn, DefaultExecutor(conn), "students")
+
+    # Offset paging still goes through the export API.
+    assert col.export(offset=3, limit=1) == [{"_key": "003"}]
+    page = col.export(limit=10, start_after="009")
+    assert [doc["_key"] for doc in page] == KEYS[10:20]
+    with pytest.raises(ValueError):
+        col.export(offset=1, start_after="009")
+
+    http_client.requests = []
+    assert [doc["_key"] for doc in col.iter_export(page_size=10)] == KEYS
+    assert len(http_client.requests) == 3
+    docs = col.iter_export(page_size=10, start_after="020", order="desc")
+    assert [doc["_key"] for doc in docs] == KEYS[19::-1]
+
+
+def test_kv_keyset_pagination():
+    conn, http_client = get_connection()
+    kv = KV(conn, DefaultExecutor(conn))
+
+    assert kv.get_keys("cache", limit=5, start_after="004") == KEYS[5:10]
+    keys = kv.get_keys("cache", limit=5, start_after="004", order="desc")
+    assert keys == KEYS[3::-1]
+    pairs = kv.get_key_value_pairs("cache", limit=2, start_after="022")
+    assert pairs == {
+        "result": [
+            {"_key": "023", "value": 23, "expireAt": 0},
+            {"_key": "024", "value": 24, "expireAt": 0},
+        ]
+    }
+
+    http_client.requests = []
+    assert list(kv.iter_keys("cache", page_size=5)) == KEYS
+    assert len(http_client.requests) == 6
+    pairs = list(kv.iter_key_value_pairs("cache", page_size=7, start_after="010"))
+    assert [pair["_key"] for pair in pairs] == KEYS[11:]
+
+    with pytest.raises(GetKeysError):
+        list(kv.iter_keys("missing"))
+
+
+def test_keyset_pages_larger_than_a_batch():
+    batches = []
+
+    def batch_handler(method, url, params, data):
+        # The server may return a page in several batches.
+        if method == "put":
+            result = batches.pop(0)
+            return {"id": "1", "hasMore": bool(batches), "result": result}
+        result = handler(method, url, params, data)["result"]
+        batches.extend(result[i : i + 3] for i in range(3, len(result), 3))
+        return {"id": "1", "hasMore": bool(batches), "result": result[:3]}
+
+    http_client = FakeHTTPClient(batch_handler)
+    conn = get_offline_connection(http_client)
+    col = StandardCollection(conn, DefaultExecutor(conn), "students")
+    kv = KV(conn, DefaultExecutor(conn))
+
+    assert [doc["_key"] for doc in col.iter_export(page_size=10)] == KEYS
+    assert list(kv.iter_keys("cache", page_size=10)) == KEYS
+    assert [req[0] for req in http_client.requests].count("put") == 14
+
+
+def test_keyset_pagination_context():
+    conn, http_client = get_connection()
+    kv = KV(conn, BatchExecutor(conn, return_result=True))
+    col = StandardCollection(conn, BatchExecutor(conn, return_result=True), "s")
+
+    # Deferred responses cannot be read through a cursor.
+    with pytest.raises(ValueError):
+        kv.get_keys("cache", start_after="004")
+    with pytest.raises(ValueError):
+        kv.get_key_value_pairs("cache", start_after="004")
+    with pytest.raises(ValueError):
+        col.export(start_after="004")
+    assert http_client.requests == []
+
+
+def test_kv_pairs_result_shape():
+    def values_handler(method, url, params, data):
+        if url.endswith("/kv/cache/values"):
+            return {"error": False, "code": 200, "result": [{"_key": "000"}]}
+        return handler(method, url, params, data)
+
+    http_client = FakeHTTPClient(values_handler)
+    conn = get_offline_connection(http_client)
+    kv = KV(conn, DefaultExecutor(conn))
+    # The response body is returned as is, while keyset pages only carry the
+    # "result" list.
+    pairs = kv.get_key_value_pairs("cache", limit=1)
+    assert pairs == {"error": False, "code": 200, "result": [{"_key": "000"}]}
+    pairs = kv.get_key_value_pairs("cache", limit=1, start_after="000")
+    assert pairs == {"result": [{"_key": "001", "value": 1, "expireAt": 0}]}
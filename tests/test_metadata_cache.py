@@ -0,0 +1,166 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.cache import MetadataCache
+from c8.exceptions import CollectionFindError
+from c8.executor import DefaultExecutor
+from c8.fabric import StandardFabric
+from c8.keyvalue import KV
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+def collection_info(name):
+    return {
+        "id": name,
+        "name": name,
+        "isSystem": False,
+        "type": 2,
+        "status": 3,
+        "collectionModel": "DOC",
+    }
+
+
+class FakeServer(object):
+    def __init__(self, collections=(), streams=(), kv=()):
+        self.collections = list(collections)
+        self.streams = list(streams)
+        self.kv = list(kv)
+
+    def __call__(self, method, url, params, data):
+        if url.endswith("/collection") and method == "get":
+            return {"result": [collection_info(name) for name in self.collections]}
+        if url.endswith("/collection") and method == "post":
+            name = json.loads(data)["name"]
+            self.collections.append(name)
+            return collection_info(name)
+        if "/collection/" in url and method == "delete":
+            self.collections.remove(url.rsplit("/", 1)[-1])
+            return {"error": False}
+        if "/streams" in url and method == "get":
+            return {
+                "result": [
+                    {
+                        "topic": name,
+                        "local": False,
+                        "db": "_system",
+                        "tenant": "t",
+                        "type": 4,
+                    }
+                    for name in self.streams
+                ]
+            }
+        if "/streams/" in url and method == "post":
+            self.streams.append("c8globals." + url.rsplit("/", 1)[-1].split("?")[0])
+            return {"result": "OK"}
+        if url.endswith("/kv") and method == "get":
+            return {"result": [{"name": name} for name in self.kv]}
+        if "/kv/" in url and method == "post":
+            name = url.rsplit("/", 1)[-1].split("?")[0]
+            self.kv.append(name)
+            return {"error": False, "name": name}
+        if "/kv/" in url and method == "delete":
+            name = url.rsplit("/", 1)[-1]
+            self.kv.remove(name)
+            return {"error": False, "name": name}
+        return 404, {"error": True}
+
+
+def get_fabric(server):
+    client = FakeHTTPClient(server)
+    conn = get_offline_connection(client, MetadataCache(ttl=None))
+    return StandardFabric(conn), client
+
+
+def list_calls(client, suffix):
+    return [r for r in client.requests if r[0] == "get" and suffix in r[1]]
+
+
+def test_metadata_cache_ttl():
+    calls = []
+
+    def load():
+        calls.append(1)
+        return ["a"]
+
+    cache = MetadataCache(ttl=None)
+    assert "a" in cache.names(("t", "f", "collections"), load)
+    assert "a" in cache.names(("t", "f", "collections"), load)
+    assert len(calls) == 1
+
+    cache.add(("t", "f", "collections"), "b")
+    cache.discard(("t", "f", "collections"), "a")
+    assert cache.names(("t", "f", "collections"), load) == {"b"}
+    cache.invalidate(("t", "f"))
+    assert cache.names(("t", "f", "collections"), load) == {"a"}
+    assert len(calls) == 2
+
+    cache = MetadataCache(ttl=0)
+    cache.names(("t", "f", "collections"), load)
+    cache.names(("t", "f", "collections"), load)
+    assert len(calls) == 4
+
+
+def test_metadata_cache_is_disabled_by_default():
+    server = FakeServer(collections=["users"])
+    client = FakeHTTPClient(server)
+    fabric = StandardFabric(get_offline_connection(client))
+    assert fabric.has_collection("users")
+    server.collections.append("orders")
+    assert fabric.collection("orders").name == "orders"
+    assert len(list_calls(client, "/collection")) == 2
+
+
+def test_fabric_collection_checks_are_cached():
+    server = FakeServer(collections=["users"])
+    fabric, client = get_fabric(server)
+
+    assert fabric.collection("users").name == "users"
+    assert fabric["users"].name == "users"
+    assert fabric.has_collection("users")
+    assert len(list_calls(client, "/collection")) == 1
+
+    with pytest.raises(CollectionFindError):
+        fabric.collection("orders")
+
+    # Creations and deletions through the client update the cached names.
+    assert fabric.create_collection("orders").name == "orders"
+    assert fabric.collection("orders").name == "orders"
+    assert fabric.delete_collection("users")
+    assert not fabric.has_collection("users")
+    assert len(list_calls(client, "/collection")) == 1
+
+    # Lazy wrappers skip the check entirely.
+    fabric._conn.metadata_cache.invalidate()
+    assert fabric.collection("missing", lazy=True).name == "missing"
+    assert client.requests[-1][0] == "delete"
+
+
+def test_fabric_stream_checks_are_cached():
+    server = FakeServer(streams=["c8globals.events"])
+    fabric, client = get_fabric(server)
+
+    assert fabric.has_stream("events")
+    assert not fabric.has_stream("orders")
+    assert len(list_calls(client, "/streams")) == 1
+
+    fabric.create_stream("orders")
+    assert fabric.has_stream("orders")
+    assert len(list_calls(client, "/streams")) == 2
+
+
+def test_kv_collection_checks_are_cached():
+    server = FakeServer(kv=["sessions"])
+    conn = get_offline_connection(FakeHTTPClient(server), MetadataCache(ttl=None))
+    kv = KV(conn, DefaultExecutor(conn))
+
+    assert kv.has_collection("sessions")
+    assert not kv.has_collection("carts")
+    assert kv.create_collection("carts")
+    assert kv.has_collection("carts")
+    assert kv.delete_collection("sessions")
+    assert not kv.has_collection("sessions")
+    requests = conn.http_client.requests
+    assert len([r for r in requests if r[0] == "get"]) == 1
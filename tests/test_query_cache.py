@@ -0,0 +1,101 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.c8ql import C8QL
+from c8.cache import QueryCache
+from c8.executor import AsyncExecutor, DefaultExecutor
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+def handler(method, url, params, data):
+    if method == "put":
+        return {"id": "1", "hasMore": False, "result": [{"n": 3}]}
+    body = json.loads(data)
+    if "INSERT" in body["query"]:
+        return {"hasMore": False, "result": []}
+    # Results come in two batches to check that cursors are drained.
+    return {"id": "1", "hasMore": True, "result": [{"n": 1}, {"n": 2}]}
+
+
+def get_c8ql():
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    return C8QL(conn, DefaultExecutor(conn)), http_client
+
+
+def test_query_cache_bounds():
+    cache = QueryCache(max_entries=2, max_bytes=30, ttl=None)
+    cache.put(("a",), [1, 2])
+    cache.put(("b",), [3])
+    assert cache.get(("a",)) == [1, 2]
+    cache.put(("c",), [4])
+    # The least recently used result is evicted.
+    assert cache.get(("b",)) is None
+    assert len(cache) == 2
+
+    cache.put(("d",), ["x" * 40])
+    assert cache.get(("d",)) is None
+
+    cache.configure(max_entries=1)
+    assert len(cache) == 1
+
+    cache = QueryCache(ttl=0)
+    cache.put(("a",), [1])
+    assert cache.get(("a",)) is None
+
+
+def test_query_cache_execute():
+    c8ql, http_client = get_c8ql()
+    query = "FOR doc IN users FILTER doc.age > @age RETURN doc"
+
+    result = c8ql.cache.execute(query, bind_vars={"age": 3})
+    assert result == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert len(http_client.requests) == 2
+
+    # Whitespace outside of strings does not matter, bind vars do.
+    result[0]["n"] = 0
+    again = "FOR doc  IN users\n  FILTER doc.age > @age\n RETURN doc"
+    assert c8ql.cache.execute(again, bind_vars={"age": 3})[0] == {"n": 1}
+    assert len(http_client.requests) == 2
+    c8ql.cache.execute(query, bind_vars={"age": 4})
+    assert len(http_client.requests) == 4
+
+    props = c8ql.cache.properties()
+    assert props["entries"] == 2
+    assert props["hits"] == 1
+
+    c8ql.cache.invalidate_collection("orders")
+    assert c8ql.cache.properties()["entries"] == 2
+    c8ql.cache.invalidate_collection("users")
+    assert c8ql.cache.properties()["entries"] == 0
+
+    c8ql.cache.execute("FOR doc IN @@col RETURN doc", bind_vars={"@col": "users"})
+    c8ql.cache.invalidate_collection("users")
+    assert c8ql.cache.properties()["entries"] == 0
+
+
+def test_query_cache_bypasses_writes():
+    c8ql, http_client = get_c8ql()
+    query = "INSERT {n: 1} INTO users"
+    assert c8ql.cache.execute(query) == []
+    assert c8ql.cache.execute(query) == []
+    assert len(http_client.requests) == 2
+    assert c8ql.cache.properties()["entries"] == 0
+
+
+def test_query_cache_requires_default_context():
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    c8ql = C8QL(conn, AsyncExecutor(conn, return_result=True))
+    with pytest.raises(ValueError):
+        c8ql.cache.execute("FOR doc IN users RETURN doc")
+
+
+def test_query_cache_on_change():
+    c8ql, _ = get_c8ql()
+    c8ql.cache.execute("FOR doc IN users RETURN doc")
+    c8ql.cache.on_change("users", "users/1", None)
+    assert c8ql.cache.properties()["entries"] == 0
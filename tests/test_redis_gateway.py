@@ -0,0 +1,208 @@
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from c8.connection import Connection
+from c8.http import DefaultHTTPClient
+from c8.redis.gateway import RedisGateway, RESPParser, SimpleString, encode_reply
+from c8.redis.redis_commands import RedisCommands
+
+
+class RedisHandler(BaseHTTPRequestHandler):
+    """Fake Redis API answering single commands and batches of commands."""
+
+    protocol_version = "HTTP/1.1"
+
+    def run(self, collection, command):
+        name, args = command[0], command[1:]
+        with self.lock:
+            store = self.store.setdefault(collection, {})
+            if name == "SET":
+                store[args[0]] = args[1]
+                return 200, {"code": 200, "result": "OK"}
+            if name == "GET":
+                return 200, {"code": 200, "result": store.get(args[0])}
+            if name == "INCR":
+                store[args[0]] = int(store.get(args[0], 0)) + 1
+                return 200, {"code": 200, "result": store[args[0]]}
+            if name == "PING":
+                return 200, {"code": 200, "result": "PONG"}
+        return 400, {"error": True, "errorNum": 400, "errorMessage": "not supported"}
+
+    def read_body(self):
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return self.rfile.read(int(self.headers["Content-Length"]))
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            body += self.rfile.read(size + 2)[:size]
+            if size == 0:
+                return body
+
+    def run_batch(self, body):
+        boundary = body.split("\r\n", 1)[0][2:]
+        out = []
+        for part in body.split("--" + boundary)[1:-1]:
+            head, _, request = part.partition("\r\n\r\n")
+            content_id = head.split("Content-Id: ")[1].strip()
+            path = request.split(" ")[1]
+            payload = request.partition("\r\n\r\n")[2].rstrip("\r\n")
+            status, result = self.run(path.rsplit("/", 1)[-1], json.loads(payload))
+            out.append(
+                "--{}\r\nContent-Id: {}\r\n\r\nHTTP/1.1 {} X\r\n\r\n{}\r\n".format(
+                    boundary, content_id, status, json.dumps(result)
+                )
+            )
+        out.append("--{}--".format(boundary))
+        return 200, "".join(out)
+
+    def do_POST(self):
+        body = self.read_body().decode("utf-8")
+        self.hits.append(self.path.rsplit("/", 2)[-2:])
+        if self.path.endswith("/batch"):
+            status, out = self.run_batch(body)
+        else:
+            status, result = self.run(self.path.rsplit("/", 1)[-1], json.loads(body))
+            out = json.dumps(result)
+        out = out.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def redis():
+    RedisHandler.hits = []
+    RedisHandler.store = {}
+    RedisHandler.lock = threading.Lock()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RedisHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    conn = Connection(
+        url="http://127.0.0.1:{}".format(server.server_port),
+        email="",
+        password="",
+        token="token",
+        apikey=None,
+        http_client=DefaultHTTPClient(pool_maxsize=8),
+        skip_tenant=True,
+    )
+    yield RedisCommands(conn)
+    server.shutdown()
+    server.server_close()
+
+
+def command(*args):
+    out = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        arg = arg.encode("utf-8")
+        out.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(out)
+
+
+async def send(port, data, replies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+    out = b""
+    while out.count(b"\r\n") < replies:
+        chunk = await asyncio.wait_for(reader.read(1 << 16), 5)
+        if not chunk:
+            break
+        out += chunk
+    writer.close()
+    return out
+
+
+def run_gateway(redis, client):
+    async def main():
+        gateway = RedisGateway(redis, "cache", max_workers=8)
+        await gateway.start(port=0)
+        port = gateway.sockets[0].getsockname()[1]
+        try:
+            return await client(port)
+        finally:
+            gateway.close()
+
+    return asyncio.run(main())
+
+
+def test_resp_parser():
+    parser = RESPParser()
+    data = command("SET", "key", "a\r\nb") + b"PING\r\n" + command("GET", "key")
+    commands = []
+    for i in range(len(data)):
+        commands += parser.feed(data[i : i + 1])
+    assert commands == [["SET", "key", "a\r\nb"], ["PING"], ["GET", "key"]]
+
+    with pytest.raises(ValueError):
+        RESPParser().feed(b"*1\r\n:1\r\n")
+    with pytest.raises(ValueError):
+        RESPParser(max_bulk_size=2).feed(b"*1\r\n$3\r\n")
+
+
+def test_encode_reply():
+    assert encode_reply(SimpleString("OK")) == b"+OK\r\n"
+    assert encode_reply("OK") == b"$2\r\nOK\r\n"
+    assert encode_reply("value") == b"$5\r\nvalue\r\n"
+    assert encode_reply(None) == b"$-1\r\n"
+    assert encode_reply(3) == b":3\r\n"
+    assert encode_reply({"a": 1}) == b"*2\r\n$1\r\na\r\n:1\r\n"
+    assert encode_reply(ValueError("bad\r\nvalue")) == b"-ERR bad value\r\n"
+
+
+def test_gateway_pipelines_commands(redis):
+    data = (
+        command("SET", "a", "1")
+        + command("GET", "a")
+        + command("INCR", "n")
+        + command("NOPE")
+        + command("LPOP", "a")
+        + b"PING\r\n"
+        + command("SELECT", "other")
+        + command("GET", "a")
+        + command("SET", "b", "OK")
+        + command("GET", "b")
+    )
+    out = run_gateway(redis, lambda port: send(port, data, 12))
+    assert out == (
+        b"+OK\r\n$1\r\n1\r\n:1\r\n-ERR unknown command 'NOPE'\r\n"
+        b"-ERR not supported\r\n+PONG\r\n+OK\r\n$-1\r\n+OK\r\n$2\r\nOK\r\n"
+    )
+    # Consecutive commands are sent upstream together.
+    assert RedisHandler.hits == [
+        ["_api", "batch"],
+        ["_api", "batch"],
+        ["_api", "batch"],
+    ]
+
+
+def test_gateway_serves_clients_concurrently(redis):
+    async def clients(port):
+        return await asyncio.gather(
+            *[
+                send(port, command("SET", str(i), str(i)) + command("GET", str(i)), 3)
+                for i in range(20)
+            ]
+        )
+
+    out = run_gateway(redis, clients)
+    assert out == [
+        "+OK\r\n${}\r\n{}\r\n".format(len(str(i)), i).encode("utf-8")
+        for i in range(20)
+    ]
+    assert len(RedisHandler.store["cache"]) == 20
+
+
+def test_gateway_protocol_error(redis):
+    out = run_gateway(redis, lambda port: send(port, b"*x\r\n", 1))
+    assert out.startswith(b"-ERR Protocol error")
@@ -0,0 +1,109 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.exceptions import BatchStateError
+from c8.redis.core import RedisServerError
+from c8.redis.redis_commands import RedisCommands, RedisPipeline
+from c8.response import Response
+from tests.helpers import get_offline_connection
+
+
+class RedisBatchServer(object):
+    """HTTP client answering batch requests of Redis commands. SET stores a
+    value, GET returns it, and unknown commands fail."""
+
+    def __init__(self):
+        self.store = {}
+        self.requests = []
+
+    def run(self, command):
+        name, args = command[0], command[1:]
+        if name == "SET":
+            self.store[args[0]] = args[1]
+            return 200, {"code": 200, "result": "OK"}
+        if name == "GET":
+            return 200, {"code": 200, "result": self.store.get(args[0])}
+        return 400, {"error": True, "errorNum": 400, "errorMessage": "unknown"}
+
+    def send_request(self, method, url, params=None, data=None, headers=None):
+        body = b"".join(data).decode("utf-8")
+        self.requests.append(url)
+        boundary = body.split("\r\n", 1)[0][2:]
+        out = []
+        for part in body.split("--" + boundary)[1:-1]:
+            head, _, request = part.partition("\r\n\r\n")
+            content_id = head.split("Content-Id: ")[1].strip()
+            assert request.startswith("post /redis/cache HTTP/1.1")
+            payload = request.partition("\r\n\r\n")[2].rstrip("\r\n")
+            status, result = self.run(json.loads(payload))
+            out.append(
+                "--{}\r\nContent-Id: {}\r\n\r\nHTTP/1.1 {} X\r\n\r\n{}\r\n".format(
+                    boundary, content_id, status, json.dumps(result)
+                )
+            )
+        out.append("--{}--".format(boundary))
+        return Response(method, url, {}, 200, "", "".join(out))
+
+
+def get_redis():
+    server = RedisBatchServer()
+    return RedisCommands(get_offline_connection(server)), server
+
+
+def test_pipeline_execute():
+    redis, server = get_redis()
+    pipe = redis.pipeline(max_batch_size=2)
+    assert isinstance(pipe, RedisPipeline)
+    pipe.set("a", "1", "cache")
+    pipe.set("b", "2", "cache")
+    pipe.get("a", "cache")
+    assert len(pipe) == 3
+    assert server.requests == []
+
+    assert pipe.execute() == [
+        {"code": 200, "result": "OK"},
+        {"code": 200, "result": "OK"},
+        {"code": 200, "result": "1"},
+    ]
+    assert len(server.requests) == 2
+    assert server.requests[0].endswith("/batch")
+
+    # The pipeline is reusable.
+    assert len(pipe) == 0
+    assert pipe.execute() == []
+    pipe.get("b", "cache")
+    assert pipe.execute() == [{"code": 200, "result": "2"}]
+
+
+def test_pipeline_errors():
+    redis, server = get_redis()
+    pipe = redis.pipeline()
+    pipe.set("a", "1", "cache")
+    pipe.ping("cache")
+    pipe.get("a", "cache")
+    with pytest.raises(RedisServerError):
+        pipe.execute()
+
+    pipe.ping("cache")
+    pipe.get("a", "cache")
+    results = pipe.execute(raise_on_error=False)
+    assert isinstance(results[0], RedisServerError)
+    assert results[1] == {"code": 200, "result": "1"}
+
+    pipe.reset()
+    assert len(pipe) == 0
+
+    with pytest.raises(BatchStateError):
+        pipe._executor.execute(None, None, custom_prefix="/_api")
+
+
+def test_pipeline_single_request():
+    redis, server = get_redis()
+    with redis.pipeline(single_request=True, max_batch_size=1) as pipe:
+        jobs = [pipe.set(str(i), str(i), "cache") for i in range(5)]
+    assert len(server.requests) == 1
+    assert [job.result()["result"] for job in jobs] == ["OK"] * 5
+    assert server.store == {str(i): str(i) for i in range(5)}
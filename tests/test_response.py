@@ -62,3 +62,62 @@ def test_response():
     assert response.raw_body == "invalid"
     assert response.error_code is None
     assert response.error_message is None
+
+
+def test_response_lazy_body():
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body=b'{"result": [1, 2, 3]}',
+    )
+    # Status checks do not deserialize a body without errors.
+    assert response.is_success is True
+    assert response.error_code is None
+    assert response._body is Response._UNPARSED
+
+    assert response.body == {"result": [1, 2, 3]}
+    assert response.raw_body == '{"result": [1, 2, 3]}'
+    assert response.raw_content == b'{"result": [1, 2, 3]}'
+
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="Not Found",
+        status_code=404,
+        raw_body=b'{"error": true, "errorNum": 1203, "errorMessage": "qux"}',
+        keep_raw_body=False,
+    )
+    assert response.is_success is False
+    assert response.error_code == 1203
+    assert response.error_message == "qux"
+    assert response.raw_body is None
+
+    # Invalid bodies are kept even if keep_raw_body is False.
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body=b"invalid",
+        keep_raw_body=False,
+    )
+    assert response.body == "invalid"
+    assert response.raw_body == "invalid"
+
+    # Already deserialized bodies are passed through.
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body={"errorNum": 2, "errorMessage": "quux"},
+    )
+    assert response.body == {"errorNum": 2, "errorMessage": "quux"}
+    assert response.error_code == 2
+    assert response.is_success is False
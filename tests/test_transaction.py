@@ -0,0 +1,128 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+
+import pytest
+
+from c8.cursor import Cursor
+from c8.exceptions import (
+    CollectionFindError,
+    TransactionExecuteError,
+    TransactionJobResultError,
+    TransactionStateError,
+)
+from c8.fabric import StandardFabric
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+COLLECTIONS = {
+    "result": [
+        {
+            "id": "1",
+            "name": "students",
+            "isSystem": False,
+            "type": 2,
+            "status": 3,
+            "collectionModel": "DOC",
+        }
+    ]
+}
+
+
+def transaction_handler(bodies, results):
+    """Answer transaction requests with the given results, keyed in the order
+    the jobs were queued."""
+
+    def handler(method, url, params, data):
+        if method == "get":
+            return COLLECTIONS
+        body = json.loads(data)
+        bodies.append(body)
+        job_ids = [
+            line.split('"')[1]
+            for line in body["action"].split(";")
+            if line.startswith("result[")
+        ]
+        return {"result": dict(zip(job_ids, results))}
+
+    return handler
+
+
+def get_fabric(handler):
+    http_client = FakeHTTPClient(handler)
+    return StandardFabric(get_offline_connection(http_client)), http_client
+
+
+def test_transaction_commit():
+    bodies = []
+    results = [{"_id": "students/Abby"}, 3, [{"n": 1}, {"n": 2}]]
+    fabric, http_client = get_fabric(transaction_handler(bodies, results))
+
+    with fabric.begin_transaction(timeout=10, read=["teachers"]) as txn_fabric:
+        assert txn_fabric.context == "transaction"
+        students = txn_fabric.collection("students")
+        job1 = students.insert({"_key": "Abby"})
+        job2 = students.count()
+        job3 = txn_fabric.c8ql.execute("FOR doc IN students RETURN doc")
+        assert job1.status() == "pending"
+        with pytest.raises(TransactionJobResultError):
+            job1.result()
+        # Only the existence of the collection was checked.
+        assert [r[0] for r in http_client.requests] == ["get"]
+
+    assert len(http_client.requests) == 2
+    assert http_client.requests[1][1].endswith("/transaction")
+    body = bodies[0]
+    assert body["collections"] == {
+        "read": ["students", "teachers"],
+        "write": ["students"],
+        "allowImplicit": True,
+    }
+    assert body["lockTimeout"] == 10
+    assert "db.students.insert(" in body["action"]
+    assert "db._query(" in body["action"]
+
+    assert txn_fabric.queued_jobs() == [job1, job2, job3]
+    assert job1.result() == {"_id": "students/Abby"}
+    assert job2.result() == 3
+    cursor = job3.result()
+    assert isinstance(cursor, Cursor)
+    assert list(cursor) == [{"n": 1}, {"n": 2}]
+
+    with pytest.raises(TransactionStateError):
+        txn_fabric.commit()
+    with pytest.raises(TransactionStateError):
+        txn_fabric.collection("students").count()
+
+
+def test_transaction_without_results():
+    bodies = []
+    fabric, _ = get_fabric(transaction_handler(bodies, [None]))
+    txn_fabric = fabric.begin_transaction(return_result=False, sync=True)
+    assert txn_fabric.collection("students").truncate() is None
+    assert txn_fabric.queued_jobs() is None
+    assert txn_fabric.commit() is None
+    assert bodies[0]["waitForSync"] is True
+
+
+def test_transaction_errors():
+    def handler(method, url, params, data):
+        if method == "get":
+            return COLLECTIONS
+        return 409, {"error": True, "errorNum": 1210, "errorMessage": "conflict"}
+
+    fabric, _ = get_fabric(handler)
+    txn_fabric = fabric.begin_transaction()
+    job = txn_fabric.collection("students").insert({"_key": "Jake"})
+    with pytest.raises(TransactionExecuteError) as err:
+        txn_fabric.commit()
+    assert err.value.error_code == 1210
+    assert job.status() == "pending"
+
+    with pytest.raises(CollectionFindError):
+        txn_fabric.collection("teachers")
+    assert txn_fabric.has_collection("students") is True
+
+    # Requests without a server-side command cannot be queued.
+    with pytest.raises(TransactionStateError):
+        fabric.begin_transaction().c8ql.kill("1")
@@ -0,0 +1,177 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from c8.collection import StandardCollection
+from c8.exceptions import (
+    DocumentInsertError,
+    DocumentRevisionError,
+    WriteBehindStateError,
+)
+from c8.executor import WriteBehindExecutor
+from c8.fabric import StandardFabric, WriteBehindFabric
+from c8.keyvalue import KV
+from tests.helpers import FakeHTTPClient, get_offline_connection
+
+
+def handler(method, url, params, data):
+    if method == "get":
+        return {"_key": "1"}
+    body = json.loads(data)
+    if url.endswith("/kv/cache/value"):
+        return [{"_key": pair["_key"]} for pair in body]
+    if isinstance(body, dict):
+        return {"_id": "students/" + body["_key"], "_oldRev": "0"}
+    results = []
+    for doc in body:
+        if doc["_key"] == "conflict":
+            results.append({"error": True, "errorNum": 1210, "errorMessage": "dup"})
+        elif doc["_key"] == "rev":
+            results.append({"error": True, "errorNum": 1200, "errorMessage": "rev"})
+        else:
+            results.append({"_id": "students/" + doc["_key"], "_oldRev": "0"})
+    return results
+
+
+def get_executor(**kwargs):
+    http_client = FakeHTTPClient(handler)
+    conn = get_offline_connection(http_client)
+    return WriteBehindExecutor(conn, **kwargs), conn, http_client
+
+
+def test_write_behind_coalesces_writes():
+    executor, conn, http_client = get_executor(linger=60, max_batch_size=100)
+    col = StandardCollection(conn, executor, "students")
+    assert col.context == "write_behind"
+
+    futures = [col.insert({"_key": str(i)}) for i in range(3)]
+    futures.append(col.insert({"_key": "conflict"}))
+    assert all(isinstance(future, Future) for future in futures)
+    assert not any(future.done() for future in futures)
+
+    executor.flush()
+    assert len(http_client.requests) == 1
+    method, url, _, data = http_client.requests[0]
+    assert method == "post"
+    assert url.endswith("/_api/document/students")
+    assert len(json.loads(data)) == 4
+    assert [f.result()["_id"] for f in futures[:3]] == [
+        "students/0",
+        "students/1",
+        "students/2",
+    ]
+    with pytest.raises(DocumentInsertError):
+        futures[3].result()
+
+    # Updates carry their key from the endpoint into the bulk request.
+    updates = [col.update({"_id": "students/1"}), col.update({"_key": "rev"})]
+    executor.flush()
+    method, _, _, data = http_client.requests[-1]
+    assert method == "patch"
+    assert json.loads(data) == [{"_id": "students/1", "_key": "1"}, {"_key": "rev"}]
+    assert updates[0].result() == {"_id": "students/1", "_old_rev": "0"}
+    with pytest.raises(DocumentRevisionError):
+        updates[1].result()
+
+    # Key-value inserts are split back by caller.
+    kv = KV(conn, executor)
+    first = kv.insert_key_value_pair("cache", [{"_key": "a"}, {"_key": "b"}])
+    second = kv.insert_key_value_pair("cache", [{"_key": "c"}])
+    executor.flush()
+    assert first.result() == [{"_key": "a"}, {"_key": "b"}]
+    assert second.result() == [{"_key": "c"}]
+
+
+def test_write_behind_flush_on_size_and_linger():
+    executor, conn, http_client = get_executor(linger=60, max_batch_size=2)
+    col = StandardCollection(conn, executor, "students")
+    futures = [col.insert({"_key": str(i)}) for i in range(2)]
+    assert futures[1].result(timeout=5)["_id"] == "students/1"
+    assert len(http_client.requests) == 1
+    executor.close()
+
+    executor, conn, http_client = get_executor(linger=0.01)
+    col = StandardCollection(conn, executor, "students")
+    assert col.insert({"_key": "1"}).result(timeout=5)["_id"] == "students/1"
+    executor.close()
+
+
+def test_write_behind_sequential_writes_linger():
+    executor, conn, http_client = get_executor(linger=0.05)
+    col = StandardCollection(conn, executor, "students")
+    # Each write opens a new buffer, which is sent after the linger time
+    # without waiting for a flush.
+    for key in ["1", "2"]:
+        start = time.monotonic()
+        assert col.insert({"_key": key}).result(timeout=1)["_id"] == "students/" + key
+        assert time.monotonic() - start < 0.5
+    assert len(http_client.requests) == 2
+    executor.close()
+
+
+def test_write_behind_keeps_write_order():
+    executor, conn, http_client = get_executor(linger=60)
+    col = StandardCollection(conn, executor, "students")
+    futures = [
+        col.update({"_key": "a"}),
+        col.insert({"_key": "b"}),
+        col.update({"_key": "b"}),
+        col.update({"_key": "c"}),
+    ]
+    executor.flush()
+    assert [(r[0], json.loads(r[3])) for r in http_client.requests] == [
+        ("patch", {"_key": "a"}),
+        ("post", {"_key": "b"}),
+        ("patch", [{"_key": "b"}, {"_key": "c"}]),
+    ]
+    assert all(future.result() for future in futures)
+
+
+def test_write_behind_does_not_merge_insert_many():
+    executor, conn, http_client = get_executor(linger=60)
+    col = StandardCollection(conn, executor, "students")
+    first = col.insert_many([{"_key": "1"}, {"_key": "2"}])
+    second = col.insert_many([{"_key": "3"}])
+    assert len(first) == 2
+    assert len(second) == 1
+    assert [len(json.loads(r[3])) for r in http_client.requests] == [2, 1]
+
+
+def test_write_behind_reads_flush_writes():
+    executor, conn, http_client = get_executor(linger=60)
+    col = StandardCollection(conn, executor, "students")
+    future = col.insert({"_key": "1"})
+    assert col.get("1") == {"_key": "1"}
+    assert future.done()
+    assert [method for method, _, _, _ in http_client.requests] == ["post", "get"]
+
+
+def test_write_behind_fabric_close():
+    http_client = FakeHTTPClient(handler)
+    fabric = StandardFabric(get_offline_connection(http_client))
+    wb_fabric = fabric.begin_write_behind_execution(linger=60)
+    assert isinstance(wb_fabric, WriteBehindFabric)
+    assert "WriteBehindFabric" in repr(wb_fabric)
+
+    col = StandardCollection(wb_fabric._conn, wb_fabric._executor, "students")
+    with wb_fabric:
+        futures = [col.insert({"_key": str(i)}) for i in range(5)]
+        threads = [
+            threading.Thread(target=col.insert, args=({"_key": str(i)},))
+            for i in range(5, 10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert all(future.done() for future in futures)
+    assert len(http_client.requests) == 1
+    assert len(json.loads(http_client.requests[0][3])) == 10
+
+    with pytest.raises(WriteBehindStateError):
+        col.insert({"_key": "11"})